@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# gunicorn 설정 없이 직접 실행해도 ASGI 용 DB 연결 설정 적용 (config.settings)
+os.environ.setdefault("WEB_ASGI", "true")
 
 application = get_asgi_application()
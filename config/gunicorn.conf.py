@@ -0,0 +1,63 @@
+"""
+gunicorn 운영 설정 : python manage.py runprod (또는 gunicorn -c config/gunicorn.conf.py)
+    - 워커 / 스레드 수 등은 환경 변수로 조정
+    - WEB_ASGI=true : ASGI 앱 + uvicorn 워커 (async view 를 이벤트 루프에서 실행)
+        - sync view 는 워커당 스레드 1개에서 순서대로 실행 (asgiref thread_sensitive)
+          -> sync 위주 트래픽은 기본(WSGI) 설정이 유리
+    - preload_app : 마스터에서 앱 로딩 + 워밍업 후 fork (워커 간 메모리 공유)
+    - max_requests : 요청 N건 처리한 워커는 graceful 재시작 (메모리 증가 제한)
+    - 마이그레이션은 별도 1회성 단계 (docker compose 의 migrate 서비스)
+"""
+
+import multiprocessing
+import os
+
+ASGI_APP = "config.asgi:application"
+ASGI_WORKER_CLASS = "uvicorn_worker.UvicornWorker"
+
+asgi = os.getenv("WEB_ASGI", "false").lower() == "true"
+
+wsgi_app = ASGI_APP if asgi else "config.wsgi:application"
+
+bind = os.getenv("WEB_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("WEB_THREADS", 1))
+if asgi:
+    worker_class = ASGI_WORKER_CLASS
+else:
+    worker_class = "gthread" if threads > 1 else "sync"
+
+preload_app = True
+
+max_requests = int(os.getenv("WEB_MAX_REQUESTS", 1000))
+# 워커들이 동시에 재시작되지 않도록 0 ~ jitter 만큼 분산
+max_requests_jitter = int(os.getenv("WEB_MAX_REQUESTS_JITTER", 100))
+
+timeout = int(os.getenv("WEB_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("WEB_KEEPALIVE", 5))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("WEB_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """마스터 앱 로딩 후, 워커 fork 및 트래픽 수신 전"""
+    from django.db import connections
+
+    from config.warmup import warm_up
+
+    result = warm_up()
+    server.log.info(
+        "warm-up 완료 : URL 패턴 %(urls)s개, serializer %(serializers)s개, "
+        "모델 %(models)s개",
+        result,
+    )
+
+    # 워밍업 중 열린 DB 연결 / 연결 풀을 워커가 공유하지 않도록 fork 전에 닫음
+    # (연결 풀은 워커마다 첫 요청 시 새로 생성)
+    connections.close_all()
+    for connection in connections.all():
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
@@ -25,9 +25,13 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.getenv("SECRET_KEY")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# 기본은 운영 설정 (DEBUG 끔), 개발 환경은 DEBUG=true 로 명시 (docker-compose.yml)
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 
-ALLOWED_HOSTS = []
+# 콤마 구분 호스트 (비어 있고 DEBUG 면 localhost / 127.0.0.1 만 허용)
+ALLOWED_HOSTS = [
+    host.strip() for host in os.getenv("ALLOWED_HOSTS", "").split(",") if host.strip()
+]
 
 
 # Application definition
@@ -51,12 +55,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.queries.QueryCountMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.routers.PrimaryPinMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -93,6 +99,128 @@ DATABASES = {
     }
 }
 
+# DB 연결 재사용
+#   - DB_POOL=true : 프로세스(워커) 단위 psycopg 연결 풀, 요청마다 풀에서 대여/반납
+#     (워커 수 * DB_POOL_MAX_SIZE 가 Postgres max_connections 이하가 되도록 설정)
+#   - 미사용 시 : 스레드 단위 영구 연결 (CONN_MAX_AGE 초 동안 재사용)
+#   - ASGI (WEB_ASGI=true) 는 요청마다 다른 스레드에서 ORM 실행 -> 스레드 단위 영구 연결이
+#     쌓여 max_connections 초과, 풀 미사용 시 CONN_MAX_AGE=0 (요청 종료 시 연결 닫음)
+#     동시 요청이 많으면 DB_POOL=true 로 연결 수 제한
+DB_POOL = os.getenv("DB_POOL", "false").lower() == "true"
+WEB_ASGI = os.getenv("WEB_ASGI", "false").lower() == "true"
+
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+            # 풀이 가득 찼을 때 연결 대기 시간 (초과 시 PoolTimeout)
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", 10)),
+            "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", 10 * 60)),
+            "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", 60 * 60)),
+        }
+    }
+elif WEB_ASGI:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", 60))
+
+# 재사용 전 연결 상태 확인 (끊긴 연결은 폐기 후 재연결, 풀은 대여 시 확인)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# 읽기 전용 replica (콤마 구분 호스트, 접속 정보는 default 와 동일)
+#   - ReplicaReadMixin 적용 view 의 조회만 replica 로 (core.routers)
+#   - 쓰기 요청 후 REPLICA_PIN_SECONDS 동안 해당 유저 조회는 primary
+DATABASE_REPLICAS = []
+for index, host in enumerate(
+    filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")), start=1
+):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+
+DATABASE_ROUTERS = ["core.routers.ReadReplicaRouter"]
+
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+
+# 요청 단위 쿼리 기록 (core.queries.QueryCountMiddleware)
+#   - QUERY_COUNT_HEADERS : 응답 헤더로 쿼리 수 / DB 시간 / 반복 쿼리 수 노출 (개발용)
+#   - view 이름별 쿼리 수 예산, 초과 시 core.queries 경고 로그
+QUERY_COUNT_HEADERS = DEBUG
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", 20))
+QUERY_BUDGETS = {}
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 3))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "core": {"handlers": ["console"], "level": "INFO"},
+    },
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# REDIS_URL 설정 시 Redis (만료/축출은 Redis maxmemory-policy), 미설정 시 로컬 메모리
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+def _cache_config(location, timeout, max_entries):
+    if REDIS_URL:
+        return {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": location,
+            "TIMEOUT": timeout,
+        }
+    return {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": location,
+        "TIMEOUT": timeout,
+        "OPTIONS": {"MAX_ENTRIES": max_entries},
+    }
+
+
+# 퀴즈 문제 풀(연결된 문제 id 목록) 캐시 유지 시간 (초)
+#   - 문제 연결/해제/삭제 시 무효화는 캐시 백엔드 기준 -> 로컬 메모리 캐시면 요청을 처리한
+#     워커만 무효화되고 다른 워커는 이 시간 동안 이전 풀 사용
+#     (docker compose 는 redis 서비스 + REDIS_URL 로 공유 캐시 사용)
+QUESTION_POOL_TIMEOUT = int(os.getenv("QUESTION_POOL_TIMEOUT", 60))
+
+# 신규 응시의 선택지 순서를 저장하지 않고 응시 코드 seed 로 계산 (선택한 선택지만 저장)
+ATTEMPT_SEEDED_ORDER = os.getenv("ATTEMPT_SEEDED_ORDER", "false").lower() == "true"
+
+# 응시 단위 문제/선택지 스냅샷 캐시 유지 시간 (초)
+ATTEMPT_SNAPSHOT_TIMEOUT = int(os.getenv("ATTEMPT_SNAPSHOT_TIMEOUT", 60 * 60))
+
+CACHES = {
+    "default": _cache_config("default", timeout=300, max_entries=10000),
+    "attempt_snapshot": _cache_config(
+        "attempt_snapshot", timeout=ATTEMPT_SNAPSHOT_TIMEOUT, max_entries=50000
+    ),
+}
+
+# 문제 내용 / 정답 프로세스 내 LRU (question.content)
+#   - 항목 수 / 추정 메모리(바이트) 상한, 버전(문제 updated_at)은 공유 캐시에 유지
+QUESTION_CONTENT_CACHE_MAX_ENTRIES = int(
+    os.getenv("QUESTION_CONTENT_CACHE_MAX_ENTRIES", 10000)
+)
+QUESTION_CONTENT_CACHE_MAX_BYTES = int(
+    os.getenv("QUESTION_CONTENT_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+)
+QUESTION_VERSION_TIMEOUT = int(os.getenv("QUESTION_VERSION_TIMEOUT", 300))
+
+# 퀴즈 목록 페이지 캐시 유지 시간 (초), 관리자 퀴즈 생성/수정/삭제 시 즉시 갱신 (quiz.catalog)
+QUIZ_CATALOG_TIMEOUT = int(os.getenv("QUIZ_CATALOG_TIMEOUT", 300))
+# 만료 후 이전 값을 반환하며 백그라운드에서 갱신하는 시간 (초, 0 이면 사용 X)
+QUIZ_CATALOG_STALE_TTL = int(os.getenv("QUIZ_CATALOG_STALE_TTL", 30))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -0,0 +1,13 @@
+"""
+테스트 설정 : 운영 설정 + 로컬 2-DB 구성
+    - replica 는 default 테스트 DB 를 그대로 보는 MIRROR (별도 연결)
+    - 라우팅 대상은 기본 비움 -> replica 조회 테스트에서만 DATABASE_REPLICAS 지정
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES
+
+DATABASES["replica"] = {
+    **DATABASES["default"],
+    "TEST": {"MIRROR": "default"},
+}
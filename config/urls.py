@@ -11,6 +11,7 @@ urlpatterns = [
     path("quiz/", include("quiz.urls")),
     path("question/", include("question.urls")),
     path("attempt/", include("quiz_attempt.urls")),
+    path("core/", include("core.urls")),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,70 @@
+"""
+서버 워밍업 : 트래픽 받기 전 (gunicorn 마스터, fork 이전) 한 번 실행
+    - URLconf 로딩 및 reverse 조회 테이블 구성 (view / serializer 모듈 import 포함)
+    - 프로젝트 앱 serializers 모듈 import
+        - serializer 필드는 인스턴스마다 새로 구성되므로 미리 만들어 둘 수 없음
+    - 모델 메타데이터(_meta 필드 / 역참조 목록) 캐시 구성 : ModelSerializer 필드 구성,
+      ORM 조회가 요청마다 사용
+    - 워커는 fork 로 메모리를 공유하므로 워커마다 반복하지 않음
+"""
+
+import inspect
+from importlib import import_module
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.urls import get_resolver
+from django.utils.module_loading import module_has_submodule
+from rest_framework import serializers
+
+
+def _project_app_configs():
+    """BASE_DIR 하위 (프로젝트) 앱만"""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for app_config in apps.get_app_configs():
+        if base_dir in Path(app_config.path).resolve().parents:
+            yield app_config
+
+
+def warm_up_urls() -> int:
+    """URLconf 로딩 및 reverse 조회 테이블 구성, URL 패턴 수 반환"""
+    resolver = get_resolver()
+    resolver.reverse_dict  # 조회 시 전체 URLconf import + 캐시 구성
+    return len(resolver.url_patterns)
+
+
+def warm_up_serializers() -> int:
+    """앱별 serializers 모듈 import, serializer 클래스 수 반환"""
+    count = 0
+    for app_config in _project_app_configs():
+        if not module_has_submodule(app_config.module, "serializers"):
+            continue
+
+        module = import_module(f"{app_config.name}.serializers")
+        for _, serializer_class in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(serializer_class, serializers.BaseSerializer)
+                and serializer_class.__module__ == module.__name__
+            ):
+                count += 1
+    return count
+
+
+def warm_up_models() -> int:
+    """전체 모델의 _meta 필드 / 역참조 캐시 구성 (프로세스 동안 유지), 모델 수 반환"""
+    models = apps.get_models()
+    for model in models:
+        opts = model._meta
+        opts.get_fields()
+        opts.related_objects
+        opts._property_names
+    return len(models)
+
+
+def warm_up() -> dict:
+    return {
+        "urls": warm_up_urls(),
+        "serializers": warm_up_serializers(),
+        "models": warm_up_models(),
+    }
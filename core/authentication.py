@@ -0,0 +1,25 @@
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """
+    DRF 밖의 async view 용 JWT 인증
+        - 토큰 검증은 동일
+        - 유저 조회 / 확인 (활성, 비밀번호 변경 토큰 폐기 등) 은 get_user 를 스레드에서 실행
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        return await sync_to_async(self.get_user)(validated_token)
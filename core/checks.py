@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register()
+def shared_cache_check(app_configs, **kwargs):
+    """
+    운영(DEBUG=False) 에서 워커 간 공유되지 않는 캐시 사용 경고
+        - 문제 풀 / 카탈로그 / 문제 내용 버전 무효화가 요청을 처리한 워커에만 반영됨
+    """
+    if settings.DEBUG:
+        return []
+
+    return [
+        Warning(
+            f"CACHES['{alias}'] 가 워커 간 공유되지 않는 캐시입니다.",
+            hint="REDIS_URL 을 설정하세요. 무효화가 다른 워커에 반영되지 않습니다.",
+            obj=alias,
+            id="core.W001",
+        )
+        for alias, config in settings.CACHES.items()
+        if config["BACKEND"] in LOCAL_CACHE_BACKENDS
+    ]
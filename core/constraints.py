@@ -0,0 +1,28 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.db.models import BaseConstraint, Deferrable
+
+
+class UniqueWhereConstraint(ExclusionConstraint):
+    """
+    조건부 유일 제약 : EXCLUDE USING btree (fields WITH =) WHERE (condition) DEFERRABLE
+        - 부분 UNIQUE 인덱스는 행 단위로 검사 -> 한 UPDATE 문에서 선택 이동 시 충돌
+        - DEFERRABLE INITIALLY IMMEDIATE : 문장 종료 시점에 검사 (트랜잭션 내 즉시 검사 유지)
+    """
+
+    def __init__(self, *, name, fields, condition, **kwargs):
+        self.fields = tuple(fields)
+        super().__init__(
+            name=name,
+            expressions=[(field, "=") for field in self.fields],
+            condition=condition,
+            deferrable=Deferrable.IMMEDIATE,
+            **kwargs,
+        )
+        # ExclusionConstraint 는 GiST/SP-GiST 만 허용 -> 스칼라 = 비교는 btree 로 충분
+        self.index_type = "BTREE"
+
+    def deconstruct(self):
+        path, args, kwargs = BaseConstraint.deconstruct(self)
+        kwargs["fields"] = self.fields
+        kwargs["condition"] = self.condition
+        return path, args, kwargs
@@ -0,0 +1,102 @@
+"""
+프로세스 내 LRU 캐시 : 항목 수 / 메모리(추정 바이트) 상한, 적중 / 미스 / 축출 카운터
+    - 워커 프로세스마다 따로 유지 (공유 X), 무효화는 사용하는 쪽에서 버전 비교로 처리
+    - 이름을 지정해 생성한 캐시는 lru_stats() 로 현황 조회
+"""
+
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+_registry = weakref.WeakValueDictionary()
+
+
+def estimate_size(value) -> int:
+    """dict / list / tuple / str / 숫자로 구성된 값의 대략적인 메모리 크기 (바이트)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class LRUCache:
+    def __init__(self, name, max_entries, max_bytes, sizeof=estimate_size):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+        _registry[name] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_bytes:
+                # 상한보다 큰 값은 저장하지 않음
+                return
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def lru_caches() -> list[LRUCache]:
+    return list(_registry.values())
+
+
+def lru_stats() -> dict:
+    """이름별 LRU 캐시 현황 (현재 프로세스)"""
+    return {cache.name: cache.stats() for cache in lru_caches()}
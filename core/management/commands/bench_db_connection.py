@@ -0,0 +1,133 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        "요청당 DB 연결 비용 비교 : 요청마다 새 연결 / 영구 연결(CONN_MAX_AGE) / 연결 풀"
+        " - 요청 시작/종료 시 Django 와 같은 연결 정리(close_if_unusable_or_obsolete)"
+        " 후 쿼리 1건 실행"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="요청 수")
+        parser.add_argument(
+            "--threads", type=int, default=8, help="동시 요청 스레드 수"
+        )
+        parser.add_argument("--pool-min", type=int, default=2, help="풀 최소 연결 수")
+        parser.add_argument("--pool-max", type=int, default=4, help="풀 최대 연결 수")
+        parser.add_argument("--database", default="default", help="측정 대상 DB alias")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["threads"] < 1:
+            raise CommandError("--requests, --threads 는 1 이상이어야 합니다.")
+
+        base = connections[options["database"]]
+        if base.vendor != "postgresql":
+            raise CommandError("PostgreSQL DB 만 측정할 수 있습니다.")
+
+        pool_options = {
+            "min_size": options["pool_min"],
+            "max_size": options["pool_max"],
+        }
+        modes = [
+            ("new connection", {"CONN_MAX_AGE": 0}, {}),
+            ("persistent", {"CONN_MAX_AGE": 60}, {}),
+            (
+                f"pool ({options['pool_min']}~{options['pool_max']})",
+                {"CONN_MAX_AGE": 0},
+                {"pool": pool_options},
+            ),
+        ]
+
+        self.stdout.write(
+            f"요청 {options['requests']}건, 스레드 {options['threads']}개"
+        )
+        for index, (label, settings, extra_options) in enumerate(modes):
+            settings_dict = {
+                **base.settings_dict,
+                **settings,
+                "CONN_HEALTH_CHECKS": True,
+                "OPTIONS": {
+                    **{
+                        key: value
+                        for key, value in base.settings_dict["OPTIONS"].items()
+                        if key != "pool"
+                    },
+                    **extra_options,
+                },
+            }
+            alias = f"bench_db_connection_{index}"
+            result = self._run(
+                base.__class__, settings_dict, alias, options["requests"], options
+            )
+            self._report(label, *result)
+
+    def _run(self, wrapper_class, settings_dict, alias, request_count, options):
+        """스레드마다 DatabaseWrapper 1개 (Django 와 같이 스레드별 연결)"""
+        per_thread = [
+            request_count // options["threads"]
+            + (1 if i < request_count % options["threads"] else 0)
+            for i in range(options["threads"])
+        ]
+
+        def worker(count):
+            connection = wrapper_class(settings_dict, alias)
+            connect_times, request_times, backend_pids = [], [], set()
+            try:
+                for _ in range(count):
+                    started = time.perf_counter()
+                    # request_started
+                    connection.close_if_unusable_or_obsolete()
+                    connection.ensure_connection()
+                    connected = time.perf_counter()
+
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT pg_backend_pid()")
+                        backend_pids.add(cursor.fetchone()[0])
+
+                    # request_finished
+                    connection.close_if_unusable_or_obsolete()
+                    connect_times.append(connected - started)
+                    request_times.append(time.perf_counter() - started)
+            finally:
+                connection.close()
+            return connect_times, request_times, backend_pids, connection
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            results = list(executor.map(worker, per_thread))
+        elapsed = time.perf_counter() - started
+
+        connect_times = sum((result[0] for result in results), [])
+        request_times = sum((result[1] for result in results), [])
+        backend_pids = set().union(*(result[2] for result in results))
+
+        pool_stats = None
+        connection = results[0][3]
+        if connection.pool is not None:
+            pool_stats = connection.pool.get_stats()
+            connection.close_pool()
+        return connect_times, request_times, len(backend_pids), elapsed, pool_stats
+
+    def _report(
+        self, label, connect_times, request_times, backend_count, elapsed, pool_stats
+    ):
+        request_times = sorted(request_times)
+        p95 = request_times[max(int(len(request_times) * 0.95) - 1, 0)]
+        self.stdout.write(
+            f"{label:<16} {len(request_times) / elapsed:>9.1f} req/s  "
+            f"connect avg {statistics.mean(connect_times) * 1000:>7.3f} ms  "
+            f"request p50 {statistics.median(request_times) * 1000:>7.3f} ms  "
+            f"p95 {p95 * 1000:>7.3f} ms  backend 연결 {backend_count}개"
+        )
+        if pool_stats:
+            self.stdout.write(
+                f"{'':<16} pool : 대기 요청 {pool_stats.get('requests_waiting', 0)}, "
+                f"대기 누적 {pool_stats.get('requests_wait_ms', 0)} ms, "
+                f"연결 생성 {pool_stats.get('connections_num', 0)}회"
+            )
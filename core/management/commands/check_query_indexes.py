@@ -0,0 +1,102 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from question.models import Question, Choice
+from quiz.models import Quiz
+from quiz_attempt.models import QuizAttempt, QuizAttemptQuestion, QuizAttemptChoice
+
+# (엔드포인트 쿼리, 쿼리셋, 사용해야 하는 인덱스의 테이블 및 선행 컬럼)
+HOT_QUERIES = [
+    (
+        "QuizViewSet.list : 삭제되지 않은 퀴즈 최신순",
+        lambda: Quiz.objects.filter(is_deleted=False).order_by("-created_at")[:10],
+        ("quiz", ["created_at", "id"]),
+    ),
+    (
+        "퀴즈 응시 조회 : QuizAttempt(user, quiz)",
+        lambda: QuizAttempt.objects.filter(user_id=0, quiz_id=0),
+        ("quiz_attempt", ["user_id", "quiz_id"]),
+    ),
+    (
+        "응시 문제 목록 : QuizAttemptQuestion(attempt) order_index 순",
+        lambda: QuizAttemptQuestion.objects.filter(attempt_id=0).order_by(
+            "order_index"
+        ),
+        ("quiz_attempt_question", ["attempt_id", "order_index"]),
+    ),
+    (
+        "선택지 순서 : QuizAttemptChoice(attempt_question) order_index 순",
+        lambda: QuizAttemptChoice.objects.filter(attempt_question_id=0).order_by(
+            "order_index"
+        ),
+        ("quiz_attempt_choice", ["attempt_question_id", "order_index"]),
+    ),
+    (
+        "선택한 선택지 : QuizAttemptChoice(attempt_question, is_selected=True)",
+        lambda: QuizAttemptChoice.objects.filter(
+            attempt_question_id=0, is_selected=True
+        ),
+        ("quiz_attempt_choice", ["attempt_question_id"]),
+    ),
+    (
+        "QuestionViewSet.list : 생성일 범위 문제 최신순",
+        lambda: Question.objects.filter(created_at__gte=timezone.now()).order_by(
+            "-created_at", "-id"
+        )[:10],
+        ("question", ["created_at", "id"]),
+    ),
+    (
+        "문제 선택지 : Choice(question)",
+        lambda: Choice.objects.filter(question_id=0).order_by("id"),
+        ("question_choice", ["question_id"]),
+    ),
+    (
+        "정답 선택지 : Choice(question, is_correct=True)",
+        lambda: Choice.objects.filter(question_id__in=[0], is_correct=True),
+        ("question_choice", ["question_id"]),
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = "주요 엔드포인트 쿼리가 인덱스를 사용하는지 EXPLAIN 으로 확인"
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        missed = []
+        for label, build_queryset, (table, columns) in HOT_QUERIES:
+            index_names = self._find_indexes(table, columns)
+            plan = self._explain(build_queryset())
+
+            used = [name for name in index_names if name in plan]
+            if used:
+                self.stdout.write(f"OK    {label} -> {', '.join(used)}")
+            else:
+                missed.append(label)
+                self.stdout.write(self.style.ERROR(f"MISS  {label}\n{plan}"))
+
+        if missed:
+            raise CommandError(f"인덱스를 사용하지 않는 쿼리 {len(missed)}건")
+        self.stdout.write(self.style.SUCCESS("모든 쿼리가 인덱스를 사용합니다."))
+
+    def _find_indexes(self, table, columns):
+        """선행 컬럼이 columns 와 일치하는 인덱스 이름 목록 (UNIQUE, EXCLUDE 제약 포함)"""
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+        return [
+            name
+            for name, info in constraints.items()
+            if not (info["check"] or info["foreign_key"])
+            and info["columns"][: len(columns)] == columns
+        ]
+
+    def _explain(self, queryset):
+        # 데이터가 적은 환경에서도 플래너가 인덱스 사용 가능 여부를 드러내도록 seq scan 비활성화
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            return queryset.explain()
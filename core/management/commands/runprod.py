@@ -0,0 +1,55 @@
+import os
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+CONFIG_PATH = settings.BASE_DIR / "config" / "gunicorn.conf.py"
+
+
+class Command(BaseCommand):
+    help = (
+        "운영 서버 실행 (gunicorn, config/gunicorn.conf.py)"
+        " - 앱 preload + 워밍업 후 워커 fork, 옵션은 환경 변수(WEB_*)보다 우선"
+        " - --asgi : ASGI 앱 + uvicorn 워커 (WEB_ASGI)"
+        " - 마이그레이션은 실행하지 않음 (manage.py migrate 별도 실행)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bind", help="주소:포트 (WEB_BIND)")
+        parser.add_argument(
+            "--workers", type=int, help="워커 프로세스 수 (WEB_WORKERS)"
+        )
+        parser.add_argument(
+            "--threads", type=int, help="워커당 스레드 수 (WEB_THREADS)"
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            help="워커 재시작 기준 요청 수 (WEB_MAX_REQUESTS)",
+        )
+        parser.add_argument(
+            "--asgi",
+            action="store_true",
+            help="ASGI 앱 + uvicorn 워커로 실행 (WEB_ASGI)",
+        )
+
+    def gunicorn_argv(self, options) -> list[str]:
+        argv = [sys.executable, "-m", "gunicorn", "-c", str(CONFIG_PATH)]
+        for option in ("bind", "workers", "threads", "max_requests"):
+            if options.get(option) is not None:
+                argv += [f"--{option.replace('_', '-')}", str(options[option])]
+        return argv
+
+    def gunicorn_env(self, options) -> dict:
+        env = dict(os.environ)
+        if options.get("asgi"):
+            env["WEB_ASGI"] = "true"
+        return env
+
+    def handle(self, *args, **options):
+        argv = self.gunicorn_argv(options)
+
+        # manage.py 프로세스를 gunicorn 마스터로 대체 (컨테이너 PID 1 시그널 그대로 전달)
+        os.chdir(settings.BASE_DIR)
+        os.execve(sys.executable, argv, self.gunicorn_env(options))
@@ -1,7 +1,144 @@
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CachedCountPaginator(Paginator):
+    """전체 개수(COUNT)를 쿼리 기준으로 일정 시간 캐시하는 Paginator (근사치)"""
+
+    count_cache_timeout = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is None:
+            return super().count
+
+        key = "pagination_count:" + hashlib.md5(str(query).encode()).hexdigest()
+        return cache.get_or_set(
+            key, lambda: Paginator.count.func(self), self.count_cache_timeout
+        )
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+    # 관리자 화면 등 전체 개수가 필요 없는 경우
+    # count=exact(기본) | none(COUNT 생략) | cached(캐시된 근사 개수)
+    count_query_param = "count"
+    count_modes = ("exact", "none", "cached")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_mode = request.query_params.get(self.count_query_param, "exact")
+        if self.count_mode not in self.count_modes:
+            self.count_mode = "exact"
+
+        if self.count_mode == "none":
+            return self._paginate_without_count(queryset, request)
+
+        if self.count_mode == "cached":
+            self.django_paginator_class = CachedCountPaginator
+        return super().paginate_queryset(queryset, request, view)
+
+    def _paginate_without_count(self, queryset, request):
+        """한 건을 더 조회하여 다음 페이지 존재 여부만 판단"""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            page_number = 0
+        if page_number < 1:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number))
+
+        offset = (page_number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if page_number > 1 and not rows:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number))
+
+        self.request = request
+        self.page_number = page_number
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_paginated_response(self, data):
+        if self.count_mode != "none":
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "count": None,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if self.count_mode != "none":
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.count_mode != "none":
+            return super().get_previous_link()
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "전체 개수 조회 방식 (exact | none | cached)",
+                "schema": {"type": "string", "enum": list(self.count_modes)},
+            }
+        )
+        return parameters
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """(created_at, id) 순 keyset 페이지네이션 : OFFSET 스캔 및 COUNT 없음"""
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
+class CursorPaginationOptInMixin:
+    """?pagination=cursor 요청 시 cursor 페이지네이션 사용"""
+
+    cursor_pagination_class = CreatedAtCursorPagination
+    pagination_mode_query_param = "pagination"
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            mode = self.request.query_params.get(self.pagination_mode_query_param)
+            if mode == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
@@ -0,0 +1,154 @@
+"""
+요청 단위 쿼리 수 / DB 시간 / 반복 쿼리(N+1) 기록
+    - QueryCountMiddleware : view 별 기록
+        - 개발 (QUERY_COUNT_HEADERS) : 응답 헤더 X-Query-Count, X-Query-Time, X-Query-Repeated
+        - view 별 쿼리 수 예산 (QUERY_BUDGETS, 기본 QUERY_BUDGET_DEFAULT) 초과 시
+          반복 쿼리와 호출 위치(stack)를 담은 JSON 경고 로그
+    - 반복 쿼리 : 파라미터만 다른 같은 형태의 SQL 이 QUERY_REPEAT_THRESHOLD 회 이상 실행
+"""
+
+import json
+import logging
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("core.queries")
+
+_IN_CLAUSE = re.compile(r"\bIN \((?:%s, )*%s\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql) -> str:
+    """파라미터 / 리터럴 / IN 목록 길이를 제거한 SQL 형태"""
+    sql = _IN_CLAUSE.sub("IN (...)", sql)
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _call_site() -> list[str]:
+    """프로젝트 코드 호출 위치 (Django / 라이브러리 / 이 모듈 제외)"""
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir)
+        and "site-packages" not in frame.filename
+        and frame.filename != __file__
+    ]
+    return [
+        f"{frame.filename[len(base_dir) + 1:]}:{frame.lineno} in {frame.name}"
+        for frame in frames[-8:]
+    ]
+
+
+class QueryStats:
+    """connection.execute_wrapper 로 등록하는 쿼리 기록기"""
+
+    def __init__(self, repeat_threshold=None):
+        self.repeat_threshold = repeat_threshold or settings.QUERY_REPEAT_THRESHOLD
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        # 반복 임계치 도달 시점의 호출 위치 (fingerprint 별 1회)
+        self.stacks = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+            key = fingerprint(sql)
+            self.fingerprints[key] += 1
+            if self.fingerprints[key] == self.repeat_threshold:
+                self.stacks[key] = _call_site()
+
+    def repeated(self) -> list[tuple[str, int]]:
+        return [
+            (sql, count)
+            for sql, count in self.fingerprints.most_common()
+            if count >= self.repeat_threshold
+        ]
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_time_ms": round(self.duration * 1000, 2),
+            "repeated": [
+                {"sql": sql, "count": count, "stack": self.stacks.get(sql, [])}
+                for sql, count in self.repeated()
+            ],
+        }
+
+
+@contextmanager
+def record_queries(repeat_threshold=None):
+    """블록 안에서 실행한 모든 DB 쿼리 기록 (현재 스레드 연결)"""
+    stats = QueryStats(repeat_threshold)
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        yield stats
+
+
+def query_budget(view_name) -> int:
+    return settings.QUERY_BUDGETS.get(view_name, settings.QUERY_BUDGET_DEFAULT)
+
+
+class QueryCountMiddleware:
+    """
+    view 별 쿼리 수 / DB 시간 / 반복 쿼리 기록
+        - async 요청은 쿼리가 다른 스레드(sync_to_async)에서 실행되므로 기록하지 않음
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.get_response(request)
+
+        with record_queries() as stats:
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        view_name = match.view_name if match else request.path
+        budget = query_budget(view_name)
+
+        if settings.QUERY_COUNT_HEADERS:
+            response["X-Query-Count"] = stats.count
+            response["X-Query-Time"] = f"{stats.duration * 1000:.2f}ms"
+            response["X-Query-Repeated"] = len(stats.repeated())
+
+        if stats.count > budget:
+            payload = {
+                "view": view_name,
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "budget": budget,
+                **stats.as_dict(),
+            }
+            logger.warning(
+                "query budget exceeded %s",
+                json.dumps(payload, ensure_ascii=False),
+                extra={"query_stats": payload},
+            )
+        return response
@@ -0,0 +1,123 @@
+"""
+읽기 전용 replica DB 라우팅
+    - ReplicaReadMixin 을 적용한 view 의 안전한 요청(GET/HEAD/OPTIONS) 조회만 replica 로 보냄
+    - 그 외 (쓰기, 트랜잭션이 필요한 응시 흐름 등) 는 모두 primary(default)
+    - 쓰기 요청 후 일정 시간 (REPLICA_PIN_SECONDS) 해당 유저의 조회는 primary 고정
+      (replica 복제 지연 동안 방금 쓴 데이터가 안 보이는 문제 방지)
+"""
+
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+_replica_reads = ContextVar("replica_reads", default=False)
+
+
+def primary_pin_key(user_id) -> str:
+    return f"db:pin:{user_id}"
+
+
+def pin_to_primary(user):
+    cache.set(primary_pin_key(user.id), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned_to_primary(user) -> bool:
+    if not user or not user.is_authenticated:
+        return False
+    return cache.get(primary_pin_key(user.id), False)
+
+
+class ReadReplicaRouter:
+    """settings.DATABASE_REPLICAS 설정 시 replica 조회 허용 구간의 읽기만 replica 로"""
+
+    def db_for_read(self, model, **hints):
+        if settings.DATABASE_REPLICAS and _replica_reads.get():
+            return random.choice(settings.DATABASE_REPLICAS)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 primary 복제본 -> 같은 데이터
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    조회 전용 view : 안전한 요청의 조회를 replica 로
+        - 인증 후 판단 (primary 고정 유저 확인)
+        - 요청 종료 시 원래 상태로 복구 (스레드 / 코루틴 재사용 대비)
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        token = _replica_reads.set(False)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _replica_reads.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method in SAFE_METHODS
+            and not is_pinned_to_primary(request.user)
+        ):
+            _replica_reads.set(True)
+
+
+class PrimaryPinMiddleware:
+    """
+    쓰기 요청 성공 시 해당 유저를 REPLICA_PIN_SECONDS 동안 primary 고정
+        - sync / async 모두 지원 (ASGI async view 를 스레드로 감싸지 않도록)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        response = self.get_response(request)
+        if self._should_pin(request, response):
+            pin_to_primary(request.user)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self._should_pin(request, response):
+            await cache.aset(
+                primary_pin_key(request.user.id), True, settings.REPLICA_PIN_SECONDS
+            )
+        return response
+
+    def _should_pin(self, request, response) -> bool:
+        # DRF / async view 인증 결과는 request.user 로 전달됨
+        user = getattr(request, "user", None)
+        return bool(
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and user is not None
+            and user.is_authenticated
+        )
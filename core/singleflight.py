@@ -0,0 +1,195 @@
+"""
+캐시 미스 요청 합치기 (single-flight) : 같은 키의 동시 캐시 미스는 계산 1회만 실행
+    - 프로세스 내 : 먼저 온 요청(leader)만 계산, 나머지는 결과를 기다려 같은 값 사용
+    - 프로세스 간 (shared_lock) : 캐시 백엔드의 add 로 잠금, 잠금을 못 얻으면 값이 저장될 때까지
+      대기 (wait_timeout 초과 시 직접 계산)
+    - stale-while-revalidate (stale_ttl) : 만료 후 stale_ttl 동안은 이전 값을 바로 반환하고
+      백그라운드 스레드에서 1회만 갱신
+    - 저장 형식 : (만료 시각, 값) -> 캐시 유지 시간은 timeout + stale_ttl
+    - singleflight_stats() : 이름별 적중 / 계산 / 합쳐진 요청 / 잠금 대기 / stale 반환 횟수
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import connections
+
+logger = logging.getLogger("core.singleflight")
+
+_registry = {}
+
+
+class _Call:
+    """진행 중인 계산 : 대기 요청은 event 로 결과를 기다림"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(
+        self,
+        name,
+        cache_alias=DEFAULT_CACHE_ALIAS,
+        lock_timeout=10,
+        wait_timeout=5,
+        poll_interval=0.02,
+    ):
+        self.name = name
+        self.cache_alias = cache_alias
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+        self._calls = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.counters = Counter()
+
+        _registry[name] = self
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get(self, key, compute, timeout, stale_ttl=0, shared_lock=True):
+        """
+        캐시된 값 조회, 없으면 compute() 결과 저장 후 반환 (None 도 저장)
+            - compute 예외는 같은 키를 기다리던 요청 모두에 전달 (저장 X)
+        """
+        entry = self.cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.time() < expires_at:
+                self._count("hits")
+                return value
+            if stale_ttl:
+                self._count("stale_hits")
+                self._refresh(key, compute, timeout, stale_ttl, shared_lock)
+                return value
+
+        return self._coalesce(key, compute, timeout, stale_ttl, shared_lock)
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+    def _coalesce(self, key, compute, timeout, stale_ttl, shared_lock):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            self._count("coalesced")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._load(key, compute, timeout, stale_ttl, shared_lock)
+            return call.value
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def _load(self, key, compute, timeout, stale_ttl, shared_lock):
+        if not shared_lock:
+            return self._compute(key, compute, timeout, stale_ttl)
+
+        lock_key = f"{key}:lock"
+        if self.cache.add(lock_key, True, self.lock_timeout):
+            try:
+                return self._compute(key, compute, timeout, stale_ttl)
+            finally:
+                self.cache.delete(lock_key)
+
+        # 다른 프로세스가 계산 중 : 저장될 때까지 대기
+        entry = self._wait_for(key)
+        if entry is not None:
+            self._count("lock_waits")
+            return entry[1]
+
+        self._count("lock_timeouts")
+        return self._compute(key, compute, timeout, stale_ttl)
+
+    def _wait_for(self, key):
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = self.cache.get(key)
+            if entry is not None and time.time() < entry[0]:
+                return entry
+        return None
+
+    def _compute(self, key, compute, timeout, stale_ttl):
+        self._count("computes")
+        value = compute()
+        self.cache.set(key, (time.time() + timeout, value), timeout + stale_ttl)
+        return value
+
+    def _refresh(self, key, compute, timeout, stale_ttl, shared_lock):
+        """stale 값 백그라운드 갱신 : 프로세스 내 키당 1개, 다른 프로세스가 갱신 중이면 생략"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            lock_key = f"{key}:lock"
+            try:
+                if shared_lock and not self.cache.add(
+                    lock_key, True, self.lock_timeout
+                ):
+                    return
+                try:
+                    self._count("refreshes")
+                    self._compute(key, compute, timeout, stale_ttl)
+                finally:
+                    if shared_lock:
+                        self.cache.delete(lock_key)
+            except Exception:
+                self._count("errors")
+                logger.exception("single-flight refresh failed: %s", key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+                # 이 스레드에서 연 DB 연결 정리
+                connections.close_all()
+
+        threading.Thread(target=run, name=f"singleflight:{key}", daemon=True).start()
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "refreshing": len(self._refreshing),
+                **self.counters,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.counters.clear()
+
+
+def single_flights() -> list[SingleFlight]:
+    return list(_registry.values())
+
+
+def singleflight_stats() -> dict:
+    """이름별 single-flight 현황 (현재 프로세스)"""
+    return {flight.name: flight.stats() for flight in single_flights()}
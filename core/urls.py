@@ -0,0 +1,25 @@
+from django.urls import path
+
+from .views import (
+    DatabaseConnectionStatsAPIView,
+    LRUCacheStatsAPIView,
+    SingleFlightStatsAPIView,
+)
+
+urlpatterns = [
+    path(
+        "metrics/db/",
+        DatabaseConnectionStatsAPIView.as_view(),
+        name="metrics-db",
+    ),
+    path(
+        "metrics/lru/",
+        LRUCacheStatsAPIView.as_view(),
+        name="metrics-lru",
+    ),
+    path(
+        "metrics/singleflight/",
+        SingleFlightStatsAPIView.as_view(),
+        name="metrics-singleflight",
+    ),
+]
@@ -0,0 +1,60 @@
+from django.db import connections
+from rest_framework import generics
+from rest_framework.response import Response
+
+from .lru import lru_stats
+from .permissions import IsStaffUser
+from .singleflight import singleflight_stats
+
+
+def database_connection_stats(alias) -> dict:
+    """
+    DB 연결 재사용 현황 (현재 프로세스 기준)
+        - pool : psycopg 풀 통계 (크기, 대기 요청 수 / 시간, 연결 생성 수 등 누적값)
+        - persistent : CONN_MAX_AGE 영구 연결
+    """
+    connection = connections[alias]
+    pool = getattr(connection, "pool", None)
+
+    if pool is None:
+        return {
+            "mode": "persistent",
+            "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+            "conn_health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+        }
+    return {
+        "mode": "pool",
+        "min_size": pool.min_size,
+        "max_size": pool.max_size,
+        "timeout": pool.timeout,
+        "stats": pool.get_stats(),
+    }
+
+
+class DatabaseConnectionStatsAPIView(generics.GenericAPIView):
+    """관리자 : DB 연결 풀 사용 현황 (요청을 처리한 워커 프로세스 기준)"""
+
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {alias: database_connection_stats(alias) for alias in connections}
+        )
+
+
+class LRUCacheStatsAPIView(generics.GenericAPIView):
+    """관리자 : 프로세스 내 LRU 캐시 현황 (적중 / 미스 / 축출, 요청을 처리한 워커 기준)"""
+
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(lru_stats())
+
+
+class SingleFlightStatsAPIView(generics.GenericAPIView):
+    """관리자 : 캐시 미스 요청 합치기 현황 (합쳐진 요청 / 잠금 대기 / stale 반환, 워커 기준)"""
+
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(singleflight_stats())
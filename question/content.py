@@ -0,0 +1,147 @@
+"""
+문제 내용 / 정답 캐시 (워커 프로세스 내 LRU)
+    - 문제별 항목 : 문제 내용, 선택지(id 순), 정답 선택지 id, 버전
+    - 버전 : 문제 updated_at (선택지만 바뀌어도 문제 수정 시 갱신)
+        - 공유 캐시에 문제별 버전 저장, 관리자 수정 / 삭제 시 갱신 -> 다른 워커의 LRU 항목도 만료
+        - 조회 중 로드한 버전은 공유 캐시에 없을 때만 저장 (갱신된 버전 유지)
+        - LRU 에 있는 문제만 버전 확인, 공유 캐시에 없으면 DB 에서 updated_at 만 조회
+          (문제 수와 관계없이 1회)
+    - 공유 캐시가 로컬 메모리(REDIS_URL 미설정)면 다른 워커는 버전 유지 시간
+      (QUESTION_VERSION_TIMEOUT) 동안 이전 내용을 볼 수 있음
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from core.lru import LRUCache
+from .models import Question, Choice
+
+question_content_cache = LRUCache(
+    "question_content",
+    max_entries=settings.QUESTION_CONTENT_CACHE_MAX_ENTRIES,
+    max_bytes=settings.QUESTION_CONTENT_CACHE_MAX_BYTES,
+)
+
+
+def _version_key(question_id) -> str:
+    return f"question_version:{question_id}"
+
+
+def _version_stamp(updated_at) -> int:
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+def _question_versions(question_ids) -> dict[int, int]:
+    """문제별 현재 버전 (공유 캐시에 없고 DB 에도 없는 문제 제외)"""
+    keys = {_version_key(qid): qid for qid in question_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+
+    missing_ids = [qid for qid in question_ids if qid not in versions]
+    if missing_ids:
+        loaded = {
+            qid: _version_stamp(updated_at)
+            for qid, updated_at in Question.objects.filter(
+                id__in=missing_ids
+            ).values_list("id", "updated_at")
+        }
+        _store_versions(loaded)
+        versions.update(loaded)
+    return versions
+
+
+def _store_versions(versions):
+    """
+    로드한 버전 저장 : 공유 캐시에 없는 문제만 (add)
+        - 로드 중에 관리자 수정으로 갱신된 버전을 이전 버전으로 덮어쓰지 않도록
+    """
+    for qid, version in versions.items():
+        cache.add(_version_key(qid), version, settings.QUESTION_VERSION_TIMEOUT)
+
+
+def _load_contents(question_ids) -> dict[int, dict]:
+    questions = Question.objects.filter(id__in=question_ids).prefetch_related(
+        Prefetch("choice", queryset=Choice.objects.order_by("id"))
+    )
+
+    contents = {}
+    for question in questions:
+        choices = question.choice.all()
+        contents[question.id] = {
+            "id": question.id,
+            "text": question.text,
+            "choices": [{"id": choice.id, "text": choice.text} for choice in choices],
+            "answer_id": next((c.id for c in choices if c.is_correct), None),
+            "version": _version_stamp(question.updated_at),
+        }
+    return contents
+
+
+def get_question_contents(question_ids, refresh=False) -> dict[int, dict]:
+    """
+    문제별 내용 {id, text, choices, answer_id, version} (없는 문제 제외)
+        - LRU 항목의 버전이 현재 버전과 같으면 DB 조회 X
+        - refresh : 캐시를 쓰지 않고 DB 에서 다시 읽음 (정답 변경 후 재채점 등)
+    """
+    question_ids = list(dict.fromkeys(question_ids))
+    if not question_ids:
+        return {}
+
+    contents, stale_ids = {}, question_ids
+    if not refresh:
+        # LRU 에 없는 문제는 버전 확인 없이 바로 로드 (로드 결과로 버전 저장)
+        cached = {}
+        for qid in question_ids:
+            content = question_content_cache.get(qid)
+            if content is not None:
+                cached[qid] = content
+        stale_ids = [qid for qid in question_ids if qid not in cached]
+
+        versions = _question_versions(list(cached)) if cached else {}
+        for qid, content in cached.items():
+            if versions.get(qid) == content["version"]:
+                contents[qid] = content
+            elif qid in versions:
+                stale_ids.append(qid)
+
+    if stale_ids:
+        loaded = _load_contents(stale_ids)
+        for qid, content in loaded.items():
+            question_content_cache.set(qid, content)
+        _store_versions({qid: content["version"] for qid, content in loaded.items()})
+        contents.update(loaded)
+    return contents
+
+
+def get_question_versions(question_ids) -> dict[int, int]:
+    """문제별 현재 버전 (삭제된 문제 제외) : 문제 내용을 담아 둔 다른 캐시의 최신 여부 확인용"""
+    question_ids = list(dict.fromkeys(question_ids))
+    return _question_versions(question_ids) if question_ids else {}
+
+
+def get_question_content(question_id) -> dict | None:
+    return get_question_contents([question_id]).get(question_id)
+
+
+def get_answer_keys(question_ids, refresh=False) -> dict[int, int | None]:
+    """문제별 정답 선택지 id"""
+    return {
+        qid: content["answer_id"]
+        for qid, content in get_question_contents(question_ids, refresh).items()
+    }
+
+
+def bump_question_version(question):
+    """관리자 수정 후 (커밋 후) : 저장된 updated_at 으로 버전 갱신"""
+    cache.set(
+        _version_key(question.id),
+        _version_stamp(question.updated_at),
+        settings.QUESTION_VERSION_TIMEOUT,
+    )
+    question_content_cache.delete(question.id)
+
+
+def forget_question(question_id):
+    """문제 삭제 후 : 버전 / LRU 항목 제거"""
+    cache.delete(_version_key(question_id))
+    question_content_cache.delete(question_id)
@@ -0,0 +1,105 @@
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+
+from .models import Question, Choice
+from .serializers import QuestionSerializer
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+
+def read_jsonl_rows(stream):
+    """
+    JSONL : 한 줄에 문제 하나
+        {"text": "...", "choice": [{"text": "...", "is_correct": true}, ...]}
+    """
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"JSON 형식 오류: {e.msg}")
+
+
+def read_csv_rows(stream):
+    """
+    CSV : text, choice_1 ... choice_n, answer(정답 선택지 번호, 1부터 시작)
+        - 정답이 여러 개인 경우 answer 에 "1|3" 형태로 기재 (검증 단계에서 실패 처리)
+        - 선택지 열 이름이 choice_<숫자> 가 아니면 헤더(1행) 오류로 반환, 행은 읽지 않음
+    """
+    reader = csv.DictReader(stream)
+    choice_columns = [
+        column for column in reader.fieldnames or [] if column.startswith("choice_")
+    ]
+    invalid_columns = [
+        column
+        for column in choice_columns
+        if not (
+            column.removeprefix("choice_").isascii()
+            and column.removeprefix("choice_").isdecimal()
+        )
+    ]
+    if invalid_columns:
+        yield 1, ValueError(
+            f"선택지 열 이름은 choice_<번호> 형식이어야 합니다: {', '.join(invalid_columns)}"
+        )
+        return
+    choice_columns.sort(key=lambda column: int(column.removeprefix("choice_")))
+
+    for line_no, row in enumerate(reader, start=2):
+        answers = {answer.strip() for answer in (row.get("answer") or "").split("|")}
+        choices = [
+            {
+                "text": row[column],
+                "is_correct": column.removeprefix("choice_") in answers,
+            }
+            for column in choice_columns
+            if row.get(column)
+        ]
+        yield line_no, {"text": row.get("text"), "choice": choices}
+
+
+def import_questions(stream, file_format, batch_size=1000) -> dict:
+    """
+    문제 및 선택지 일괄 등록
+        - batch_size 단위로 검증 후 bulk_create (batch 별 트랜잭션)
+        - 검증 실패한 행은 건너뛰고 행 번호와 오류를 함께 반환
+    """
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format}")
+
+    rows = read_jsonl_rows(stream) if file_format == "jsonl" else read_csv_rows(stream)
+    created_count = 0
+    errors = []
+
+    while batch := list(islice(rows, batch_size)):
+        valid_rows = []
+        for line_no, data in batch:
+            if isinstance(data, Exception):
+                errors.append({"line": line_no, "errors": str(data)})
+                continue
+
+            # 정답 1개 검증 등 QuestionSerializer 검증 로직 그대로 사용
+            serializer = QuestionSerializer(data=data)
+            if serializer.is_valid():
+                valid_rows.append(serializer.validated_data)
+            else:
+                errors.append({"line": line_no, "errors": serializer.errors})
+
+        with transaction.atomic():
+            questions = Question.objects.bulk_create(
+                [Question(text=row["text"]) for row in valid_rows]
+            )
+            Choice.objects.bulk_create(
+                [
+                    Choice(question=question, **choice_data)
+                    for question, row in zip(questions, valid_rows)
+                    for choice_data in row["choice"]
+                ]
+            )
+        created_count += len(questions)
+
+    return {"created": created_count, "failed": len(errors), "errors": errors}
@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from question.importers import IMPORT_FORMATS, import_questions
+
+
+class Command(BaseCommand):
+    help = "JSONL/CSV 파일로 문제 및 선택지 일괄 등록"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--file-format",
+            choices=IMPORT_FORMATS,
+            help="미지정 시 파일 확장자로 판단",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["file_format"] or path.suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError(f"지원하지 않는 파일 형식입니다: {file_format}")
+
+        with path.open(encoding="utf-8-sig", newline="") as stream:
+            result = import_questions(
+                stream, file_format, batch_size=options["batch_size"]
+            )
+
+        for error in result["errors"]:
+            self.stderr.write(
+                f"{error['line']}행: {json.dumps(error['errors'], ensure_ascii=False)}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"등록 {result['created']}건, 실패 {result['failed']}건")
+        )
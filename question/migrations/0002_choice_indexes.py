@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:49
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중 테이블 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('question', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='choice',
+            index=models.Index(fields=['question', 'id'], name='choice_question_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='choice',
+            index=models.Index(
+                condition=models.Q(('is_correct', True)),
+                fields=['question'],
+                name='choice_answer_idx',
+            ),
+        ),
+    ]
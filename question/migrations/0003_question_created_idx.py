@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중 테이블 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('question', '0002_choice_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='question',
+            index=models.Index(
+                fields=['-created_at', '-id'], name='question_created_idx'
+            ),
+        ),
+    ]
@@ -13,6 +13,10 @@ class Question(TimeStampedMixin):
         db_table = "question"
         verbose_name = "문제"
         verbose_name_plural = "문제"
+        indexes = [
+            # 관리자 문제 목록 : 최신순, 생성일 범위 조회
+            models.Index(fields=["-created_at", "-id"], name="question_created_idx"),
+        ]
 
 
 class Choice(TimeStampedMixin):
@@ -32,3 +36,13 @@ class Choice(TimeStampedMixin):
         db_table = "question_choice"
         verbose_name = "선택지"
         verbose_name_plural = "선택지"
+        indexes = [
+            # 문제별 선택지 id 순 조회
+            models.Index(fields=["question", "id"], name="choice_question_idx"),
+            # 문제별 정답 조회
+            models.Index(
+                fields=["question"],
+                condition=models.Q(is_correct=True),
+                name="choice_answer_idx",
+            ),
+        ]
@@ -1,13 +1,16 @@
-import random
-
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
 
-from quiz_attempt.models import QuizAttempt, QuizAttemptChoice
+from quiz_attempt.models import QuizAttemptChoice, QuizAttemptQuestion
+from .content import bump_question_version
 from .models import Question, Choice
 
 
 class ChoiceSerializer(serializers.ModelSerializer):
+    # 수정 시 기존 선택지 식별 (없으면 새 선택지)
+    id = serializers.IntegerField(required=False)
+
     class Meta:
         model = Choice
         fields = ["id", "text", "is_correct"]
@@ -22,7 +25,30 @@ class QuestionSerializer(serializers.ModelSerializer):
         fields = ["id", "text", "choice"]
 
     def validate_choice(self, value):
-        correct_count = sum([1 for c in value if c.get("is_correct")])
+        # 수정 : 기존 선택지 기준 (PATCH 에서 생략한 값은 기존 값)
+        existing = {}
+        if self.instance is not None:
+            existing = {choice.id: choice for choice in self.instance.choice.all()}
+
+        choice_ids = [c["id"] for c in value if "id" in c]
+        if len(choice_ids) != len(set(choice_ids)):
+            raise serializers.ValidationError("선택지 id 가 중복되었습니다.")
+
+        unknown_ids = set(choice_ids) - existing.keys()
+        if unknown_ids:
+            raise serializers.ValidationError(
+                f"문제의 선택지가 아닙니다: {sorted(unknown_ids)}"
+            )
+        if any("id" not in c and "text" not in c for c in value):
+            raise serializers.ValidationError("새 선택지는 text 가 필요합니다.")
+
+        correct_count = sum(
+            [
+                1
+                for c in value
+                if c.get("is_correct", "id" in c and existing[c["id"]].is_correct)
+            ]
+        )
         if correct_count != 1:
             raise serializers.ValidationError("정답은 반드시 1개만 있어야 합니다.")
         return value
@@ -31,9 +57,112 @@ class QuestionSerializer(serializers.ModelSerializer):
         choices_data = validated_data.pop("choice")
         question = Question.objects.create(**validated_data)
         for choice_data in choices_data:
+            choice_data.pop("id", None)
             Choice.objects.create(question=question, **choice_data)
         return question
 
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        """
+        문제 및 선택지 수정 : 기존 선택지와 id 기준으로 비교해 바뀐 부분만 반영
+            - id 있음 -> 내용이 바뀐 선택지만 bulk_update (id 유지, 응시 기록 보존)
+            - id 없음 -> bulk_create
+            - 요청에 없는 기존 선택지 -> 삭제 (응시 기록에서 사용 중이면 거부)
+            - 문제 updated_at 갱신 (커밋 후) : 문제 내용 캐시 버전 갱신
+              (응시 스냅샷은 조회 시 버전 비교로 다시 생성)
+        """
+        choices_data = validated_data.pop("choice", None)
+
+        # 선택지만 바뀌어도 문제 수정 시간 갱신 (save -> auto_now)
+        instance = super().update(instance, validated_data)
+        if choices_data is not None:
+            self._update_choices(instance, choices_data)
+
+        transaction.on_commit(lambda: bump_question_version(instance))
+        return instance
+
+    def _update_choices(self, question, choices_data):
+        existing = {
+            choice.id: choice
+            for choice in Choice.objects.select_for_update().filter(question=question)
+        }
+
+        incoming_ids = {data["id"] for data in choices_data if "id" in data}
+        if incoming_ids - existing.keys():
+            # 검증 이후 다른 요청에서 삭제된 경우
+            raise serializers.ValidationError({"choice": "이미 삭제된 선택지입니다."})
+
+        removed_ids = existing.keys() - incoming_ids
+        if removed_ids and self._is_choice_in_use(removed_ids):
+            raise serializers.ValidationError(
+                {"choice": "응시 기록에서 사용 중인 선택지는 삭제할 수 없습니다."}
+            )
+
+        now = timezone.now()
+        changed, created = [], []
+        for data in choices_data:
+            if "id" not in data:
+                created.append(Choice(question=question, **data))
+                continue
+
+            choice = existing[data["id"]]
+            if any(getattr(choice, field) != value for field, value in data.items()):
+                for field, value in data.items():
+                    setattr(choice, field, value)
+                choice.updated_at = now
+                changed.append(choice)
+
+        if removed_ids:
+            Choice.objects.filter(id__in=removed_ids).delete()
+        if changed:
+            Choice.objects.bulk_update(changed, ["text", "is_correct", "updated_at"])
+        if created:
+            Choice.objects.bulk_create(created)
+
+        # 응답의 선택지 목록 (prefetch 캐시) 갱신
+        getattr(question, "_prefetched_objects_cache", {}).pop("choice", None)
+
+    def _is_choice_in_use(self, choice_ids) -> bool:
+        return (
+            QuizAttemptChoice.objects.filter(choice_id__in=choice_ids).exists()
+            or QuizAttemptQuestion.objects.filter(
+                selected_choice_id__in=choice_ids
+            ).exists()
+        )
+
+
+class QuestionFilterSerializer(serializers.Serializer):
+    """관리자 문제 목록 / 내보내기 필터 (쿼리 파라미터)"""
+
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    text = serializers.CharField(required=False)
+
+    def filter_queryset(self, queryset):
+        filters = self.validated_data
+        if "created_after" in filters:
+            queryset = queryset.filter(created_at__gte=filters["created_after"])
+        if "created_before" in filters:
+            queryset = queryset.filter(created_at__lt=filters["created_before"])
+        if "text" in filters:
+            queryset = queryset.filter(text__icontains=filters["text"])
+        return queryset
+
+
+class QuestionImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=["jsonl", "csv"], required=False)
+
+    def validate(self, attrs):
+        if "file_format" not in attrs:
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in ("jsonl", "csv"):
+                raise serializers.ValidationError(
+                    "file_format 을 지정하거나 .jsonl/.csv 파일을 업로드해야 합니다."
+                )
+            attrs["file_format"] = extension
+        return attrs
+
 
 class QuestionSimpleSerializer(serializers.ModelSerializer):
     class Meta:
@@ -42,46 +171,11 @@ class QuestionSimpleSerializer(serializers.ModelSerializer):
 
 
 class QuestionDetailWithChoicesSerializer(QuestionSimpleSerializer):
-    choices = serializers.SerializerMethodField()
-    is_ordered = serializers.SerializerMethodField()
+    """응시 문제 상세 : quiz_attempt.snapshots 의 스냅샷(dict) 직렬화"""
+
+    choices = ChoiceSerializer(many=True, read_only=True)
+    is_ordered = serializers.BooleanField(read_only=True)
 
     class Meta:
         model = Question
         fields = QuestionSimpleSerializer.Meta.fields + ["choices", "is_ordered"]
-
-    def _find_attempt_choices(self) -> (QuizAttemptChoice, QuizAttempt):
-        user = self.context["request"].user
-        quiz_id = self.context["request"].query_params.get("quiz_id")
-        question_id = self.context["view"].kwargs.get("question_id")
-
-        quiz_attempt = QuizAttempt.objects.get(quiz_id=quiz_id, user=user)
-        attempt_question = quiz_attempt.questions.get(question_id=question_id)
-        attempt_choices = attempt_question.choices.all()
-
-        return attempt_choices, quiz_attempt
-
-    @extend_schema_field(ChoiceSerializer(many=True))
-    def get_choices(self, obj: Question):
-        attempt_choices, quiz_attempt = self._find_attempt_choices()
-
-        # 이전에 문제 조회하여 저장된 선택지 순서가 있는 경우
-        if attempt_choices:
-            ordered_choices = [
-                attempt_choice.choice for attempt_choice in attempt_choices
-            ]
-            return ChoiceSerializer(ordered_choices, many=True).data
-
-        # 처음 문제 조회 하는 경우
-        choices = obj.choice.all()
-        is_random_choice = quiz_attempt.quiz.is_random_choice
-
-        if is_random_choice:
-            choices = list(choices)
-            random.shuffle(choices)
-
-        return ChoiceSerializer(choices, many=True).data
-
-    @extend_schema_field(serializers.BooleanField())
-    def get_is_ordered(self, obj: Question):
-        attempt_choices, _ = self._find_attempt_choices()
-        return attempt_choices.exists()
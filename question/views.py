@@ -1,10 +1,96 @@
-from rest_framework import viewsets
+import io
+import json
+
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+
+from core.paginations import (
+    CursorPaginationOptInMixin,
+    StandardResultsSetPagination,
+)
 from core.permissions import IsStaffUser
-from .models import Question
-from .serializers import QuestionSerializer
+from core.routers import ReplicaReadMixin
+from quiz.selection import invalidate_question_pool
+from .content import forget_question
+from .importers import import_questions
+from .models import Question, Choice
+from .serializers import (
+    QuestionSerializer,
+    QuestionFilterSerializer,
+    QuestionImportSerializer,
+)
 
 
-class QuestionViewSet(viewsets.ModelViewSet):
-    queryset = Question.objects.all()
+class QuestionViewSet(
+    ReplicaReadMixin, CursorPaginationOptInMixin, viewsets.ModelViewSet
+):
+    """
+    관리자 : 문제 은행 관리
+        - 목록 : 최신순 페이지네이션 (?pagination=cursor 지원), 선택지는 prefetch 1회
+        - 필터 : created_after / created_before (ISO 8601), text (부분 일치)
+    """
+
     serializer_class = QuestionSerializer
     permission_classes = [IsStaffUser]
+    pagination_class = StandardResultsSetPagination
+
+    # NDJSON 내보내기 : 서버 측 커서로 한 번에 가져오는 문제 수
+    export_chunk_size = 1000
+
+    def get_queryset(self):
+        return Question.objects.prefetch_related(
+            Prefetch("choice", queryset=Choice.objects.order_by("id"))
+        ).order_by("-created_at", "-id")
+
+    def filter_queryset(self, queryset):
+        if self.action not in ("list", "export"):
+            return queryset
+
+        filters = QuestionFilterSerializer(data=self.request.query_params)
+        filters.is_valid(raise_exception=True)
+        return filters.filter_queryset(queryset)
+
+    def perform_destroy(self, instance):
+        # 연결된 퀴즈의 출제 문제 풀 갱신
+        quiz_ids = list(instance.related_quizzes.values_list("quiz_id", flat=True))
+        question_id = instance.id
+        instance.delete()
+        forget_question(question_id)
+        for quiz_id in quiz_ids:
+            invalidate_question_pool(quiz_id)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """관리자 : 필터 조건의 문제 전체를 NDJSON 으로 스트리밍 (한 줄에 문제 1개)"""
+        queryset = self.filter_queryset(self.get_queryset())
+        # 응답 스트리밍은 view 종료 후 진행 -> 조회 DB(replica 여부)를 지금 고정
+        queryset = queryset.using(queryset.db)
+
+        def rows():
+            for question in queryset.iterator(chunk_size=self.export_chunk_size):
+                data = QuestionSerializer(question).data
+                yield json.dumps(data, ensure_ascii=False) + "\n"
+
+        return StreamingHttpResponse(rows(), content_type="application/x-ndjson")
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+        serializer_class=QuestionImportSerializer,
+    )
+    def bulk_import(self, request):
+        """관리자 : JSONL/CSV 파일로 문제 및 선택지 일괄 등록"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        uploaded_file = serializer.validated_data["file"]
+        stream = io.TextIOWrapper(uploaded_file.file, encoding="utf-8-sig", newline="")
+        result = import_questions(stream, serializer.validated_data["file_format"])
+
+        return Response(result, status=status.HTTP_201_CREATED)
@@ -0,0 +1,140 @@
+"""
+퀴즈 목록(카탈로그) 페이지 캐시
+    - 관리자 / 일반 사용자 공통 부분 (id, title, 페이지 정보) 만 캐시, 응시 현황은 요청마다 덧붙임
+    - 캐시 키 : 카탈로그 버전 + 페이지를 바꾸는 쿼리 파라미터 (CATALOG_QUERY_PARAMS)
+      호스트 / 그 외 파라미터는 키에서 제외 -> 임의 파라미터로 캐시 항목이 늘어나지 않음
+    - 이전/다음 링크는 경로로 저장, 응답 시 요청 호스트 기준 URL 로 복원
+    - 관리자 퀴즈 생성 / 수정 / 삭제 시 버전 갱신 -> 이전 버전 페이지는 만료까지 사용되지 않음
+    - 퀴즈 상세(설정)도 같은 버전 기준으로 캐시
+    - 캐시에 저장할 값은 primary 에서 조회 (버전 갱신 직후 복제 지연된 replica 값 캐시 방지)
+    - 동시 캐시 미스(응시 시작 시각 등)는 core.singleflight 로 조회 1회,
+      만료 후 QUIZ_CATALOG_STALE_TTL 동안은 이전 값 반환 + 백그라운드 갱신
+"""
+
+import hashlib
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from core.singleflight import SingleFlight
+from quiz_attempt.models import QuizAttempt
+from .models import Quiz
+
+CATALOG_VERSION_KEY = "quiz_catalog:version"
+
+# 카탈로그 페이지를 바꾸는 쿼리 파라미터 (core.paginations)
+#   page, page_size, count : StandardResultsSetPagination
+#   pagination, cursor : CursorPaginationOptInMixin / CreatedAtCursorPagination
+CATALOG_QUERY_PARAMS = ("page", "page_size", "count", "pagination", "cursor")
+PAGE_LINK_FIELDS = ("next", "previous")
+
+QUIZ_DETAIL_FIELDS = [
+    "id",
+    "title",
+    "question_count",
+    "is_random_question",
+    "is_random_choice",
+    "is_deleted",
+]
+
+catalog_flight = SingleFlight("quiz_catalog")
+
+
+def catalog_version() -> int:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(CATALOG_VERSION_KEY, version, None):
+            version = cache.get(CATALOG_VERSION_KEY, version)
+    return version
+
+
+def bump_catalog_version():
+    cache.set(CATALOG_VERSION_KEY, time.time_ns(), None)
+
+
+def _catalog_query(params) -> str:
+    """CATALOG_QUERY_PARAMS 만 이름 순으로 남긴 쿼리 문자열"""
+    return urlencode(
+        sorted((name, params[name]) for name in CATALOG_QUERY_PARAMS if name in params)
+    )
+
+
+def _page_key(request, version) -> str:
+    digest = hashlib.md5(_catalog_query(request.query_params).encode()).hexdigest()
+    return f"quiz_catalog:{version}:{digest}"
+
+
+def _relative_links(page) -> dict:
+    """이전/다음 링크 : 호스트를 빼고 카탈로그 파라미터만 남긴 경로 (캐시 저장용)"""
+    links = {}
+    for field in PAGE_LINK_FIELDS:
+        if page.get(field):
+            url = urlsplit(page[field])
+            query = _catalog_query(dict(parse_qsl(url.query)))
+            links[field] = urlunsplit(("", "", url.path, query, ""))
+    return {**page, **links}
+
+
+def _absolute_links(request, page) -> dict:
+    links = {
+        field: request.build_absolute_uri(page[field])
+        for field in PAGE_LINK_FIELDS
+        if page.get(field)
+    }
+    return {**page, **links}
+
+
+def get_catalog_page(request, build_page) -> dict:
+    """캐시된 카탈로그 페이지 조회, 없으면 build_page() 결과 저장"""
+    page = catalog_flight.get(
+        _page_key(request, catalog_version()),
+        lambda: _relative_links(build_page()),
+        settings.QUIZ_CATALOG_TIMEOUT,
+        stale_ttl=settings.QUIZ_CATALOG_STALE_TTL,
+    )
+    return _absolute_links(request, page)
+
+
+def _load_quiz_detail(quiz_id) -> dict | None:
+    quizzes = Quiz.objects.using(DEFAULT_DB_ALIAS).filter(pk=quiz_id)
+    return quizzes.values(*QUIZ_DETAIL_FIELDS).first()
+
+
+def get_quiz_detail(quiz_id) -> dict | None:
+    """퀴즈 설정 (QUIZ_DETAIL_FIELDS, 삭제된 퀴즈 포함), 없으면 None"""
+    return catalog_flight.get(
+        f"quiz_catalog:{catalog_version()}:detail:{quiz_id}",
+        lambda: _load_quiz_detail(quiz_id),
+        settings.QUIZ_CATALOG_TIMEOUT,
+        stale_ttl=settings.QUIZ_CATALOG_STALE_TTL,
+    )
+
+
+def attempt_status_rows(results, user) -> list[dict]:
+    """카탈로그 항목(id, title) + 유저의 응시 여부 / 제출 일시 / 맞은 개수 (쿼리 1회)"""
+    if not results:
+        return []
+
+    attempts = {
+        attempt["quiz_id"]: attempt
+        for attempt in QuizAttempt.objects.filter(
+            user=user, quiz_id__in=[quiz["id"] for quiz in results]
+        ).values("quiz_id", "submitted_at", "correct_count")
+    }
+
+    rows = []
+    for quiz in results:
+        attempt = attempts.get(quiz["id"])
+        rows.append(
+            {
+                **quiz,
+                "has_attempted": attempt is not None,
+                "attempt_submitted_at": attempt and attempt["submitted_at"],
+                "attempt_correct_count": attempt and attempt["correct_count"],
+            }
+        )
+    return rows
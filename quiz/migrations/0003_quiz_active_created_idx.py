@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:49
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중 테이블 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('quiz', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='quiz',
+            index=models.Index(
+                condition=models.Q(('is_deleted', False)),
+                fields=['-created_at', '-id'],
+                name='quiz_active_created_idx',
+            ),
+        ),
+    ]
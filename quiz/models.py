@@ -44,6 +44,14 @@ class Quiz(TimeStampedMixin):
         db_table = "quiz"
         verbose_name = "퀴즈"
         verbose_name_plural = "퀴즈"
+        indexes = [
+            # 퀴즈 목록 : 삭제되지 않은 퀴즈 최신순
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="quiz_active_created_idx",
+            ),
+        ]
 
 
 class QuizQuestion(TimeStampedMixin):
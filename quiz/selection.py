@@ -0,0 +1,69 @@
+import random
+from array import array
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from core.singleflight import SingleFlight
+from question.models import Question
+from .models import QuizQuestion
+
+question_pool_flight = SingleFlight("quiz_question_pool")
+
+
+def _pool_key(quiz_id) -> str:
+    return f"quiz_question_pool:{quiz_id}"
+
+
+def get_question_pool(quiz_id) -> array:
+    """퀴즈에 연결된 문제 id 목록 (id 순, 캐시, 동시 캐시 미스는 조회 1회)"""
+    # 캐시에 저장할 값 : 복제 지연된 replica 대신 primary 에서 조회
+    return question_pool_flight.get(
+        _pool_key(quiz_id),
+        lambda: array(
+            "q",
+            QuizQuestion.objects.using(DEFAULT_DB_ALIAS)
+            .filter(quiz_id=quiz_id)
+            .order_by("question_id")
+            .values_list("question_id", flat=True),
+        ),
+        settings.QUESTION_POOL_TIMEOUT,
+    )
+
+
+def invalidate_question_pool(quiz_id):
+    question_pool_flight.delete(_pool_key(quiz_id))
+
+
+def draw_question_ids(quiz, user_id) -> list[int]:
+    """
+    출제 문제 추출 : 유저/퀴즈 기준 고정 seed
+        - 같은 유저는 페이지가 달라도 같은 문제 목록
+        - 문제 랜덤 배치 X -> 문제 id 순
+    """
+    pool = get_question_pool(quiz.id)
+    rng = random.Random(f"{quiz.id}:{user_id}")
+
+    question_ids = rng.sample(pool, min(quiz.question_count, len(pool)))
+    if not quiz.is_random_question:
+        question_ids.sort()
+
+    return question_ids
+
+
+class QuestionSelection:
+    """추출한 문제 id 목록 : 페이지네이션으로 잘린 구간의 문제만 조회"""
+
+    def __init__(self, question_ids):
+        self.question_ids = question_ids
+
+    def __len__(self):
+        return len(self.question_ids)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return Question.objects.get(pk=self.question_ids[index])
+
+        question_ids = self.question_ids[index]
+        questions = Question.objects.in_bulk(question_ids)
+        return [questions[qid] for qid in question_ids if qid in questions]
@@ -1,8 +1,11 @@
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
 from question.models import Question
-from quiz_attempt.models import QuizAttempt
 from .models import Quiz, QuizQuestion
+from .selection import invalidate_question_pool
 
 
 class QuizIdTitleSerializer(serializers.ModelSerializer):
@@ -57,14 +60,18 @@ class QuizStaffDetailSerializer(BaseQuizSerializer):
 
 
 class QuizUserSerializer(QuizIdTitleSerializer):
-    has_attempted = serializers.SerializerMethodField()
+    """일반 사용자 : quiz.catalog.attempt_status_rows 로 덧붙인 응시 현황 포함"""
 
-    class Meta(QuizIdTitleSerializer.Meta):
-        fields = QuizIdTitleSerializer.Meta.fields + ["has_attempted"]
+    has_attempted = serializers.BooleanField(read_only=True)
+    attempt_submitted_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    attempt_correct_count = serializers.IntegerField(read_only=True, allow_null=True)
 
-    def get_has_attempted(self, obj):
-        user = self.context["request"].user
-        return QuizAttempt.objects.filter(quiz=obj, user=user).exists()
+    class Meta(QuizIdTitleSerializer.Meta):
+        fields = QuizIdTitleSerializer.Meta.fields + [
+            "has_attempted",
+            "attempt_submitted_at",
+            "attempt_correct_count",
+        ]
 
 
 class QuizQuestionLinkSerializer(serializers.Serializer):
@@ -72,32 +79,67 @@ class QuizQuestionLinkSerializer(serializers.Serializer):
         child=serializers.IntegerField(), allow_empty=False, write_only=True
     )
 
-    def validate_question_ids(self, value):
-        questions = Question.objects.filter(id__in=value)
-        if questions.count() != len(set(value)):
-            raise serializers.ValidationError(
-                "존재하지 않는 문제 ID가 포함되어 있습니다."
-            )
-        return value
+    def _lock_quiz(self) -> Quiz:
+        # 같은 퀴즈에 대한 동시 연결/해제 직렬화
+        return get_object_or_404(
+            Quiz.objects.select_for_update(), pk=self.context["quiz_id"]
+        )
 
     def create(self, validated_data):
-        quiz_id = self.context["quiz_id"]
-        quiz = Quiz.objects.get(pk=quiz_id)
+        question_ids = set(validated_data["question_ids"])
+
+        with transaction.atomic():
+            quiz = self._lock_quiz()
+
+            # 요청한 문제의 존재 여부와 연결 여부를 한 번에 조회
+            linked_status = dict(
+                Question.objects.filter(id__in=question_ids)
+                .annotate(
+                    is_linked=Exists(
+                        QuizQuestion.objects.filter(quiz=quiz, question=OuterRef("pk"))
+                    )
+                )
+                .values_list("id", "is_linked")
+            )
+            new_ids = sorted(
+                qid for qid, is_linked in linked_status.items() if not is_linked
+            )
 
-        question_ids = validated_data["question_ids"]
-        questions = Question.objects.filter(id__in=question_ids)
+            QuizQuestion.objects.bulk_create(
+                [QuizQuestion(quiz=quiz, question_id=qid) for qid in new_ids],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+            transaction.on_commit(lambda: invalidate_question_pool(quiz.id))
 
-        linked_questions = []
+        return {
+            "quiz_id": quiz.id,
+            "linked_questions": new_ids,
+            "already_linked_questions": sorted(
+                qid for qid, is_linked in linked_status.items() if is_linked
+            ),
+            "missing_questions": sorted(question_ids - linked_status.keys()),
+        }
 
-        for question in questions:
-            obj, created = QuizQuestion.objects.get_or_create(
-                quiz=quiz, question=question
-            )
+    def unlink(self):
+        question_ids = set(self.validated_data["question_ids"])
 
-            if not created:
-                raise serializers.ValidationError("이미 퀴즈와 연결된 문제입니다.")
+        with transaction.atomic():
+            quiz = self._lock_quiz()
 
-            if created:
-                linked_questions.append(question.id)
+            links = quiz.related_questions.filter(question_id__in=question_ids)
+            unlinked_ids = set(links.values_list("question_id", flat=True))
 
-        return {"quiz_id": quiz.id, "linked_questions": linked_questions}
+            remaining_count = quiz.related_questions.count() - len(unlinked_ids)
+            if remaining_count < quiz.question_count:
+                raise serializers.ValidationError(
+                    f"연결된 문제 수({remaining_count} 개)가 퀴즈 문제 수({quiz.question_count} 개)보다 적어집니다."
+                )
+            links.delete()
+            transaction.on_commit(lambda: invalidate_question_pool(quiz.id))
+
+        return {
+            "quiz_id": quiz.id,
+            "unlinked_questions": sorted(unlinked_ids),
+            "not_linked_questions": sorted(question_ids - unlinked_ids),
+        }
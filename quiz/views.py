@@ -1,16 +1,27 @@
-import random
-
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import Http404
 from django.utils import timezone
 from rest_framework import viewsets, generics, mixins, permissions
 from rest_framework.response import Response
 from rest_framework import status
 
 from core.permissions import IsStaffUser
-from core.paginations import StandardResultsSetPagination
+from core.routers import ReplicaReadMixin
+from core.paginations import (
+    CursorPaginationOptInMixin,
+    StandardResultsSetPagination,
+)
 from question.serializers import QuestionSimpleSerializer
 from quiz_attempt.models import QuizAttempt
 
+from .catalog import (
+    attempt_status_rows,
+    bump_catalog_version,
+    get_catalog_page,
+    get_quiz_detail,
+)
 from .models import Quiz
+from .selection import QuestionSelection, draw_question_ids
 from .serializers import (
     QuizCreateUpdateSerializer,
     QuizStaffListSerializer,
@@ -35,23 +46,66 @@ class QuizStaffViewSet(
         if self.action not in ("destroy",):
             return QuizCreateUpdateSerializer
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        transaction.on_commit(bump_catalog_version)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        transaction.on_commit(bump_catalog_version)
+
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.deleted_at = timezone.now()
         instance.save()
+        transaction.on_commit(bump_catalog_version)
 
 
 class QuizViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+    ReplicaReadMixin,
+    CursorPaginationOptInMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
 ):
-    """관리자 & 일반 사용자 : 퀴즈 목록 및 상세 조회"""
+    """
+    관리자 & 일반 사용자 : 퀴즈 목록 및 상세 조회
+        - 공통 부분(목록 페이지, 퀴즈 설정)은 카탈로그 캐시 (quiz.catalog)
+        - 일반 사용자는 응시 현황을 요청마다 조회해 추가
+    """
 
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = StandardResultsSetPagination
+    lookup_value_regex = r"\d+"
 
     def get_queryset(self):
-        queryset = Quiz.objects.filter(is_deleted=False).order_by("-created_at")
-        return queryset
+        return Quiz.objects.filter(is_deleted=False).order_by("-created_at")
+
+    def list(self, request, *args, **kwargs):
+        data = get_catalog_page(request, self._build_catalog_page)
+
+        if not request.user.is_staff:
+            rows = attempt_status_rows(data["results"], request.user)
+            data = {**data, "results": QuizUserSerializer(rows, many=True).data}
+        return Response(data)
+
+    def _build_catalog_page(self) -> dict:
+        # 캐시에 저장할 값 : 복제 지연된 replica 대신 primary 에서 조회
+        queryset = self.filter_queryset(self.get_queryset()).using(DEFAULT_DB_ALIAS)
+        page = self.paginate_queryset(queryset)
+        serializer = QuizStaffListSerializer(page, many=True)
+        return dict(self.get_paginated_response(serializer.data).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        quiz = get_quiz_detail(int(kwargs["pk"]))
+        if quiz is None or quiz["is_deleted"]:
+            raise Http404
+
+        if request.user.is_staff:
+            return Response(QuizStaffDetailSerializer(quiz).data)
+
+        row = attempt_status_rows([quiz], request.user)[0]
+        return Response(QuizUserSerializer(row).data)
 
     def get_serializer_class(self):
         user = self.request.user
@@ -62,7 +116,7 @@ class QuizViewSet(
 
 
 class QuizQuestionLinkAPIView(generics.CreateAPIView):
-    """관리자 : 퀴즈-문제 연결"""
+    """관리자 : 퀴즈-문제 연결(POST) & 연결 해제(DELETE)"""
 
     serializer_class = QuizQuestionLinkSerializer
     permission_classes = [IsStaffUser]
@@ -78,8 +132,14 @@ class QuizQuestionLinkAPIView(generics.CreateAPIView):
         result = serializer.save()
         return Response(result, status=status.HTTP_201_CREATED)
 
+    def delete(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = serializer.unlink()
+        return Response(result, status=status.HTTP_200_OK)
 
-class QuizQuestionListAPIView(generics.ListAPIView):
+
+class QuizQuestionListAPIView(ReplicaReadMixin, generics.ListAPIView):
     """관리자 & 일반 사용자 : 퀴즈 문제 목록 조회"""
 
     serializer_class = QuestionSimpleSerializer
@@ -87,7 +147,11 @@ class QuizQuestionListAPIView(generics.ListAPIView):
 
     def get_queryset(self):
         quiz_id = self.kwargs["quiz_id"]
-        quiz = Quiz.objects.get(pk=quiz_id)
+        quiz_detail = get_quiz_detail(quiz_id)
+        if quiz_detail is None:
+            raise Http404
+        # 캐시된 퀴즈 설정 (DB 조회 X)
+        quiz = Quiz(**quiz_detail)
         user = self.request.user
 
         # 1. 퀴즈 응시한 경우 -> 저장한 문제 순서
@@ -100,17 +164,5 @@ class QuizQuestionListAPIView(generics.ListAPIView):
             ).order_by("order_index")
             return [aq.question for aq in attempt_questions]
 
-        # 2. 퀴즈 응시하지 않은 경우 -> 랜덤 출제
-        related_questions = list(
-            quiz.related_questions.select_related("question").all()
-        )
-        question_count = quiz.question_count
-
-        # 퀴즈 출제 문제 랜덤 추출
-        selected_questions = random.sample(related_questions, question_count)
-
-        # 문제 랜덤 정렬
-        if quiz.is_random_question:
-            random.shuffle(selected_questions)
-
-        return [quiz_question.question for quiz_question in selected_questions]
+        # 2. 퀴즈 응시하지 않은 경우 -> 캐시된 문제 id 에서 유저/퀴즈 기준 고정 추출
+        return QuestionSelection(draw_question_ids(quiz, user.id))
@@ -0,0 +1,148 @@
+"""
+퀴즈 응시 흐름 async view (ASGI 서버에서 실행)
+    - 응시 시작, 문제 상세, 고른 선택지 저장, 제출
+    - 조회는 async ORM / 비동기 캐시, 트랜잭션이 필요한 저장은 기존 serializer 를 스레드에서 실행
+      (async ORM 은 트랜잭션 미지원)
+"""
+
+import functools
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from rest_framework import exceptions, status
+
+from core.authentication import AsyncJWTAuthentication
+from question.serializers import QuestionDetailWithChoicesSerializer
+from .models import QuizAttempt
+from .serializers import (
+    QuizAttemptCreateSerializer,
+    QuizAttemptChoiceUpdateSerializer,
+    QuizSubmissionSerializer,
+)
+from .snapshots import aget_attempt_question
+
+_authentication = AsyncJWTAuthentication()
+
+
+def _error_response(request, exc: exceptions.APIException) -> JsonResponse:
+    """DRF 예외 응답과 같은 형식"""
+    if isinstance(exc.detail, (list, dict)):
+        data = exc.detail
+    else:
+        data = {"detail": exc.detail}
+
+    response = JsonResponse(data, status=exc.status_code, safe=False)
+    if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+        response["WWW-Authenticate"] = _authentication.authenticate_header(request)
+    return response
+
+
+def _parse_json(request) -> dict:
+    if not request.body:
+        return {}
+    try:
+        return json.loads(request.body)
+    except json.JSONDecodeError as e:
+        raise exceptions.ParseError(f"JSON 형식 오류: {e.msg}")
+
+
+def async_api_view(view):
+    """
+    async view 공통 처리
+        - JWT 인증 (미인증 401), JSON body -> request.data
+        - DRF 예외 / Http404 -> DRF 와 같은 형식의 JSON 응답
+    """
+
+    @csrf_exempt
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            auth = await _authentication.aauthenticate(request)
+            if auth is None:
+                raise exceptions.NotAuthenticated()
+            request.user = auth[0]
+            request.data = _parse_json(request)
+
+            return await view(request, *args, **kwargs)
+        except Http404:
+            return _error_response(request, exceptions.NotFound())
+        except exceptions.APIException as exc:
+            return _error_response(request, exc)
+
+    return wrapper
+
+
+def _require_quiz_id(request) -> int:
+    quiz_id = request.GET.get("quiz_id", None)
+
+    if not quiz_id:
+        raise exceptions.ValidationError("quiz_id 쿼리 파라미터가 필요합니다.")
+    # isdigit 은 '²', '①' 등도 허용 -> ASCII 0-9 만
+    if not (quiz_id.isascii() and quiz_id.isdecimal()):
+        raise exceptions.ValidationError("quiz_id는 숫자여야 합니다.")
+    return int(quiz_id)
+
+
+@require_http_methods(["POST"])
+@async_api_view
+async def attempt_start(request):
+    """퀴즈 응시 (QuizAttemptAPIView 와 동일)"""
+
+    def start():
+        serializer = QuizAttemptCreateSerializer(
+            data=request.data, context={"request": request}
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return serializer.data, serializer.created
+
+    data, created = await sync_to_async(start)()
+
+    # 제출 전 기존 응시가 있으면 해당 응시 반환 (200)
+    status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    return JsonResponse(data, status=status_code)
+
+
+@require_http_methods(["GET"])
+@async_api_view
+async def attempt_question_detail(request, question_id):
+    """퀴즈 출제 문제 상세 조회 (QuizAttemptQuestionDetailAPIView 와 동일)"""
+    quiz_id = _require_quiz_id(request)
+
+    question = await aget_attempt_question(quiz_id, request.user.id, question_id)
+    if question is None:
+        raise Http404
+    return JsonResponse(QuestionDetailWithChoicesSerializer(question).data)
+
+
+@require_http_methods(["PUT"])
+@async_api_view
+async def attempt_choice(request):
+    """고른 선택지 저장 (QuizAttemptChoiceAPIView.put 과 동일)"""
+    serializer = QuizAttemptChoiceUpdateSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    await sync_to_async(serializer.select)(request.user)
+    return JsonResponse(serializer.data)
+
+
+@require_http_methods(["PUT"])
+@async_api_view
+async def quiz_submission(request):
+    """퀴즈 제출 (QuizSubmissionAPIView 와 동일)"""
+    quiz_id = _require_quiz_id(request)
+
+    quiz_attempt = await QuizAttempt.objects.filter(
+        user=request.user, quiz_id=quiz_id
+    ).afirst()
+    if quiz_attempt is None:
+        raise Http404
+
+    serializer = QuizSubmissionSerializer(quiz_attempt, data=request.data)
+    serializer.is_valid(raise_exception=True)
+    await sync_to_async(serializer.save)()
+
+    return JsonResponse(serializer.data)
@@ -0,0 +1,62 @@
+import os
+import threading
+
+from django.db import connections
+
+ATTEMPT_CODE_SEQUENCE = "quiz_attempt_code_seq"
+
+# Crockford base32 (혼동되는 I, L, O, U 제외)
+CODE_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+CODE_LENGTH = 7
+CODE_SPACE = len(CODE_ALPHABET) ** CODE_LENGTH  # 2^35
+
+# 연속된 순번이 비슷한 코드가 되지 않도록 섞는 값 (홀수 -> CODE_SPACE 내 1:1 대응)
+CODE_MULTIPLIER = 0x2545F491
+CODE_OFFSET = 0x1B873593
+
+
+def encode_attempt_code(number: int) -> str:
+    """순번 -> 7자리 응시 코드 (순번이 다르면 코드도 항상 다름)"""
+    value = (number * CODE_MULTIPLIER + CODE_OFFSET) % CODE_SPACE
+
+    chars = []
+    for _ in range(CODE_LENGTH):
+        value, remainder = divmod(value, len(CODE_ALPHABET))
+        chars.append(CODE_ALPHABET[remainder])
+    return "".join(reversed(chars))
+
+
+class AttemptCodeAllocator:
+    """
+    응시 코드 발급기
+        - DB 시퀀스 번호를 block_size 개씩 한 번에 확보 (코드 중복 조회 없음)
+        - fork 된 프로세스는 부모가 확보한 번호를 버리고 새로 확보
+    """
+
+    def __init__(self, block_size=100, using="default"):
+        self.block_size = block_size
+        self.using = using
+        self._lock = threading.Lock()
+        self._numbers = iter(())
+        self._pid = None
+
+    def next_code(self) -> str:
+        with self._lock:
+            number = next(self._numbers, None) if self._pid == os.getpid() else None
+            if number is None:
+                self._numbers = iter(self._claim_block())
+                self._pid = os.getpid()
+                number = next(self._numbers)
+
+        return encode_attempt_code(number)
+
+    def _claim_block(self) -> list[int]:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(%s) FROM generate_series(1, %s)",
+                [ATTEMPT_CODE_SEQUENCE, self.block_size],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+attempt_code_allocator = AttemptCodeAllocator()
@@ -0,0 +1,67 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from question.content import get_answer_keys
+from .models import QuizAttempt, QuizAttemptQuestion
+
+
+def grade_attempts(attempt_ids, refresh=False) -> dict[int, int]:
+    """
+    응시 일괄 채점 : 응시/문제 수와 관계없이 쿼리 2회 (정답은 question.content 캐시)
+        1. 응시 문제의 (문제, 선택한 선택지) 조회 (채점 중 선택 변경 방지 : 행 잠금)
+        2. 선택한 선택지(selected_choice)가 정답인지로 QuizAttemptQuestion.is_correct 일괄 갱신
+        - 맞은 문제 개수는 1 의 결과로 집계
+        - refresh : 정답을 캐시가 아닌 DB 에서 다시 읽음 (재채점)
+    """
+    attempt_ids = list(attempt_ids)
+
+    attempt_questions = QuizAttemptQuestion.objects.filter(attempt_id__in=attempt_ids)
+    rows = list(
+        attempt_questions.select_for_update().values_list(
+            "attempt_id", "question_id", "selected_choice_id"
+        )
+    )
+    answer_keys = get_answer_keys({question_id for _, question_id, _ in rows}, refresh)
+    answer_ids = [answer_id for answer_id in answer_keys.values() if answer_id]
+
+    attempt_questions.update(
+        is_correct=Case(
+            When(selected_choice_id__in=answer_ids, then=Value(True)),
+            default=Value(False),
+        ),
+        updated_at=timezone.now(),
+    )
+
+    correct_counts = Counter(
+        attempt_id
+        for attempt_id, question_id, selected_choice_id in rows
+        if selected_choice_id is not None
+        and selected_choice_id == answer_keys.get(question_id)
+    )
+    return {attempt_id: correct_counts[attempt_id] for attempt_id in attempt_ids}
+
+
+def regrade_attempts(queryset, batch_size=500) -> int:
+    """제출 완료된 응시 재채점 (정답 변경 등), batch_size 단위로 트랜잭션 분리"""
+    attempt_ids = list(
+        queryset.filter(submitted_at__isnull=False)
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+    for start in range(0, len(attempt_ids), batch_size):
+        batch_ids = attempt_ids[start : start + batch_size]
+        with transaction.atomic():
+            correct_counts = grade_attempts(batch_ids, refresh=True)
+            QuizAttempt.objects.bulk_update(
+                [
+                    QuizAttempt(id=attempt_id, correct_count=correct_count)
+                    for attempt_id, correct_count in correct_counts.items()
+                ],
+                ["correct_count"],
+            )
+
+    return len(attempt_ids)
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Subquery
+
+from quiz_attempt.models import QuizAttemptQuestion, QuizAttemptChoice
+
+
+class Command(BaseCommand):
+    help = (
+        "응시 문제의 선택한 선택지(selected_choice)를 선택지 행(is_selected) 기준으로 채움"
+        " - id 순 batch 단위 트랜잭션, 이미 채워진 문제는 건너뜀"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        selected_choices = QuizAttemptChoice.objects.filter(
+            attempt_question=OuterRef("pk"), is_selected=True
+        )
+        pending = QuizAttemptQuestion.objects.filter(
+            Exists(selected_choices), selected_choice__isnull=True
+        )
+
+        last_id = 0
+        backfilled_count = 0
+        while True:
+            batch_ids = list(
+                pending.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[: options["batch_size"]]
+            )
+            if not batch_ids:
+                break
+
+            with transaction.atomic():
+                backfilled_count += QuizAttemptQuestion.objects.filter(
+                    id__in=batch_ids, selected_choice__isnull=True
+                ).update(
+                    selected_choice_id=Subquery(
+                        selected_choices.values("choice_id")[:1]
+                    )
+                )
+            last_id = batch_ids[-1]
+            self.stdout.write(f"{backfilled_count}건 처리 (id <= {last_id})")
+
+        self.stdout.write(self.style.SUCCESS(f"{backfilled_count}건 채움 완료"))
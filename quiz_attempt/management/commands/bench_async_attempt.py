@@ -0,0 +1,269 @@
+import http.client
+import json
+import socket
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.management.commands.runprod import Command as RunProdCommand
+from question.models import Question, Choice
+from quiz.models import Quiz, QuizQuestion
+
+# 응시 흐름 (sync view 이름, async view 이름)
+URL_NAMES = {
+    "start": ("quiz-attempt", "async-quiz-attempt"),
+    "question": ("quiz-attempt-question", "async-quiz-attempt-question"),
+    "choice": ("attempt-choice", "async-attempt-choice"),
+    "submission": ("quiz-submission", "async-quiz-submission"),
+}
+
+# 서버 구성 : (ASGI 여부, async view 사용 여부, 설명)
+MODES = {
+    "wsgi": (False, False, "gunicorn sync/gthread + sync view"),
+    "asgi": (True, True, "gunicorn + uvicorn worker + async view"),
+    "asgi-sync": (True, False, "gunicorn + uvicorn worker + sync view"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "응시 흐름(응시 시작 -> 문제 조회/선택지 저장 -> 제출) 서버 구성별 비교"
+        " - runprod 와 같은 설정으로 gunicorn 을 실제로 띄우고 (WSGI / ASGI + uvicorn 워커)"
+        " HTTP 로 동시 응시자 N명을 시뮬레이션, 생성한 데이터는 측정 후 삭제"
+        " - 부하 생성기는 이 프로세스의 스레드 (--concurrency) 이므로 서버와 같은 장비에서는"
+        " 워커 수를 CPU 수보다 적게 두고 비교"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--examinees", type=int, default=1000, help="응시자 수")
+        parser.add_argument("--questions", type=int, default=5, help="퀴즈 문제 수")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="동시 접속 수 (클라이언트 스레드, 기본 : 응시자 수 -> 전원 동시 응시)",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=2, help="서버 워커 프로세스 수"
+        )
+        parser.add_argument(
+            "--threads", type=int, default=1, help="WSGI 워커당 스레드 수 (gthread)"
+        )
+        parser.add_argument(
+            "--modes",
+            nargs="+",
+            choices=list(MODES),
+            default=["wsgi", "asgi"],
+            help="비교할 서버 구성",
+        )
+        parser.add_argument(
+            "--startup-timeout", type=float, default=30, help="서버 기동 대기(초)"
+        )
+
+    def handle(self, *args, **options):
+        if options["examinees"] < 1 or options["questions"] < 1:
+            raise CommandError("--examinees, --questions 는 1 이상이어야 합니다.")
+        if options["concurrency"] is None:
+            options["concurrency"] = options["examinees"]
+
+        prefix = f"bench_async_{uuid.uuid4().hex[:8]}"
+        results = {}
+        try:
+            tokens, answers, quiz_ids = self._setup(
+                prefix, options["examinees"], options["questions"], options["modes"]
+            )
+            for mode in options["modes"]:
+                results[mode] = self._bench_mode(
+                    mode, quiz_ids[mode], tokens, answers, options
+                )
+        finally:
+            self._cleanup(prefix)
+
+        self.stdout.write(
+            f"응시자 {options['examinees']}명, 문제 {options['questions']}개, "
+            f"동시 접속 {options['concurrency']}, 워커 {options['workers']}개"
+        )
+        for mode, (latencies, elapsed) in results.items():
+            self._report(f"{mode:<10} ({MODES[mode][2]})", latencies, elapsed)
+
+    def _bench_mode(self, mode, quiz_id, tokens, answers, options):
+        is_asgi, is_async, _ = MODES[mode]
+        port = self._free_port()
+        with tempfile.TemporaryFile() as server_log:
+            server = self._start_server(port, is_asgi, options, server_log)
+            try:
+                self._wait_ready(server, port, options["startup_timeout"], server_log)
+                local = threading.local()
+
+                def examinee(token):
+                    if not hasattr(local, "connection"):
+                        local.connection = http.client.HTTPConnection(
+                            "127.0.0.1", port, timeout=120
+                        )
+                    return self._examinee(
+                        local.connection, quiz_id, token, answers, is_async
+                    )
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+                    latencies = sum(executor.map(examinee, tokens), [])
+                return latencies, time.perf_counter() - started
+            finally:
+                self._stop_server(server)
+
+    def _start_server(self, port, is_asgi, options, server_log):
+        """runprod 와 같은 gunicorn 설정 (preload + 워밍업), 워커 재시작 X"""
+        runprod = RunProdCommand()
+        server_options = {
+            "bind": f"127.0.0.1:{port}",
+            "workers": options["workers"],
+            "threads": options["threads"],
+            "max_requests": 0,
+            "asgi": is_asgi,
+        }
+        env = runprod.gunicorn_env(server_options)
+        # 동시 응시자 수만큼 DB 연결이 열리지 않도록 워커별 연결 풀 사용
+        # (ASGI 는 요청마다 다른 스레드에서 ORM 실행, 동시 요청이 많아 풀 대기 여유)
+        env.update(
+            DB_POOL="true",
+            DB_POOL_TIMEOUT="60",
+            ATTEMPT_SEEDED_ORDER="true",
+            ALLOWED_HOSTS="127.0.0.1",
+            WEB_LOG_LEVEL="warning",
+        )
+        return subprocess.Popen(
+            runprod.gunicorn_argv(server_options),
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,  # 접근 로그
+            stderr=server_log,
+        )
+
+    def _wait_ready(self, server, port, timeout, server_log):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                server_log.seek(0)
+                raise CommandError(
+                    "서버 기동 실패\n" + server_log.read().decode(errors="replace")
+                )
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                connection.request("GET", "/")
+                connection.getresponse().read()
+                connection.close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError(f"서버가 {timeout}초 안에 응답하지 않습니다.")
+
+    def _stop_server(self, server):
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+    def _free_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _setup(self, prefix, examinees, question_count, modes):
+        users = User.objects.bulk_create(
+            [User(username=f"{prefix}_{i}") for i in range(examinees)], batch_size=1000
+        )
+        questions = Question.objects.bulk_create(
+            [Question(text=f"{prefix} 문제 {i}") for i in range(question_count)]
+        )
+        choices = Choice.objects.bulk_create(
+            [
+                Choice(question=question, text=f"선택지 {i}", is_correct=i == 0)
+                for question in questions
+                for i in range(4)
+            ]
+        )
+
+        # 서버 구성마다 퀴즈를 따로 만들어 같은 응시자가 구성별로 1번씩 응시
+        quizzes = {
+            mode: Quiz.objects.create(
+                title=f"{prefix} {mode}",
+                creator=users[0],
+                question_count=question_count,
+                is_random_question=True,
+                is_random_choice=True,
+            )
+            for mode in modes
+        }
+        QuizQuestion.objects.bulk_create(
+            [
+                QuizQuestion(quiz=quiz, question=question)
+                for quiz in quizzes.values()
+                for question in questions
+            ]
+        )
+
+        tokens = [str(AccessToken.for_user(user)) for user in users]
+        answers = {choice.question_id: choice.id for choice in choices[::4]}
+        return tokens, answers, {mode: quiz.id for mode, quiz in quizzes.items()}
+
+    def _cleanup(self, prefix):
+        Quiz.objects.filter(title__startswith=prefix).delete()
+        Question.objects.filter(text__startswith=prefix).delete()
+        User.objects.filter(username__startswith=prefix).delete()
+
+    def _requests(self, quiz_id, answers, is_async):
+        """응시자 1명의 요청 목록 : (method, url, json body)"""
+        name = {key: names[is_async] for key, names in URL_NAMES.items()}
+        yield "POST", reverse(name["start"]), {"quiz_id": quiz_id}
+        for question_id, choice_id in answers.items():
+            url = reverse(name["question"], kwargs={"question_id": question_id})
+            yield "GET", f"{url}?quiz_id={quiz_id}", None
+            body = {
+                "quiz_id": quiz_id,
+                "question_id": question_id,
+                "selected_choice_id": choice_id,
+            }
+            yield "PUT", reverse(name["choice"]), body
+        yield "PUT", f"{reverse(name['submission'])}?quiz_id={quiz_id}", None
+
+    def _examinee(self, connection, quiz_id, token, answers, is_async) -> list[float]:
+        headers = {"Authorization": f"Bearer {token}"}
+        latencies = []
+        for method, url, body in self._requests(quiz_id, answers, is_async):
+            started = time.perf_counter()
+            if body is None:
+                connection.request(method, url, headers=headers)
+            else:
+                connection.request(
+                    method,
+                    url,
+                    body=json.dumps(body),
+                    headers={**headers, "Content-Type": "application/json"},
+                )
+            response = connection.getresponse()
+            content = response.read()
+            latencies.append(time.perf_counter() - started)
+            if response.status >= 400:
+                raise CommandError(f"{method} {url} -> {response.status} {content!r}")
+        return latencies
+
+    def _report(self, label, latencies, elapsed):
+        latencies = sorted(latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        self.stdout.write(
+            f"{label:<56} {len(latencies) / elapsed:>9.1f} req/s  "
+            f"p50 {statistics.median(latencies) * 1000:>8.1f} ms  "
+            f"p95 {p95 * 1000:>8.1f} ms  total {elapsed:>6.2f} s"
+        )
@@ -0,0 +1,111 @@
+import time
+
+import shortuuid
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from quiz.models import Quiz
+from quiz_attempt.codes import AttemptCodeAllocator
+from quiz_attempt.models import QuizAttempt
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _legacy_code():
+    """기존 방식 : 랜덤 5자리 코드"""
+    return shortuuid.ShortUUID().random(length=5).upper()
+
+
+class Command(BaseCommand):
+    help = (
+        "응시 코드 발급 방식별 INSERT 비용 측정 (quiz_attempt 테이블 크기별)"
+        " - 모든 데이터는 측정 후 롤백"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=200_000, help="최대 테이블 크기"
+        )
+        parser.add_argument("--step", type=int, default=50_000, help="측정 간격")
+        parser.add_argument(
+            "--sample", type=int, default=1000, help="측정 시점별 단건 INSERT 수"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options["rows"], options["step"], options["sample"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, rows, step, sample):
+        allocator = AttemptCodeAllocator(block_size=1000)
+        users = iter(self._create_users(rows + sample * 2 * (rows // step + 1) + 1))
+        quiz = Quiz.objects.create(
+            title="bench_attempt_code", question_count=0, creator_id=next(users)
+        )
+
+        self.stdout.write(
+            f"{'rows':>10} {'sequence ms/insert':>20} "
+            f"{'legacy ms/insert':>18} {'legacy collisions':>18}"
+        )
+        size = 0
+        while True:
+            sequence_ms, _ = self._measure(
+                sample, lambda: self._insert(quiz, next(users), allocator.next_code())
+            )
+            legacy_ms, collisions = self._measure(
+                sample, lambda: self._insert_legacy(quiz, next(users))
+            )
+            size += sample * 2
+            self.stdout.write(
+                f"{size:>10} {sequence_ms:>20.3f} {legacy_ms:>18.3f} {collisions:>18}"
+            )
+            if size >= rows:
+                break
+
+            # 다음 측정 시점까지 테이블 채우기
+            QuizAttempt.objects.bulk_create(
+                [
+                    QuizAttempt(
+                        quiz=quiz,
+                        user_id=next(users),
+                        attempt_code=allocator.next_code(),
+                    )
+                    for _ in range(step)
+                ],
+                batch_size=5000,
+            )
+            size += step
+
+    def _create_users(self, count):
+        users = User.objects.bulk_create(
+            [User(username=f"bench_attempt_code_{i}") for i in range(count)],
+            batch_size=5000,
+        )
+        return [user.id for user in users]
+
+    def _measure(self, sample, insert):
+        collisions = 0
+        started = time.perf_counter()
+        for _ in range(sample):
+            collisions += insert()
+        return (time.perf_counter() - started) * 1000 / sample, collisions
+
+    def _insert(self, quiz, user_id, code):
+        QuizAttempt.objects.create(quiz=quiz, user_id=user_id, attempt_code=code)
+        return 0
+
+    def _insert_legacy(self, quiz, user_id):
+        """중복 조회 후 재시도 (read-before-write)"""
+        collisions = 0
+        code = _legacy_code()
+        while QuizAttempt.objects.filter(attempt_code=code).exists():
+            collisions += 1
+            code = _legacy_code()
+        QuizAttempt.objects.create(quiz=quiz, user_id=user_id, attempt_code=code)
+        return collisions
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from quiz_attempt.grading import regrade_attempts
+from quiz_attempt.models import QuizAttempt
+
+
+class Command(BaseCommand):
+    help = "제출 완료된 퀴즈 응시 일괄 재채점"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--quiz-id", type=int, help="재채점할 퀴즈 id (미지정 시 전체)"
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = QuizAttempt.objects.all()
+        if options["quiz_id"]:
+            queryset = queryset.filter(quiz_id=options["quiz_id"])
+
+        regraded_count = regrade_attempts(queryset, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{regraded_count}건 재채점 완료"))
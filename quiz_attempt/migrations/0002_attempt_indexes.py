@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:49
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중 테이블 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY)
+    atomic = False
+
+    dependencies = [
+        ('quiz_attempt', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='quizattemptchoice',
+            index=models.Index(
+                fields=['attempt_question', 'order_index'],
+                name='attempt_choice_order_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='quizattemptchoice',
+            index=models.Index(
+                condition=models.Q(('is_selected', True)),
+                fields=['attempt_question'],
+                name='attempt_choice_selected_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='quizattemptquestion',
+            index=models.Index(
+                fields=['attempt', 'order_index'], name='attempt_question_order_idx'
+            ),
+        ),
+    ]
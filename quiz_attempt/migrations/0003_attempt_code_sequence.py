@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+import quiz_attempt.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_attempt', '0002_attempt_indexes'),
+    ]
+
+    operations = [
+        # 응시 코드 발급용 시퀀스 (quiz_attempt.codes.AttemptCodeAllocator)
+        migrations.RunSQL(
+            sql="CREATE SEQUENCE IF NOT EXISTS quiz_attempt_code_seq",
+            reverse_sql="DROP SEQUENCE IF EXISTS quiz_attempt_code_seq",
+        ),
+        migrations.AlterField(
+            model_name='quizattempt',
+            name='attempt_code',
+            field=models.CharField(
+                default=quiz_attempt.models.generate_quiz_attempt_code,
+                max_length=7,
+                unique=True,
+                verbose_name='퀴즈 응시 코드',
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:57
+
+import core.constraints
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_attempt', '0003_attempt_code_sequence'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='quizattemptchoice',
+            name='attempt_choice_selected_idx',
+        ),
+        # 응시 문제당 선택한 선택지 최대 1개 (한 UPDATE 문으로 선택 이동 가능하도록 DEFERRABLE)
+        migrations.AddConstraint(
+            model_name='quizattemptchoice',
+            constraint=core.constraints.UniqueWhereConstraint(
+                condition=models.Q(('is_selected', True)),
+                fields=('attempt_question',),
+                name='attempt_choice_single_selected',
+            ),
+        ),
+    ]
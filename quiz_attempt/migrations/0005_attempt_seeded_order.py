@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_attempt', '0004_attempt_choice_single_selected'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizattempt',
+            name='is_seeded_order',
+            field=models.BooleanField(
+                default=False, verbose_name='선택지 순서 seed 계산 여부'
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중 테이블 잠금 없이 인덱스 생성 (CREATE INDEX CONCURRENTLY)
+    # 기존 응시의 선택한 선택지는 0009 마이그레이션 (또는 backfill_selected_choice 명령) 으로 채움
+    atomic = False
+
+    dependencies = [
+        ('question', '0002_choice_indexes'),
+        ('quiz_attempt', '0005_attempt_seeded_order'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.AddField(
+                    model_name='quizattemptquestion',
+                    name='selected_choice',
+                    field=models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name='selected_attempt_questions',
+                        to='question.choice',
+                        verbose_name='선택한 선택지',
+                    ),
+                ),
+                migrations.RunSQL(
+                    sql=(
+                        'CREATE INDEX CONCURRENTLY IF NOT EXISTS '
+                        '"quiz_attempt_question_selected_choice_id_e01a07f1" '
+                        'ON "quiz_attempt_question" ("selected_choice_id")'
+                    ),
+                    reverse_sql=(
+                        'DROP INDEX CONCURRENTLY IF EXISTS '
+                        '"quiz_attempt_question_selected_choice_id_e01a07f1"'
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name='quizattemptquestion',
+                    name='selected_choice',
+                    field=models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name='selected_attempt_questions',
+                        to='question.choice',
+                        verbose_name='선택한 선택지',
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz_attempt', '0006_attempt_question_selected_choice'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='quizattempt',
+            name='attempt_code',
+            field=models.CharField(
+                max_length=7, unique=True, verbose_name='퀴즈 응시 코드'
+            ),
+        ),
+    ]
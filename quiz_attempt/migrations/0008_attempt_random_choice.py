@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 기존 응시는 현재 퀴즈 설정으로 채움
+
+    dependencies = [
+        ('quiz_attempt', '0007_attempt_code_no_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizattempt',
+            name='is_random_choice',
+            field=models.BooleanField(
+                default=False, verbose_name='응시 시점의 선택지 랜덤 배치 여부'
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                'UPDATE "quiz_attempt" SET "is_random_choice" = "quiz"."is_random_choice" '
+                'FROM "quiz" WHERE "quiz"."id" = "quiz_attempt"."quiz_id"'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:20
+
+from django.db import migrations, transaction
+from django.db.models import Exists, OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def backfill_selected_choice(apps, schema_editor):
+    """
+    기존 응시 문제의 선택한 선택지(selected_choice)를 선택지 행(is_selected) 기준으로 채움
+        - 채점은 selected_choice 만 사용 -> 채우지 않으면 기존 응시 재채점 시 0점
+        - id 순 batch 단위 트랜잭션 (backfill_selected_choice 명령과 동일)
+    """
+    QuizAttemptQuestion = apps.get_model('quiz_attempt', 'QuizAttemptQuestion')
+    QuizAttemptChoice = apps.get_model('quiz_attempt', 'QuizAttemptChoice')
+
+    selected_choices = QuizAttemptChoice.objects.filter(
+        attempt_question=OuterRef('pk'), is_selected=True
+    )
+    pending = QuizAttemptQuestion.objects.filter(
+        Exists(selected_choices), selected_choice__isnull=True
+    )
+
+    last_id = 0
+    while True:
+        batch_ids = list(
+            pending.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:BATCH_SIZE]
+        )
+        if not batch_ids:
+            break
+
+        with transaction.atomic():
+            QuizAttemptQuestion.objects.filter(
+                id__in=batch_ids, selected_choice__isnull=True
+            ).update(
+                selected_choice_id=Subquery(selected_choices.values('choice_id')[:1])
+            )
+        last_id = batch_ids[-1]
+
+
+class Migration(migrations.Migration):
+    # batch 단위로 커밋 (전체 테이블을 한 트랜잭션으로 잠그지 않음)
+    atomic = False
+
+    dependencies = [
+        ('quiz_attempt', '0008_attempt_random_choice'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_selected_choice, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,16 @@
-import shortuuid
-
 from django.db import models
 from django.contrib.auth.models import User
 
+from core.constraints import UniqueWhereConstraint
 from core.models import TimeStampedMixin
 from question.models import Question, Choice
 from quiz.models import Quiz
+from .codes import attempt_code_allocator
 
 
 def generate_quiz_attempt_code():
-    """퀴즈 응시 코드 생성"""
-    return shortuuid.ShortUUID().random(length=5).upper()
+    """퀴즈 응시 코드 생성 (DB 시퀀스 기반, 중복 없음)"""
+    return attempt_code_allocator.next_code()
 
 
 class QuizAttempt(models.Model):
@@ -33,6 +33,12 @@ class QuizAttempt(models.Model):
     submitted_at = models.DateTimeField(
         null=True, blank=True, verbose_name="퀴즈 제출 일시"
     )
+    is_seeded_order = models.BooleanField(
+        default=False, verbose_name="선택지 순서 seed 계산 여부"
+    )
+    is_random_choice = models.BooleanField(
+        default=False, verbose_name="응시 시점의 선택지 랜덤 배치 여부"
+    )
     question = models.ManyToManyField(
         Question,
         through="quiz_attempt.QuizAttemptQuestion",
@@ -42,6 +48,12 @@ class QuizAttempt(models.Model):
     def __str__(self):
         return f"{self.attempt_code} - {self.user.username}"
 
+    def save(self, *args, **kwargs):
+        # 응시 코드는 INSERT 시에만 발급 (bulk_update 용 객체 생성 시 시퀀스 소모 방지)
+        if self._state.adding and not self.attempt_code:
+            self.attempt_code = generate_quiz_attempt_code()
+        super().save(*args, **kwargs)
+
     class Meta:
         unique_together = ("user", "quiz")
         db_table = "quiz_attempt"
@@ -57,6 +69,14 @@ class QuizAttemptQuestion(TimeStampedMixin):
         Question, on_delete=models.CASCADE, related_name="attempt_questions"
     )
     order_index = models.PositiveIntegerField(verbose_name="응시 시점의 문제 순서")
+    selected_choice = models.ForeignKey(
+        Choice,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="selected_attempt_questions",
+        verbose_name="선택한 선택지",
+    )
     is_correct = models.BooleanField(default=False, verbose_name="정답 여부")
 
     def __str__(self):
@@ -67,6 +87,12 @@ class QuizAttemptQuestion(TimeStampedMixin):
         db_table = "quiz_attempt_question"
         verbose_name = "퀴즈 출제 문제"
         verbose_name_plural = "퀴즈 출제 문제"
+        indexes = [
+            # 응시 문제 순서대로 조회
+            models.Index(
+                fields=["attempt", "order_index"], name="attempt_question_order_idx"
+            ),
+        ]
 
 
 class QuizAttemptChoice(TimeStampedMixin):
@@ -88,3 +114,18 @@ class QuizAttemptChoice(TimeStampedMixin):
         verbose_name = "퀴즈 응시 선택지"
         verbose_name_plural = "퀴즈 응시 선택지"
         unique_together = ("attempt_question", "choice")
+        indexes = [
+            # 선택지 순서대로 조회
+            models.Index(
+                fields=["attempt_question", "order_index"],
+                name="attempt_choice_order_idx",
+            ),
+        ]
+        constraints = [
+            # 응시 문제당 선택한 선택지는 최대 1개 (유저가 선택한 선택지 조회에도 사용)
+            UniqueWhereConstraint(
+                fields=["attempt_question"],
+                condition=models.Q(is_selected=True),
+                name="attempt_choice_single_selected",
+            ),
+        ]
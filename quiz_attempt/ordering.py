@@ -0,0 +1,22 @@
+import hashlib
+
+
+def _choice_sort_key(quiz_attempt, question_id, choice_id) -> bytes:
+    seed = f"{quiz_attempt.attempt_code}:{question_id}:{choice_id}"
+    return hashlib.md5(seed.encode()).digest()
+
+
+def seeded_choices(quiz_attempt, question_id, choices) -> list:
+    """
+    seed 기반 선택지 순서 : 응시 코드 + 문제 id + 선택지 id 로 정한 정렬 키 순
+        - 같은 응시는 언제 조회해도 같은 순서 (저장 불필요)
+        - 선택지 랜덤 배치 여부는 응시 시점 값 (이후 퀴즈 설정 변경 영향 X)
+        - 응시 중 선택지 추가 / 삭제 : 남은 선택지끼리의 순서는 유지, 새 선택지만 끼어듦
+        - 선택지 랜덤 배치 X -> choices 순서 그대로 (선택지 id 순)
+    """
+    choices = list(choices)
+    if quiz_attempt.is_random_choice:
+        choices.sort(
+            key=lambda choice: _choice_sort_key(quiz_attempt, question_id, choice["id"])
+        )
+    return choices
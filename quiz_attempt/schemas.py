@@ -3,14 +3,19 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
 from rest_framework import status
 from question.serializers import QuestionDetailWithChoicesSerializer
-from .serializers import QuizSubmissionSerializer
+from .serializers import (
+    QuizAttemptAnswersSerializer,
+    QuizAttemptSheetSerializer,
+    QuizSubmissionSerializer,
+)
 
 ATTEMPT_QUIZ_CREATE_SCHEMA = extend_schema(
     tags=['퀴즈 응시'],
     summary='퀴즈 응시',
     description="""
         - 퀴즈 응시 내역 저장
-        - 퀴즈 응시 시점의 문제 배치 저장
+        - 퀴즈 응시 시점의 문제 배치 저장 (서버에서 출제 문제 추출)
+        - 제출 전 응시 이력이 있으면 기존 응시 반환 (200)
     """,
 )
 ATTEMPT_QUESTION_SCHEMA = extend_schema(
@@ -45,16 +50,50 @@ ATTEMPT_QUESTION_SCHEMA = extend_schema(
         )
     },
 )
+ATTEMPT_SHEET_SCHEMA = extend_schema(
+    tags=['퀴즈 응시'],
+    summary='퀴즈 응시 전체 조회',
+    description="""
+        - 출제 문제 순서, 문제별 선택지 순서, 선택한 선택지를 한 번에 조회
+        - 선택지 순서가 저장되지 않은 문제는 조회 시점에 순서 저장
+    """,
+    parameters=[
+        OpenApiParameter(
+            name='quiz_id',
+            description='퀴즈 id',
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+            required=True,
+        ),
+    ],
+)
+ATTEMPT_ANSWERS_SCHEMA = extend_schema(
+    tags=['퀴즈 응시'],
+    summary='고른 선택지 일괄 저장',
+    description="""
+        - answers : {문제 id: 고른 선택지 id} (재연결 시 쌓인 선택을 한 번에 저장)
+        - 선택 여부가 바뀐 선택지만 저장
+        - 선택지 순서가 저장된 문제만 선택 가능 (seed 기반 응시 제외), 제출된 퀴즈는 변경 불가 (400)
+        - response : 퀴즈 응시 전체 조회와 동일
+    """,
+    request=QuizAttemptAnswersSerializer,
+    responses={status.HTTP_200_OK: QuizAttemptSheetSerializer},
+)
 SAVE_CHOICE_ORDER_SCHEMA = extend_schema(
     tags=['퀴즈 응시'],
     summary='선택지 순서 저장',
     description="""
         - 퀴즈 문제 풀이 response 중 is_ordered=false 이면 해당 API 호출
+        - seed 기반 응시는 선택지 순서를 저장하지 않음 (항상 is_ordered=true)
     """,
 )
 SELECTED_CHOICE_SCHEMA = extend_schema(
     tags=['퀴즈 응시'],
     summary='문제 풀이 중 유저가 선택한 정답',
+    description="""
+        - 선택지 순서가 저장된 문제만 선택 가능 (선택지 순서 저장 API 선행, seed 기반 응시 제외)
+        - 제출된 퀴즈는 변경 불가 (400)
+    """,
 )
 ATTEMPT_CHOICE_SCHEMA_View = extend_schema_view(
     post=SAVE_CHOICE_ORDER_SCHEMA,
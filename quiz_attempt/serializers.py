@@ -1,22 +1,28 @@
+from psycopg.errors import ForeignKeyViolation, UniqueViolation
 from rest_framework import serializers
 
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, Exists, OuterRef, Q, Value, When
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
-from quiz.models import Quiz
-from question.models import Question, Choice
+from quiz.models import Quiz, QuizQuestion
+from quiz.selection import draw_question_ids, invalidate_question_pool
+from question.content import get_question_content, get_question_contents
+from question.models import Choice
+from question.serializers import ChoiceSerializer
 from .models import (
     QuizAttempt,
     QuizAttemptQuestion,
     QuizAttemptChoice,
     generate_quiz_attempt_code,
 )
+from .grading import grade_attempts
+from .snapshots import invalidate_attempt_snapshot
 
 
 class QuizAttemptCreateSerializer(serializers.ModelSerializer):
     quiz_id = serializers.IntegerField()
-    question_ids = serializers.ListField(
-        child=serializers.IntegerField(), write_only=True
-    )
 
     class Meta:
         model = QuizAttempt
@@ -25,59 +31,87 @@ class QuizAttemptCreateSerializer(serializers.ModelSerializer):
             "quiz_id",
             "user_id",
             "attempt_code",
-            "question_ids",
             "attempt_question_count",
         ]
         read_only_fields = ["id", "user_id", "attempt_code", "attempt_question_count"]
 
     def validate(self, attrs):
-        quiz_id = attrs.get("quiz_id")
-        user = self.context["request"].user
-
-        # 1. 퀴즈 확인
-        try:
-            quiz = Quiz.objects.get(id=quiz_id)
-        except Quiz.DoesNotExist:
+        # 퀴즈 확인
+        quiz = Quiz.objects.filter(id=attrs["quiz_id"]).first()
+        if quiz is None:
             raise serializers.ValidationError("존재하지 않는 퀴즈입니다.")
 
         if quiz.is_deleted:
             raise serializers.ValidationError("삭제된 퀴즈에는 응시할 수 없습니다.")
 
-        # 2. 퀴즈 응시 여부 확인
-        if QuizAttempt.objects.filter(user=user, quiz_id=quiz_id).exists():
-            raise serializers.ValidationError("이미 응시한 퀴즈입니다.")
-
+        attrs["quiz"] = quiz
         return attrs
 
     def create(self, validated_data):
-        quiz_id = validated_data.pop("quiz_id")
-        question_ids = validated_data.pop("question_ids")
+        quiz = validated_data["quiz"]
         user = self.context["request"].user
 
-        quiz = get_object_or_404(Quiz, id=quiz_id)
-        questions = Question.objects.filter(id__in=question_ids)
-
-        # 응시 객체 생성
-        attempt = QuizAttempt.objects.create(
-            quiz=quiz,
-            user=user,
-            attempt_code=generate_quiz_attempt_code(),
-            attempt_question_count=quiz.question_count,
-        )
-
-        # 출제된 문제 저장 (순서 보존)
-        attempt_questions = []
-        for idx, question in enumerate(questions):
-            attempt_questions.append(
-                QuizAttemptQuestion(
-                    attempt=attempt, question=question, order_index=idx + 1
+        try:
+            # 응시 및 출제 문제 순서 저장을 한 트랜잭션으로 처리
+            with transaction.atomic():
+                question_ids = self._draw_question_ids(quiz, user)
+                attempt = QuizAttempt.objects.create(
+                    quiz=quiz,
+                    user=user,
+                    attempt_code=generate_quiz_attempt_code(),
+                    attempt_question_count=len(question_ids),
+                    is_seeded_order=settings.ATTEMPT_SEEDED_ORDER,
+                    is_random_choice=quiz.is_random_choice,
                 )
-            )
+                QuizAttemptQuestion.objects.bulk_create(
+                    [
+                        QuizAttemptQuestion(
+                            attempt=attempt,
+                            question_id=question_id,
+                            order_index=idx + 1,
+                        )
+                        for idx, question_id in enumerate(question_ids)
+                    ]
+                )
+        except IntegrityError as error:
+            if isinstance(error.__cause__, ForeignKeyViolation):
+                # 검증 이후 출제 문제가 삭제된 경우 (커밋 시점 FK 검사)
+                invalidate_question_pool(quiz.id)
+                raise serializers.ValidationError(
+                    "퀴즈의 문제가 변경되었습니다. 다시 응시해 주세요."
+                )
+
+            # 중복 응시 (동시 요청 포함) : unique(user, quiz) 위반만 해당
+            attempt = QuizAttempt.objects.filter(user=user, quiz=quiz).first()
+            if not isinstance(error.__cause__, UniqueViolation) or attempt is None:
+                raise
+            if attempt.submitted_at:
+                raise serializers.ValidationError("이미 응시한 퀴즈입니다.")
 
-        QuizAttemptQuestion.objects.bulk_create(attempt_questions)
+            # 제출 전 응시는 기존 응시 그대로 반환
+            self.created = False
+            return attempt
 
+        self.created = True
         return attempt
 
+    def _draw_question_ids(self, quiz, user) -> list[int]:
+        """
+        출제 문제 서버에서 추출 (퀴즈 문제 목록 조회와 같은 결과)
+            - 캐시된 문제 풀에 연결 해제 / 삭제된 문제가 있으면 풀을 갱신해 다시 추출
+        """
+        question_ids = draw_question_ids(quiz, user.id)
+        linked_count = QuizQuestion.objects.filter(
+            quiz=quiz, question_id__in=question_ids
+        ).count()
+        if linked_count != len(question_ids):
+            invalidate_question_pool(quiz.id)
+            question_ids = draw_question_ids(quiz, user.id)
+
+        if len(question_ids) < quiz.question_count:
+            raise serializers.ValidationError("퀴즈에 연결된 문제 수가 부족합니다.")
+        return question_ids
+
 
 class QuizAttemptChoiceCreateSerializer(serializers.Serializer):
     quiz_id = serializers.IntegerField(write_only=True)
@@ -90,10 +124,9 @@ class QuizAttemptChoiceCreateSerializer(serializers.Serializer):
         question_id = attrs["question_id"]
         choice_ids = attrs["choice_ids"]
 
-        # 문제에 포함된 선택지 여부 확인
-        valid_ids = list(
-            Choice.objects.filter(question_id=question_id).values_list("id", flat=True)
-        )
+        # 문제에 포함된 선택지 여부 확인 (문제 내용 캐시)
+        content = get_question_content(question_id)
+        valid_ids = [choice["id"] for choice in content["choices"]] if content else []
         invalid_ids = set(choice_ids) - set(valid_ids)
         if invalid_ids:
             raise serializers.ValidationError(f"유효하지 않은 choice id: {invalid_ids}")
@@ -109,6 +142,10 @@ class QuizAttemptChoiceCreateSerializer(serializers.Serializer):
         quiz_attempt = get_object_or_404(QuizAttempt, user=user, quiz_id=quiz_id)
         attempt_question = quiz_attempt.questions.get(question_id=question_id)
 
+        # seed 기반 응시 : 선택지 순서는 조회 시 계산 (저장 X)
+        if quiz_attempt.is_seeded_order:
+            return []
+
         quiz_attempt_choice = QuizAttemptChoice.objects.filter(
             attempt_question=attempt_question
         )
@@ -125,7 +162,10 @@ class QuizAttemptChoiceCreateSerializer(serializers.Serializer):
             for idx, choice_id in enumerate(choice_ids)
         ]
 
-        return QuizAttemptChoice.objects.bulk_create(saved_choice)
+        saved_choice = QuizAttemptChoice.objects.bulk_create(saved_choice)
+        invalidate_attempt_snapshot(quiz_id, user.id)
+
+        return saved_choice
 
 
 class QuizAttemptChoiceUpdateSerializer(serializers.Serializer):
@@ -133,10 +173,182 @@ class QuizAttemptChoiceUpdateSerializer(serializers.Serializer):
     question_id = serializers.IntegerField(write_only=True)
     selected_choice_id = serializers.IntegerField(write_only=True)
 
-    def update(self, instance, validated_data):
-        instance.is_selected = True
-        instance.save()
-        return instance
+    def select(self, user):
+        """
+        고른 선택지 저장 : 응시 문제의 selected_choice 갱신
+            - 선택지 순서 저장 응시 : 저장된 선택지만 선택 가능, 선택지 행 is_selected 동기화
+            - seed 기반 응시 : 문제의 선택지면 선택 가능 (선택지 행 없음)
+            - 제출된 응시 / 문제에 없는 선택지는 갱신 대상에서 제외
+            - 응시 행 잠금 후 갱신 : 제출(채점)이 끝난 뒤 선택이 바뀌지 않도록
+        """
+        quiz_id = self.validated_data["quiz_id"]
+        question_id = self.validated_data["question_id"]
+        selected_choice_id = self.validated_data["selected_choice_id"]
+
+        now = timezone.now()
+        with transaction.atomic():
+            # 응시 행 잠금 : 제출(채점)과 순서 보장 (제출된 응시는 제외)
+            attempt = (
+                QuizAttempt.objects.select_for_update()
+                .filter(user=user, quiz_id=quiz_id, submitted_at__isnull=True)
+                .values("id", "is_seeded_order")
+                .first()
+            )
+            if attempt is None:
+                self._raise_selection_error(user, quiz_id)
+
+            if attempt["is_seeded_order"]:
+                selectable = Exists(
+                    Choice.objects.filter(
+                        id=selected_choice_id, question_id=OuterRef("question_id")
+                    )
+                )
+            else:
+                selectable = Exists(
+                    QuizAttemptChoice.objects.filter(
+                        attempt_question=OuterRef("pk"), choice_id=selected_choice_id
+                    )
+                )
+
+            updated_count = (
+                QuizAttemptQuestion.objects.filter(
+                    attempt_id=attempt["id"], question_id=question_id
+                )
+                .filter(selectable)
+                .update(selected_choice_id=selected_choice_id, updated_at=now)
+            )
+            if not updated_count:
+                self._raise_selection_error(user, quiz_id)
+
+            # is_selected = (choice_id = 고른 선택지), 기존 선택 및 고른 선택지 행만 갱신
+            QuizAttemptChoice.objects.filter(
+                attempt_question__attempt_id=attempt["id"],
+                attempt_question__question_id=question_id,
+            ).filter(Q(is_selected=True) | Q(choice_id=selected_choice_id)).update(
+                is_selected=Case(
+                    When(choice_id=selected_choice_id, then=Value(True)),
+                    default=Value(False),
+                ),
+                updated_at=now,
+            )
+
+    def _raise_selection_error(self, user, quiz_id):
+        """갱신된 행이 없는 경우 원인 확인 (실패 시에만 조회)"""
+        quiz_attempt = get_object_or_404(QuizAttempt, user=user, quiz_id=quiz_id)
+        if quiz_attempt.submitted_at:
+            raise serializers.ValidationError("이미 제출된 퀴즈입니다.")
+        raise serializers.ValidationError(
+            {"selected_choice_id": "응시 중인 문제의 선택지가 아닙니다."}
+        )
+
+
+class QuizAttemptAnswersSerializer(serializers.Serializer):
+    quiz_id = serializers.IntegerField(write_only=True)
+    answers = serializers.DictField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        write_only=True,
+        help_text="{문제 id: 고른 선택지 id}",
+    )
+
+    def validate_answers(self, value):
+        if not all(
+            str(question_id).isascii() and str(question_id).isdecimal()
+            for question_id in value
+        ):
+            raise serializers.ValidationError("문제 id는 숫자여야 합니다.")
+        return {int(question_id): choice_id for question_id, choice_id in value.items()}
+
+    def save_answers(self, user) -> QuizAttempt:
+        """
+        고른 선택지 일괄 저장 (트랜잭션 1개)
+            - 선택한 선택지가 바뀌는 응시 문제만 bulk_update
+            - 선택지 순서 저장 응시는 선택지 행 is_selected 동기화
+            - 응시 행 잠금 : 제출과 동시에 저장되지 않도록
+        """
+        answers = self.validated_data["answers"]
+
+        with transaction.atomic():
+            quiz_attempt = get_object_or_404(
+                QuizAttempt.objects.select_for_update(),
+                user=user,
+                quiz_id=self.validated_data["quiz_id"],
+            )
+            if quiz_attempt.submitted_at:
+                raise serializers.ValidationError("이미 제출된 퀴즈입니다.")
+
+            attempt_questions = quiz_attempt.questions.filter(question_id__in=answers)
+            if not quiz_attempt.is_seeded_order:
+                attempt_questions = attempt_questions.prefetch_related("choices")
+            attempt_questions = {aq.question_id: aq for aq in attempt_questions}
+            self._validate_pairs(
+                answers, self._valid_pairs(quiz_attempt, attempt_questions)
+            )
+
+            now = timezone.now()
+            changed = []
+            for question_id, choice_id in answers.items():
+                attempt_question = attempt_questions[question_id]
+                if attempt_question.selected_choice_id != choice_id:
+                    attempt_question.selected_choice_id = choice_id
+                    attempt_question.updated_at = now
+                    changed.append(attempt_question)
+
+            QuizAttemptQuestion.objects.bulk_update(
+                changed, ["selected_choice", "updated_at"], batch_size=500
+            )
+            if not quiz_attempt.is_seeded_order:
+                self._sync_attempt_choices(attempt_questions.values(), now)
+
+        return quiz_attempt
+
+    def _valid_pairs(self, quiz_attempt, attempt_questions) -> set:
+        """선택 가능한 (문제 id, 선택지 id)"""
+        if quiz_attempt.is_seeded_order:
+            return {
+                (question_id, choice["id"])
+                for question_id, content in get_question_contents(
+                    attempt_questions
+                ).items()
+                for choice in content["choices"]
+            }
+        return {
+            (attempt_question.question_id, attempt_choice.choice_id)
+            for attempt_question in attempt_questions.values()
+            for attempt_choice in attempt_question.choices.all()
+        }
+
+    def _validate_pairs(self, answers, valid_pairs):
+        errors = {
+            question_id: "응시 중인 문제의 선택지가 아닙니다."
+            for question_id, choice_id in answers.items()
+            if (question_id, choice_id) not in valid_pairs
+        }
+        if errors:
+            raise serializers.ValidationError({"answers": errors})
+
+    def _sync_attempt_choices(self, attempt_questions, now):
+        """선택지 행 is_selected 를 응시 문제의 selected_choice 와 일치시킴 (바뀐 행만)"""
+        changed = []
+        for attempt_question in attempt_questions:
+            for attempt_choice in attempt_question.choices.all():
+                is_selected = (
+                    attempt_choice.choice_id == attempt_question.selected_choice_id
+                )
+                if attempt_choice.is_selected != is_selected:
+                    attempt_choice.is_selected = is_selected
+                    attempt_choice.updated_at = now
+                    changed.append(attempt_choice)
+
+        if changed:
+            # 선택 해제/선택 행이 다른 batch 로 나뉘어도 커밋 시점에 검사
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET CONSTRAINTS attempt_choice_single_selected DEFERRED"
+                )
+            QuizAttemptChoice.objects.bulk_update(
+                changed, ["is_selected", "updated_at"], batch_size=500
+            )
 
 
 class QuizSubmissionSerializer(serializers.ModelSerializer):
@@ -146,26 +358,40 @@ class QuizSubmissionSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "correct_count", "submitted_at"]
 
     def update(self, instance: QuizAttempt, validated_data):
-        if instance.submitted_at:
-            raise serializers.ValidationError("이미 제출된 퀴즈입니다.")
+        with transaction.atomic():
+            # 응시 행 잠금 후 제출 여부 확인 : 답안 저장 / 중복 제출과 순서 보장
+            instance.submitted_at = (
+                QuizAttempt.objects.select_for_update()
+                .values_list("submitted_at", flat=True)
+                .get(pk=instance.pk)
+            )
+            if instance.submitted_at:
+                raise serializers.ValidationError("이미 제출된 퀴즈입니다.")
 
-        correct_count = 0
-        for attempt_question in instance.questions.all():
-            # 선택된 선택지를 가져옴
-            selected_choice = attempt_question.choices.filter(is_selected=True).first()
+            # 정답 여부 일괄 채점
+            correct_count = grade_attempts([instance.id])[instance.id]
 
-            if selected_choice:
-                # 정답 여부 판별
-                is_correct = selected_choice and selected_choice.choice.is_correct
-                attempt_question.is_correct = is_correct
-                attempt_question.save()
+            # 정답 개수, 제출 시간 기록
+            instance.correct_count = correct_count
+            instance.submitted_at = timezone.now()
+            instance.save(update_fields=["correct_count", "submitted_at"])
 
-                if is_correct:
-                    correct_count += 1
+        return instance
 
-        # 정답 개수, 제출 시간 기록
-        instance.correct_count = correct_count
-        instance.submitted_at = timezone.now()
-        instance.save()
 
-        return instance
+class AttemptSheetQuestionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    order_index = serializers.IntegerField()
+    choices = ChoiceSerializer(many=True)
+    selected_choice_id = serializers.IntegerField(allow_null=True)
+
+
+class QuizAttemptSheetSerializer(serializers.Serializer):
+    """응시 전체 문제 풀이 현황 : quiz_attempt.snapshots.build_attempt_sheet 결과 직렬화"""
+
+    attempt_id = serializers.IntegerField()
+    attempt_code = serializers.CharField()
+    quiz_id = serializers.IntegerField()
+    submitted_at = serializers.DateTimeField(allow_null=True)
+    questions = AttemptSheetQuestionSerializer(many=True)
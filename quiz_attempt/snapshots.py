@@ -0,0 +1,265 @@
+import random
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Prefetch
+
+from question.content import get_question_contents, get_question_versions
+from .models import QuizAttempt, QuizAttemptChoice
+from .ordering import seeded_choices
+
+
+def _snapshot_cache():
+    return caches["attempt_snapshot"]
+
+
+def _snapshot_key(quiz_id, user_id) -> str:
+    return f"attempt_snapshot:{quiz_id}:{user_id}"
+
+
+def attempt_questions_with_choices(quiz_attempt):
+    """
+    응시 문제 + 저장된 선택지 순서 (문제 수와 관계없이 쿼리 2회)
+        - 문제 내용 / 선택지는 question.content 캐시에서 조회
+    """
+    return quiz_attempt.questions.prefetch_related(
+        Prefetch("choices", queryset=QuizAttemptChoice.objects.order_by("order_index"))
+    ).order_by("order_index")
+
+
+def _ordered_choices(quiz_attempt, attempt_question, content) -> tuple[list, bool]:
+    """
+    응시 문제의 선택지({id, text}) 순서, 순서 확정 여부
+        - seed 기반 응시 -> seed 로 계산한 순서 (항상 확정)
+        - 선택지 순서 저장 O -> 저장된 순서
+        - 선택지 순서 저장 X -> 선택지 id 순 (미확정)
+    """
+    question_choices = content["choices"]
+    if quiz_attempt.is_seeded_order:
+        return (
+            seeded_choices(
+                quiz_attempt, attempt_question.question_id, question_choices
+            ),
+            True,
+        )
+
+    choices_by_id = {choice["id"]: choice for choice in question_choices}
+    ordered_choices = [
+        choices_by_id[attempt_choice.choice_id]
+        for attempt_choice in attempt_question.choices.all()
+        if attempt_choice.choice_id in choices_by_id
+    ]
+    if ordered_choices:
+        return ordered_choices, True
+    return list(question_choices), False
+
+
+def build_attempt_snapshot(quiz_id, user_id) -> dict | None:
+    """
+    응시한 퀴즈의 문제 및 선택지(저장된 순서) 스냅샷 생성, 응시 이력 없으면 None
+        - 문제별 내용 버전 포함 : 조회 시 현재 버전과 비교 (관리자 수정 / 삭제 반영)
+    """
+    quiz_attempt = QuizAttempt.objects.filter(quiz_id=quiz_id, user_id=user_id).first()
+    if quiz_attempt is None:
+        return None
+
+    attempt_questions = list(attempt_questions_with_choices(quiz_attempt))
+    contents = get_question_contents(aq.question_id for aq in attempt_questions)
+
+    questions = {}
+    for attempt_question in attempt_questions:
+        content = contents.get(attempt_question.question_id)
+        if content is None:
+            continue
+
+        choices, is_ordered = _ordered_choices(quiz_attempt, attempt_question, content)
+        questions[attempt_question.question_id] = {
+            "id": attempt_question.question_id,
+            "text": content["text"],
+            "choices": choices,
+            "is_ordered": is_ordered,
+            "version": content["version"],
+        }
+
+    return {
+        "attempt_id": quiz_attempt.id,
+        "is_random_choice": quiz_attempt.is_random_choice,
+        "questions": questions,
+    }
+
+
+def _is_current(snapshot, question_ids) -> bool:
+    """스냅샷에 담긴 문제 내용 버전이 현재 버전과 같은지 (수정 / 삭제된 문제 있으면 False)"""
+    questions = snapshot["questions"]
+    question_ids = [qid for qid in question_ids if qid in questions]
+    versions = get_question_versions(question_ids)
+    return all(versions.get(qid) == questions[qid]["version"] for qid in question_ids)
+
+
+def get_attempt_snapshot(quiz_id, user_id, question_ids=None) -> dict | None:
+    """
+    캐시된 스냅샷 조회, 없거나 문제 내용 버전이 바뀌었으면 생성 후 캐시에 저장
+        - question_ids : 버전을 확인할 문제 (기본 : 스냅샷의 모든 문제)
+    """
+    key = _snapshot_key(quiz_id, user_id)
+    snapshot = _snapshot_cache().get(key)
+
+    if snapshot is not None and not _is_current(
+        snapshot, question_ids or snapshot["questions"]
+    ):
+        snapshot = None
+
+    if snapshot is None:
+        snapshot = build_attempt_snapshot(quiz_id, user_id)
+        if snapshot is not None:
+            _snapshot_cache().set(key, snapshot)
+
+    return snapshot
+
+
+async def aget_attempt_snapshot(quiz_id, user_id, question_ids=None) -> dict | None:
+    """get_attempt_snapshot 비동기 버전 (캐시 조회/저장 비동기, 버전 확인 / 생성은 스레드에서 실행)"""
+    key = _snapshot_key(quiz_id, user_id)
+    snapshot = await _snapshot_cache().aget(key)
+
+    if snapshot is not None and not await sync_to_async(_is_current)(
+        snapshot, question_ids or snapshot["questions"]
+    ):
+        snapshot = None
+
+    if snapshot is None:
+        snapshot = await sync_to_async(build_attempt_snapshot)(quiz_id, user_id)
+        if snapshot is not None:
+            await _snapshot_cache().aset(key, snapshot)
+
+    return snapshot
+
+
+def invalidate_attempt_snapshot(quiz_id, user_id):
+    _snapshot_cache().delete(_snapshot_key(quiz_id, user_id))
+
+
+def _pick_question(snapshot, question_id) -> dict | None:
+    if snapshot is None:
+        return None
+
+    question = snapshot["questions"].get(question_id)
+    if question is None:
+        return None
+
+    if not question["is_ordered"] and snapshot["is_random_choice"]:
+        choices = list(question["choices"])
+        random.shuffle(choices)
+        question = {**question, "choices": choices}
+
+    return question
+
+
+def get_attempt_question(quiz_id, user_id, question_id) -> dict | None:
+    """
+    응시 문제 상세 (스냅샷 기준)
+        - 선택지 순서 저장 O -> 저장된 순서
+        - 선택지 순서 저장 X -> 퀴즈 설정에 따라 랜덤 정렬
+    """
+    snapshot = get_attempt_snapshot(quiz_id, user_id, [question_id])
+    return _pick_question(snapshot, question_id)
+
+
+async def aget_attempt_question(quiz_id, user_id, question_id) -> dict | None:
+    """get_attempt_question 비동기 버전"""
+    snapshot = await aget_attempt_snapshot(quiz_id, user_id, [question_id])
+    return _pick_question(snapshot, question_id)
+
+
+def _save_choice_orders(quiz_attempt, new_attempt_choices, unordered_questions):
+    """
+    선택지 순서 일괄 저장 : 응시 행 잠금 후 저장
+        - 동시 요청이 먼저 저장한 문제는 그 순서를 따름 (덮어쓰지 않음)
+    """
+    saved_orders = defaultdict(list)
+    with transaction.atomic():
+        QuizAttempt.objects.select_for_update().values_list("pk", flat=True).get(
+            pk=quiz_attempt.pk
+        )
+        for attempt_question_id, choice_id in (
+            QuizAttemptChoice.objects.filter(
+                attempt_question_id__in=unordered_questions
+            )
+            .order_by("order_index")
+            .values_list("attempt_question_id", "choice_id")
+        ):
+            saved_orders[attempt_question_id].append(choice_id)
+
+        QuizAttemptChoice.objects.bulk_create(
+            [
+                attempt_choice
+                for attempt_choice in new_attempt_choices
+                if attempt_choice.attempt_question_id not in saved_orders
+            ]
+        )
+
+    for attempt_question_id, choice_ids in saved_orders.items():
+        question = unordered_questions[attempt_question_id]
+        choices_by_id = {choice["id"]: choice for choice in question["choices"]}
+        question["choices"] = [
+            choices_by_id[choice_id]
+            for choice_id in choice_ids
+            if choice_id in choices_by_id
+        ]
+
+
+def build_attempt_sheet(quiz_attempt) -> dict:
+    """
+    응시 전체 문제 풀이 현황 (문제 순서, 선택지 순서, 선택한 선택지)
+        - 선택지 순서가 저장되지 않은 문제는 순서를 정해 일괄 저장 (seed 기반 응시 제외)
+    """
+    questions = []
+    new_attempt_choices = []
+    unordered_questions = {}
+
+    attempt_questions = list(attempt_questions_with_choices(quiz_attempt))
+    contents = get_question_contents(aq.question_id for aq in attempt_questions)
+
+    for attempt_question in attempt_questions:
+        content = contents.get(attempt_question.question_id)
+        if content is None:
+            continue
+
+        choices, is_ordered = _ordered_choices(quiz_attempt, attempt_question, content)
+
+        if not is_ordered:
+            if quiz_attempt.is_random_choice:
+                random.shuffle(choices)
+            new_attempt_choices += [
+                QuizAttemptChoice(
+                    attempt_question=attempt_question,
+                    choice_id=choice["id"],
+                    order_index=idx + 1,
+                )
+                for idx, choice in enumerate(choices)
+            ]
+
+        question = {
+            "id": attempt_question.question_id,
+            "text": content["text"],
+            "order_index": attempt_question.order_index,
+            "choices": choices,
+            "selected_choice_id": attempt_question.selected_choice_id,
+        }
+        questions.append(question)
+        if not is_ordered:
+            unordered_questions[attempt_question.id] = question
+
+    if new_attempt_choices:
+        _save_choice_orders(quiz_attempt, new_attempt_choices, unordered_questions)
+        invalidate_attempt_snapshot(quiz_attempt.quiz_id, quiz_attempt.user_id)
+
+    return {
+        "attempt_id": quiz_attempt.id,
+        "attempt_code": quiz_attempt.attempt_code,
+        "quiz_id": quiz_attempt.quiz_id,
+        "submitted_at": quiz_attempt.submitted_at,
+        "questions": questions,
+    }
@@ -1,9 +1,12 @@
 from django.urls import path
 
+from . import async_views
 from .views import (
     QuizAttemptAPIView,
     QuizAttemptQuestionDetailAPIView,
     QuizAttemptChoiceAPIView,
+    QuizAttemptAnswersAPIView,
+    QuizAttemptSheetAPIView,
     QuizSubmissionAPIView,
 )
 
@@ -14,6 +17,21 @@ urlpatterns = [
         QuizAttemptQuestionDetailAPIView.as_view(),
         name="quiz-attempt-question",
     ),
+    path("sheet/", QuizAttemptSheetAPIView.as_view(), name="quiz-attempt-sheet"),
     path("choice/", QuizAttemptChoiceAPIView.as_view(), name="attempt-choice"),
+    path("answers/", QuizAttemptAnswersAPIView.as_view(), name="attempt-answers"),
     path("submission/", QuizSubmissionAPIView.as_view(), name="quiz-submission"),
+    # ASGI 서버용 async 응시 흐름
+    path("async/", async_views.attempt_start, name="async-quiz-attempt"),
+    path(
+        "async/question/<int:question_id>/",
+        async_views.attempt_question_detail,
+        name="async-quiz-attempt-question",
+    ),
+    path("async/choice/", async_views.attempt_choice, name="async-attempt-choice"),
+    path(
+        "async/submission/",
+        async_views.quiz_submission,
+        name="async-quiz-submission",
+    ),
 ]
@@ -2,21 +2,26 @@ from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 
 from rest_framework.exceptions import ValidationError
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from question.serializers import QuestionDetailWithChoicesSerializer
-from quiz.models import QuizQuestion
 from .serializers import (
     QuizAttemptCreateSerializer,
     QuizAttemptChoiceCreateSerializer,
     QuizAttemptChoiceUpdateSerializer,
+    QuizAttemptAnswersSerializer,
     QuizSubmissionSerializer,
+    QuizAttemptSheetSerializer,
 )
 from .models import QuizAttempt
+from .snapshots import build_attempt_sheet, get_attempt_question
 from .schemas import (
     ATTEMPT_QUIZ_CREATE_SCHEMA,
     ATTEMPT_QUESTION_SCHEMA,
+    ATTEMPT_SHEET_SCHEMA,
     ATTEMPT_CHOICE_SCHEMA_View,
+    ATTEMPT_ANSWERS_SCHEMA,
     QUIZ_SUBMISSION_SCHEMA_View,
 )
 
@@ -28,6 +33,17 @@ class QuizAttemptAPIView(generics.CreateAPIView):
     serializer_class = QuizAttemptCreateSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        # 제출 전 기존 응시가 있으면 해당 응시 반환 (200)
+        status_code = (
+            status.HTTP_201_CREATED if serializer.created else status.HTTP_200_OK
+        )
+        return Response(serializer.data, status=status_code)
+
 
 @ATTEMPT_QUESTION_SCHEMA
 class QuizAttemptQuestionDetailAPIView(generics.RetrieveAPIView):
@@ -42,11 +58,38 @@ class QuizAttemptQuestionDetailAPIView(generics.RetrieveAPIView):
 
         if not quiz_id:
             raise ValidationError("quiz_id 쿼리 파라미터가 필요합니다.")
+        # isdigit 은 '²', '①' 등도 허용 -> ASCII 0-9 만
+        if not (quiz_id.isascii() and quiz_id.isdecimal()):
+            raise ValidationError("quiz_id는 숫자여야 합니다.")
+
+        # 응시 스냅샷(캐시)에서 문제 및 선택지 조회
+        question = get_attempt_question(int(quiz_id), self.request.user.id, question_id)
+        if question is None:
+            raise Http404
+        return question
+
+
+@ATTEMPT_SHEET_SCHEMA
+class QuizAttemptSheetAPIView(generics.RetrieveAPIView):
+    """응시 전체 문제 및 선택지 순서, 선택한 선택지 조회"""
+
+    serializer_class = QuizAttemptSheetSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_object(self):
+        quiz_id = self.request.query_params.get("quiz_id", None)
+
+        if not quiz_id:
+            raise ValidationError("quiz_id 쿼리 파라미터가 필요합니다.")
+        if not (quiz_id.isascii() and quiz_id.isdecimal()):
+            raise ValidationError("quiz_id는 숫자여야 합니다.")
 
-        quiz_question = get_object_or_404(
-            QuizQuestion, quiz_id=quiz_id, question_id=question_id
+        quiz_attempt = get_object_or_404(
+            QuizAttempt,
+            user=self.request.user,
+            quiz_id=quiz_id,
         )
-        return quiz_question.question
+        return build_attempt_sheet(quiz_attempt)
 
 
 @ATTEMPT_CHOICE_SCHEMA_View
@@ -55,17 +98,6 @@ class QuizAttemptChoiceAPIView(generics.CreateAPIView, generics.UpdateAPIView):
 
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self):
-        user = self.request.user
-        quiz_id = self.request.data.get("quiz_id")
-        question_id = self.request.data.get("question_id")
-
-        quiz_attempt = get_object_or_404(QuizAttempt, user=user, quiz_id=quiz_id)
-        attempt_question = quiz_attempt.questions.get(question_id=question_id)
-        attempt_choice = attempt_question.choices.all()  # QuizAttemptChoice 쿼리셋
-
-        return attempt_choice
-
     def get_serializer_class(self):
         if self.request.method == "POST":
             return QuizAttemptChoiceCreateSerializer
@@ -73,22 +105,27 @@ class QuizAttemptChoiceAPIView(generics.CreateAPIView, generics.UpdateAPIView):
             return QuizAttemptChoiceUpdateSerializer
 
     def put(self, request, *args, **kwargs):
-        # 1. 현재 문제에 연결된 모든 선택지 가져오기
-        queryset = self.get_queryset()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.select(request.user)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
-        # 2. 기존 선택 여부 전체 초기화 (모두 False)
-        queryset.update(is_selected=False)
 
-        # 3. instance 찾기
-        selected_choice_id = request.data.get("selected_choice_id")
-        instance = queryset.get(choice_id=selected_choice_id)
+@ATTEMPT_ANSWERS_SCHEMA
+class QuizAttemptAnswersAPIView(generics.GenericAPIView):
+    """고른 선택지 일괄 저장 (자동 저장)"""
+
+    serializer_class = QuizAttemptAnswersSerializer
+    permission_classes = [permissions.IsAuthenticated]
 
-        # 4. 선택한 정답으로 변경
-        serializer = self.get_serializer(instance, data=request.data)
+    def put(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        quiz_attempt = serializer.save_answers(request.user)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        sheet = QuizAttemptSheetSerializer(build_attempt_sheet(quiz_attempt))
+        return Response(sheet.data, status=status.HTTP_200_OK)
 
 
 @QUIZ_SUBMISSION_SCHEMA_View
@@ -103,6 +140,8 @@ class QuizSubmissionAPIView(generics.UpdateAPIView):
 
         if not quiz_id:
             return Response({"detail": "quiz_id가 필요합니다."}, status=400)
+        if not (quiz_id.isascii() and quiz_id.isdecimal()):
+            raise ValidationError("quiz_id는 숫자여야 합니다.")
 
         # 유저가 해당 퀴즈에 이미 응시한 기록 가져오기
         quiz_attempt = get_object_or_404(QuizAttempt, user=user, quiz_id=quiz_id)
@@ -1,8 +1,13 @@
 import pytest
 
+from django.core.cache import caches
+from django.db import connection
 from django.utils import timezone
 from rest_framework.test import APIClient
 
+from core.lru import lru_caches
+from quiz_attempt.codes import ATTEMPT_CODE_SEQUENCE
+
 from .factories import (
     UserFactory,
     QuizFactory,
@@ -15,6 +20,22 @@ from .factories import (
 )
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """--no-migrations 환경에서 마이그레이션(RunSQL)으로 생성하는 DB 객체 생성"""
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {ATTEMPT_CODE_SEQUENCE}")
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """테스트 간 캐시 공유 방지"""
+    for cache in caches.all():
+        cache.clear()
+    for lru_cache in lru_caches():
+        lru_cache.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -213,6 +234,10 @@ def quiz_attempt_choice_data(db, quiz_attempt_question_data, choice_data):
         order_index=1,
         is_selected=True,  # 정답 맞춤
     )
+    quiz_attempt_question_data["attempt1_question2"].selected_choice = choice_data[
+        "choice5"
+    ]
+    quiz_attempt_question_data["attempt1_question2"].save()
     attempt1_choice2 = QuizAttemptChoiceFactory.create(
         attempt_question=quiz_attempt_question_data["attempt1_question2"],
         choice=choice_data["choice4"],
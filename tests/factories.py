@@ -69,6 +69,7 @@ class QuizAttemptFactory(factory.django.DjangoModelFactory):
     quiz = factory.SubFactory(QuizFactory)
     user = factory.SubFactory(UserFactory)
     attempt_question_count = factory.Faker("random_int")
+    is_random_choice = factory.SelfAttribute("quiz.is_random_choice")
     started_at = factory.Faker("date_time")
     submitted_at = factory.Faker("date_time")
 
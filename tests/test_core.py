@@ -0,0 +1,496 @@
+import logging
+import os
+import runpy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from config.warmup import warm_up
+from core.checks import shared_cache_check
+from core.lru import LRUCache, lru_stats
+from core.queries import record_queries
+from core.routers import ReplicaReadMixin, _replica_reads, is_pinned_to_primary
+from core.singleflight import SingleFlight, singleflight_stats
+from question.content import get_question_content
+from question.models import Choice
+from quiz.catalog import catalog_flight
+from quiz.models import Quiz
+from quiz.selection import get_question_pool
+from core.management.commands.runprod import CONFIG_PATH, Command as RunProdCommand
+
+
+@pytest.mark.django_db
+class TestQueryIndexes:
+    def test_hot_queries_use_indexes(self, capsys):
+        """주요 엔드포인트 쿼리 인덱스 사용 확인"""
+
+        # when : 인덱스 확인 명령 실행
+        call_command("check_query_indexes")
+
+        # then : 모든 쿼리가 인덱스 사용
+        assert "MISS" not in capsys.readouterr().out
+
+
+class TestProductionServer:
+    def test_warm_up(self):
+        """워밍업 : URLconf 로딩, serializer 모듈 import, 모델 메타데이터 캐시 구성"""
+
+        # when : 워밍업 실행
+        result = warm_up()
+
+        # then : URL 패턴, serializer, 모델 메타데이터 캐시 구성
+        assert result["urls"] > 0
+        assert result["serializers"] > 0
+        assert result["models"] > 0
+        assert "related_objects" in Quiz._meta.__dict__
+
+    def test_runprod_argv(self):
+        """runprod : 명령 옵션을 gunicorn 인자로 전달"""
+
+        # when : 워커 / 스레드 수 지정
+        argv = RunProdCommand().gunicorn_argv({"workers": 4, "threads": 2})
+
+        # then : gunicorn 설정 파일 + 옵션
+        assert argv[1:5] == ["-m", "gunicorn", "-c", str(CONFIG_PATH)]
+        assert argv[5:] == ["--workers", "4", "--threads", "2"]
+
+    def test_runprod_asgi_env(self):
+        """runprod --asgi : gunicorn 설정이 ASGI 앱 + uvicorn 워커를 쓰도록 WEB_ASGI 전달"""
+
+        # when : --asgi 지정 / 미지정
+        asgi_env = RunProdCommand().gunicorn_env({"asgi": True})
+        wsgi_env = RunProdCommand().gunicorn_env({"asgi": False})
+
+        # then : --asgi 일 때만 WEB_ASGI
+        assert asgi_env["WEB_ASGI"] == "true"
+        assert wsgi_env.get("WEB_ASGI") == os.environ.get("WEB_ASGI")
+
+    @pytest.mark.parametrize(
+        "db_pool, expected", [("false", 0), ("true", None)], ids=["no-pool", "pool"]
+    )
+    def test_asgi_disables_persistent_connections(self, monkeypatch, db_pool, expected):
+        """ASGI : 풀 미사용 시 영구 연결 X (요청마다 다른 스레드 -> 연결 누적 방지)"""
+
+        # given : ASGI 실행 환경
+        monkeypatch.setenv("WEB_ASGI", "true")
+        monkeypatch.setenv("DB_POOL", db_pool)
+        monkeypatch.setenv("DB_CONN_MAX_AGE", "60")
+
+        # when : 설정 모듈 평가
+        settings_path = CONFIG_PATH.with_name("settings.py")
+        database = runpy.run_path(str(settings_path))["DATABASES"]["default"]
+
+        # then : 풀 미사용 -> CONN_MAX_AGE 0, 풀 사용 -> 풀에서 대여/반납
+        assert database.get("CONN_MAX_AGE") == expected
+        assert ("pool" in database.get("OPTIONS", {})) == (db_pool == "true")
+
+
+@pytest.mark.django_db
+class TestDatabaseConnectionStats:
+    def test_stats_by_staff(self, api_client, staff_user_data, settings):
+        """관리자 : DB 연결 재사용 현황 조회"""
+
+        # given : 관리자 로그인
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+
+        # when : 연결 현황 조회
+        response = api_client.get(reverse("metrics-db"))
+
+        # then : 설정(DB_POOL)에 따른 기본 DB 연결 방식
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.data["default"]
+        if settings.DB_POOL:
+            assert stats["mode"] == "pool"
+            assert stats["stats"]["pool_max"] == stats["max_size"]
+        else:
+            assert stats["mode"] == "persistent"
+            assert stats["conn_health_checks"] is True
+
+    def test_stats_by_user(self, api_client, user_data):
+        """일반 유저 : 연결 현황 조회 불가"""
+
+        # given : 일반 유저 로그인
+        api_client.force_authenticate(user=user_data["user1"])
+
+        # when : 연결 현황 조회
+        response = api_client.get(reverse("metrics-db"))
+
+        # then : 권한 없음
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestSharedCacheCheck:
+    def test_local_cache_warning(self, settings):
+        """운영(DEBUG=False) 에서 로컬 메모리 캐시 사용 시 경고"""
+
+        # given : 운영 설정, 로컬 메모리 기본 캐시
+        settings.DEBUG = False
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache"},
+        }
+
+        # when : 시스템 체크
+        warnings = shared_cache_check(None)
+
+        # then : 로컬 메모리 캐시만 경고
+        assert [(w.id, w.obj) for w in warnings] == [("core.W001", "default")]
+
+
+@pytest.mark.django_db
+class TestLRUCache:
+    def test_lru_bounds(self):
+        """항목 수 / 메모리 상한 초과 시 가장 오래 사용하지 않은 항목부터 축출"""
+
+        # given : 항목 3개, 약 1KB 상한
+        lru_cache = LRUCache("test_bounds", max_entries=3, max_bytes=1024)
+
+        # when : 4개 저장 (1 은 최근 조회), 상한보다 큰 값 저장
+        for key in range(1, 4):
+            lru_cache.set(key, f"value{key}")
+        lru_cache.get(1)
+        lru_cache.set(4, "value4")
+        lru_cache.set(5, "x" * 2048)
+        missing = lru_cache.get(2)
+
+        # then : 2 축출, 큰 값은 저장 X
+        assert missing is None
+        assert lru_cache.get(1) == "value1"
+        assert lru_cache.get(5) is None
+        stats = lru_stats()["test_bounds"]
+        assert stats["entries"] == 3
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+
+    def test_stats_by_staff(self, api_client, staff_user_data, choice_data):
+        """관리자 : 문제 내용 캐시 적중 / 미스 현황 조회"""
+
+        # given : 관리자 로그인, 문제 내용 캐시 미스 1회 + 적중 1회
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        question_id = choice_data["choice1"].question_id
+        get_question_content(question_id)
+        get_question_content(question_id)
+
+        # when : LRU 현황 조회
+        response = api_client.get(reverse("metrics-lru"))
+
+        # then : 문제 내용 캐시 카운터
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.data["question_content"]
+        assert stats["entries"] == 1
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.django_db
+class TestSingleFlight:
+    def test_concurrent_misses_coalesced(self):
+        """같은 키의 동시 캐시 미스 : 계산 1회, 나머지는 결과 공유"""
+
+        # given : 계산이 끝나지 않도록 막아 둔 compute
+        flight = SingleFlight("test_coalesce")
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        # when : 스레드 8개 동시 조회 후 계산 완료
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(flight.get, "test:coalesce", compute, 60)
+                for _ in range(8)
+            ]
+            while flight.stats()["coalesced"] < 7:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        # then : 계산 1회, 모두 같은 값, 이후 조회는 캐시 적중
+        assert results == ["value"] * 8
+        assert len(calls) == 1
+        assert flight.get("test:coalesce", compute, 60) == "value"
+        stats = singleflight_stats()["test_coalesce"]
+        assert (stats["computes"], stats["coalesced"], stats["hits"]) == (1, 7, 1)
+
+    def test_wait_for_other_process(self):
+        """다른 프로세스가 잠금을 잡고 계산 중 : 저장된 값을 기다려 사용"""
+
+        # given : 다른 프로세스의 잠금, 잠시 후 값 저장
+        flight = SingleFlight("test_lock", wait_timeout=2, poll_interval=0.01)
+        cache.add("test:lock:lock", True, 10)
+        threading.Timer(
+            0.1, lambda: cache.set("test:lock", (time.time() + 60, "other"), 60)
+        ).start()
+
+        # when : 조회
+        value = flight.get("test:lock", lambda: "mine", 60)
+
+        # then : 직접 계산하지 않고 저장된 값 사용
+        assert value == "other"
+        stats = flight.stats()
+        assert stats["lock_waits"] == 1
+        assert "computes" not in stats
+
+    def test_stale_while_revalidate(self):
+        """만료된 값 : stale_ttl 동안 이전 값 반환, 백그라운드에서 1회 갱신"""
+
+        # given : 만료된 값, 갱신 계산은 막아 둠
+        flight = SingleFlight("test_stale")
+        cache.set("test:stale", (time.time() - 1, "old"), 60)
+        release = threading.Event()
+
+        def compute():
+            release.wait(5)
+            return "new"
+
+        # when : 갱신 중 두 번 조회 후 갱신 완료
+        first = flight.get("test:stale", compute, 60, stale_ttl=30)
+        second = flight.get("test:stale", compute, 60, stale_ttl=30)
+        release.set()
+        deadline = time.monotonic() + 2
+        while flight.stats()["refreshing"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # then : 기다리지 않고 이전 값, 갱신은 1회, 갱신 후 새 값
+        assert (first, second) == ("old", "old")
+        assert flight.get("test:stale", lambda: "newer", 60, stale_ttl=30) == "new"
+        assert flight.stats()["refreshes"] == 1
+
+    def test_stats_by_staff(self, api_client, staff_user_data, quiz_data):
+        """관리자 : 퀴즈 상세 single-flight 현황 조회"""
+
+        # given : 관리자 로그인, 퀴즈 상세 2회 조회
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        url = reverse("quiz-detail", args=[quiz_data["quiz1"].id])
+        catalog_flight.reset_stats()
+        api_client.get(url)
+        api_client.get(url)
+
+        # when : single-flight 현황 조회
+        response = api_client.get(reverse("metrics-singleflight"))
+
+        # then : 계산 1회, 적중 1회
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.data["quiz_catalog"]
+        assert (stats["computes"], stats["hits"]) == (1, 1)
+
+
+class ReplicaProbeView(ReplicaReadMixin, APIView):
+    """요청 처리 중 Quiz 조회 DB 확인용"""
+
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        return Response({"db": router.db_for_read(Quiz)})
+
+    def post(self, request):
+        return Response({"db": router.db_for_read(Quiz)})
+
+
+@pytest.mark.django_db
+class TestReadReplicaRouter:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+    def test_safe_request_reads_replica(self, user_data):
+        """조회 전용 view 의 GET : replica 조회"""
+
+        # given : 로그인 유저 GET 요청
+        request = APIRequestFactory().get("/")
+        force_authenticate(request, user=user_data["user1"])
+
+        # when : 요청 처리
+        response = ReplicaProbeView.as_view()(request)
+
+        # then : replica 조회, 요청 종료 후 primary 복구
+        assert response.data["db"] == "replica1"
+        assert router.db_for_read(Quiz) == DEFAULT_DB_ALIAS
+
+    def test_unsafe_request_reads_primary(self, user_data):
+        """조회 전용 view 라도 쓰기 요청은 primary 조회"""
+
+        # given : POST 요청
+        request = APIRequestFactory().post("/")
+        force_authenticate(request, user=user_data["user1"])
+
+        # when : 요청 처리
+        response = ReplicaProbeView.as_view()(request)
+
+        # then : primary 조회
+        assert response.data["db"] == DEFAULT_DB_ALIAS
+
+    def test_pinned_user_reads_primary(
+        self, api_client, user_data, quiz_data, quiz_question_data
+    ):
+        """응시 생성(쓰기) 직후 해당 유저 조회는 primary 고정"""
+
+        # given : 퀴즈 응시 생성
+        user = user_data["user1"]
+        api_client.force_authenticate(user=user)
+        response = api_client.post(
+            reverse("quiz-attempt"), data={"quiz_id": quiz_data["quiz3"].id}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # when : 같은 유저 / 다른 유저 조회
+        pinned_request = APIRequestFactory().get("/")
+        force_authenticate(pinned_request, user=user)
+        other_request = APIRequestFactory().get("/")
+        force_authenticate(other_request, user=user_data["user2"])
+
+        # then : 응시한 유저만 primary
+        assert is_pinned_to_primary(user)
+        assert ReplicaProbeView.as_view()(pinned_request).data["db"] == DEFAULT_DB_ALIAS
+        assert ReplicaProbeView.as_view()(other_request).data["db"] == "replica1"
+
+    def test_catalog_cache_filled_from_primary(
+        self, api_client, staff_user_data, quiz_data
+    ):
+        """퀴즈 목록 / 상세 캐시는 replica 가 아닌 primary 조회로 채움"""
+
+        # given : 관리자 로그인 (replica1 은 연결 설정 없음 -> 조회 시 오류)
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+
+        # when : 퀴즈 목록 / 상세 조회 (캐시 미스)
+        list_response = api_client.get(reverse("quiz-list"))
+        detail_response = api_client.get(
+            reverse("quiz-detail", args=[quiz_data["quiz1"].id])
+        )
+
+        # then : primary 에서 조회해 응답
+        assert list_response.status_code == status.HTTP_200_OK
+        assert detail_response.status_code == status.HTTP_200_OK
+
+    def test_question_pool_filled_from_primary(self, quiz_data, quiz_question_data):
+        """퀴즈 문제 목록 : 문제 id 캐시는 replica 가 아닌 primary 조회로 채움"""
+
+        # given : replica 조회 구간 (replica1 은 연결 설정 없음 -> 조회 시 오류)
+        quiz = quiz_data["quiz1"]
+        token = _replica_reads.set(True)
+
+        # when : 문제 id 캐시 미스
+        try:
+            pool = get_question_pool(quiz.id)
+        finally:
+            _replica_reads.reset(token)
+
+        # then : primary 에서 조회
+        assert list(pool) == sorted(
+            [
+                quiz_question_data["quiz1_question1"].question_id,
+                quiz_question_data["quiz1_question2"].question_id,
+            ]
+        )
+
+    def test_writes_and_migrations_use_primary(self):
+        """쓰기 및 마이그레이션은 primary 만"""
+
+        # when & then
+        assert router.db_for_write(Quiz) == DEFAULT_DB_ALIAS
+        assert router.allow_migrate("replica1", "quiz") is False
+        assert router.allow_migrate(DEFAULT_DB_ALIAS, "quiz") is True
+
+
+@pytest.mark.django_db(transaction=True, databases=[DEFAULT_DB_ALIAS, "replica"])
+class TestReplicaMirror:
+    """로컬 2-DB 구성 : replica 는 default 테스트 DB 의 MIRROR (별도 연결)"""
+
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.DATABASE_REPLICAS = ["replica"]
+
+    def test_read_routed_to_replica(
+        self, api_client, user_data, quiz_data, quiz_question_data
+    ):
+        """조회 전용 view 의 GET : 캐시 채움은 primary, 문제 조회는 replica 연결"""
+
+        # given : 미응시 유저 로그인
+        api_client.force_authenticate(user=user_data["user1"])
+        quiz = quiz_data["quiz1"]
+
+        # when : 퀴즈 문제 목록 조회
+        with (
+            CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary_queries,
+            CaptureQueriesContext(connections["replica"]) as replica_queries,
+        ):
+            response = api_client.get(reverse("quiz-question", args=[quiz.id]))
+
+        # then : 문제 id 캐시는 primary, 문제 행은 replica 에서 조회
+        primary_sql = " ".join(q["sql"] for q in primary_queries)
+        replica_sql = " ".join(q["sql"] for q in replica_queries)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2  # 퀴즈1 연결 문제 수
+        assert 'FROM "quiz_question"' in primary_sql
+        assert 'FROM "quiz_question"' not in replica_sql
+        assert 'FROM "question"' in replica_sql
+        assert 'FROM "question"' not in primary_sql
+
+
+@pytest.mark.django_db
+class TestQueryCount:
+    def test_query_count_headers(self, api_client, user_data, quiz_data, settings):
+        """개발 환경 : 응답 헤더로 쿼리 수 / DB 시간 노출"""
+
+        # given : 헤더 노출 설정, 일반 유저 로그인
+        settings.QUERY_COUNT_HEADERS = True
+        api_client.force_authenticate(user=user_data["user1"])
+
+        # when : 퀴즈 목록 조회
+        response = api_client.get(reverse("quiz-list"))
+
+        # then : 쿼리 기록 헤더
+        assert response.status_code == status.HTTP_200_OK
+        assert int(response["X-Query-Count"]) > 0
+        assert response["X-Query-Time"].endswith("ms")
+        assert response["X-Query-Repeated"] == "0"
+
+    def test_query_budget_exceeded(
+        self, api_client, user_data, quiz_data, settings, caplog
+    ):
+        """view 별 쿼리 수 예산 초과 시 경고 로그"""
+
+        # given : 퀴즈 목록 예산 0
+        settings.QUERY_BUDGETS = {"quiz-list": 0}
+        api_client.force_authenticate(user=user_data["user1"])
+
+        # when : 퀴즈 목록 조회
+        with caplog.at_level(logging.WARNING, logger="core.queries"):
+            api_client.get(reverse("quiz-list"))
+
+        # then : view / 쿼리 수가 담긴 경고
+        (record,) = caplog.records
+        assert record.query_stats["view"] == "quiz-list"
+        assert record.query_stats["budget"] == 0
+        assert record.query_stats["queries"] > 0
+
+    def test_repeated_query_call_site(self):
+        """파라미터만 다른 반복 쿼리 : fingerprint 묶음 + 호출 위치"""
+
+        # when : 같은 형태의 쿼리 3회
+        with record_queries(repeat_threshold=3) as stats:
+            for question_id in range(3):
+                list(Choice.objects.filter(question_id=question_id))
+
+        # then : 반복 쿼리 1건, 호출 위치에 이 테스트 포함
+        ((sql, count),) = stats.repeated()
+        assert count == 3
+        assert '"question_id" = %s' in sql
+        assert any(
+            "test_repeated_query_call_site" in frame for frame in stats.stacks[sql]
+        )
@@ -0,0 +1,407 @@
+import json
+from datetime import timedelta
+
+import pytest
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from question.content import (
+    _version_key,
+    _version_stamp,
+    get_answer_keys,
+    get_question_content,
+    get_question_contents,
+)
+from question.models import Question, Choice
+from question.views import QuestionViewSet
+from quiz_attempt.snapshots import get_attempt_question, get_attempt_snapshot
+
+from .factories import QuestionFactory, ChoiceFactory
+
+
+@pytest.mark.django_db
+class TestQuestionImport:
+    def test_import_questions_jsonl(self, api_client, staff_user_data):
+        """관리자 : JSONL 파일로 문제 일괄 등록 (오류 행 제외)"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # given : 정상 2건, 정답 2개 1건, JSON 오류 1건
+        rows = [
+            {
+                "text": "문제1",
+                "choice": [
+                    {"text": "선택지1", "is_correct": True},
+                    {"text": "선택지2", "is_correct": False},
+                ],
+            },
+            {
+                "text": "문제2",
+                "choice": [
+                    {"text": "선택지1", "is_correct": True},
+                    {"text": "선택지2", "is_correct": True},
+                ],
+            },
+            {"text": "문제3", "choice": [{"text": "선택지1", "is_correct": True}]},
+        ]
+        lines = [json.dumps(row, ensure_ascii=False) for row in rows] + ["{invalid"]
+        upload = SimpleUploadedFile("questions.jsonl", "\n".join(lines).encode("utf-8"))
+
+        # when : 문제 일괄 등록 API 호출
+        url = reverse("questions-bulk-import")
+        response = api_client.post(url, data={"file": upload}, format="multipart")
+
+        # then : 정상 행만 등록, 실패 행 번호 반환
+        response_data = response.json()
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response_data["created"] == 2
+        assert [error["line"] for error in response_data["errors"]] == [2, 4]
+        assert Question.objects.filter(text__in=["문제1", "문제3"]).count() == 2
+        assert Choice.objects.filter(question__text="문제1").count() == 2
+
+    def test_import_questions_csv_command(self, db, tmp_path):
+        """CSV 파일로 문제 일괄 등록 명령"""
+
+        # given : CSV 파일
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "text,choice_1,choice_2,choice_3,answer\n"
+            "문제1,선택지1,선택지2,선택지3,2\n"
+            "문제2,선택지1,선택지2,,\n",
+            encoding="utf-8",
+        )
+
+        # when : 일괄 등록 명령 실행 (batch 크기 1)
+        call_command("import_questions", str(path), batch_size=1)
+
+        # then : 정답 없는 행 제외하고 등록
+        question = Question.objects.get(text="문제1")
+        assert not Question.objects.filter(text="문제2").exists()
+        assert question.choice.count() == 3
+        assert question.choice.get(is_correct=True).text == "선택지2"
+
+    def test_import_questions_csv_invalid_header(self, api_client, staff_user_data):
+        """CSV 선택지 열 이름이 choice_<번호> 가 아니면 500 이 아닌 헤더 오류로 반환"""
+
+        # given : 관리자 토큰 세팅, choice_a 열이 있는 CSV
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        content = "text,choice_1,choice_a,answer\n문제1,선택지1,선택지2,1\n"
+        upload = SimpleUploadedFile("questions.csv", content.encode("utf-8"))
+
+        # when : 문제 일괄 등록 API 호출
+        url = reverse("questions-bulk-import")
+        response = api_client.post(url, data={"file": upload}, format="multipart")
+
+        # then : 등록 없이 1행(헤더) 오류
+        response_data = response.json()
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response_data["created"] == 0
+        (error,) = response_data["errors"]
+        assert error["line"] == 1
+        assert "choice_a" in error["errors"]
+        assert not Question.objects.filter(text="문제1").exists()
+
+
+@pytest.mark.django_db
+class TestQuestionList:
+    @pytest.fixture
+    def question_bank(self):
+        """문제 12개 (생성일 1일 간격), 문제당 선택지 2개"""
+        base = timezone.now() - timedelta(days=30)
+        questions = []
+        for i in range(12):
+            question = QuestionFactory.create(text=f"은행 문제 {i}")
+            ChoiceFactory.create(question=question, text="정답", is_correct=True)
+            ChoiceFactory.create(question=question, text="오답")
+            question.created_at = base + timedelta(days=i)
+            Question.objects.filter(pk=question.pk).update(
+                created_at=question.created_at
+            )
+            questions.append(question)
+        return questions
+
+    def test_question_list_paginated(self, api_client, staff_user_data, question_bank):
+        """관리자 : 문제 목록 최신순 페이지네이션, 선택지 prefetch"""
+
+        # given : 관리자 토큰 세팅
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+
+        # when : 문제 목록 조회
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(reverse("questions-list"))
+
+        # then : 10개씩 최신순, 쿼리 수는 문제 수와 무관 (COUNT + 목록 + 선택지)
+        response_data = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert response_data["count"] == 12
+        assert [item["text"] for item in response_data["results"][:2]] == [
+            "은행 문제 11",
+            "은행 문제 10",
+        ]
+        assert all(len(item["choice"]) == 2 for item in response_data["results"])
+        assert len(queries) == 3
+
+    def test_question_list_filter(self, api_client, staff_user_data, question_bank):
+        """관리자 : 생성일 범위 및 문제 내용 필터"""
+
+        # given : 관리자 토큰 세팅
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+
+        # when : 3 ~ 5번째 문제 생성일 범위 + 내용 필터
+        response = api_client.get(
+            reverse("questions-list"),
+            data={
+                "created_after": question_bank[0].created_at + timedelta(days=3),
+                "created_before": question_bank[0].created_at + timedelta(days=6),
+                "text": "은행",
+            },
+        )
+        invalid_response = api_client.get(
+            reverse("questions-list"), data={"created_after": "어제"}
+        )
+
+        # then : 범위 내 문제만, 잘못된 날짜 형식 400
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["text"] for item in response.json()["results"]] == [
+            "은행 문제 5",
+            "은행 문제 4",
+            "은행 문제 3",
+        ]
+        assert invalid_response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_question_export_ndjson(
+        self, api_client, staff_user_data, question_bank, monkeypatch
+    ):
+        """관리자 : 필터 조건의 문제 전체 NDJSON 스트리밍"""
+
+        # given : 관리자 토큰 세팅, 청크 크기 5
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        monkeypatch.setattr(QuestionViewSet, "export_chunk_size", 5)
+
+        # when : 문제 내보내기
+        response = api_client.get(reverse("questions-export"), data={"text": "은행"})
+        content = b"".join(response.streaming_content).decode()
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        # then : 페이지네이션 없이 전체 문제 (최신순) + 선택지
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert len(rows) == 12
+        assert rows[0]["text"] == "은행 문제 11"
+        assert [choice["text"] for choice in rows[0]["choice"]] == ["정답", "오답"]
+
+
+@pytest.mark.django_db
+class TestQuestionUpdate:
+    def test_update_question_choices_diff(
+        self,
+        api_client,
+        staff_user_data,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_question_data,
+        django_capture_on_commit_callbacks,
+    ):
+        """관리자 : 선택지 id 기준 변경분만 반영 (유지 / 수정 / 추가 / 삭제)"""
+
+        # given : 관리자 토큰 세팅, 문제3 이 출제된 응시 스냅샷 캐시
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        question = Question.objects.get(text="지문에서 확인 할 수 없는 것은?")
+        quiz_id, user_id = quiz_data["quiz3"].id, user_data["user2"].id
+        get_attempt_snapshot(quiz_id, user_id)
+        updated_at = question.updated_at
+
+        # when : 선택지6 유지, 선택지7 수정(정답), 새 선택지 추가, 선택지8/9 삭제
+        choice6, choice7 = choice_data["choice6"], choice_data["choice7"]
+        data = {
+            "text": "수정된 문제3",
+            "choice": [
+                {"id": choice6.id, "text": choice6.text, "is_correct": False},
+                {"id": choice7.id, "text": "수정된 선택지", "is_correct": True},
+                {"text": "새 선택지", "is_correct": False},
+            ],
+        }
+        url = reverse("questions-detail", kwargs={"pk": question.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.put(url, data=data, format="json")
+
+        # then : 기존 선택지 id 유지, 바뀐 선택지만 UPDATE 1회
+        assert response.status_code == status.HTTP_200_OK
+        question.refresh_from_db()
+        assert question.text == "수정된 문제3"
+        assert question.updated_at > updated_at
+        choices = list(question.choice.order_by("id"))
+        assert [c.id for c in choices[:2]] == [choice6.id, choice7.id]
+        assert [c.text for c in choices] == [choice6.text, "수정된 선택지", "새 선택지"]
+        assert choices[1].is_correct
+        choice_updates = [
+            q["sql"]
+            for q in queries.captured_queries
+            if q["sql"].startswith('UPDATE "question_choice"')
+        ]
+        assert len(choice_updates) == 1
+
+        # then : 응시 스냅샷은 버전 비교로 다시 생성 (수정된 문제 / 선택지)
+        attempt_question = get_attempt_question(quiz_id, user_id, question.id)
+        assert attempt_question["text"] == "수정된 문제3"
+        assert {c["text"] for c in attempt_question["choices"]} == {
+            choice6.text,
+            "수정된 선택지",
+            "새 선택지",
+        }
+
+    def test_update_question_choice_in_use(
+        self, api_client, staff_user_data, choice_data, quiz_attempt_choice_data
+    ):
+        """관리자 : 응시 기록에서 사용 중인 선택지 삭제 불가"""
+
+        # given : 관리자 토큰 세팅, 응시에서 순서가 저장된 선택지4
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        choice5 = choice_data["choice5"]
+        question = choice5.question
+
+        # when : 선택지4 를 제외하고 수정
+        url = reverse("questions-detail", kwargs={"pk": question.id})
+        response = api_client.put(
+            url,
+            data={
+                "text": question.text,
+                "choice": [
+                    {"id": choice5.id, "text": "수정", "is_correct": True},
+                ],
+            },
+            format="json",
+        )
+
+        # then : 400, 변경 없음
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Choice.objects.filter(id=choice_data["choice4"].id).exists()
+        choice5.refresh_from_db()
+        assert choice5.text == "문제2의 선택지2"
+
+    def test_update_question_unknown_choice(
+        self, api_client, staff_user_data, choice_data
+    ):
+        """관리자 : 다른 문제의 선택지 id 로 수정 불가"""
+
+        # given : 관리자 토큰 세팅
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        question = choice_data["choice1"].question
+
+        # when : 문제2 의 선택지 id 포함
+        url = reverse("questions-detail", kwargs={"pk": question.id})
+        response = api_client.patch(
+            url,
+            data={"choice": [{"id": choice_data["choice4"].id, "is_correct": True}]},
+            format="json",
+        )
+
+        # then : 400
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "choice" in response.json()
+
+
+@pytest.mark.django_db
+class TestQuestionContentCache:
+    def test_question_content_cached(self, choice_data):
+        """문제 내용 / 정답 : 최초 1회 로드 후 버전이 같으면 DB 조회 없음"""
+
+        # given : 문제 3개
+        question_ids = [choice_data[f"choice{i}"].question_id for i in (1, 4, 6)]
+
+        # when : 두 번 조회
+        with CaptureQueriesContext(connection) as cold_queries:
+            contents = get_question_contents(question_ids)
+        with CaptureQueriesContext(connection) as warm_queries:
+            answer_keys = get_answer_keys(question_ids)
+
+        # then : 문제 + 선택지 조회 2회, 이후 DB 조회 X
+        assert len(cold_queries) == 2
+        assert len(warm_queries) == 0
+        assert [c["text"] for c in contents[question_ids[0]]["choices"]] == [
+            "문제1의 선택지1",
+            "문제1의 선택지2",
+            "문제1의 선택지3",
+        ]
+        assert answer_keys == {
+            question_ids[0]: choice_data["choice1"].id,
+            question_ids[1]: choice_data["choice5"].id,
+            question_ids[2]: None,
+        }
+
+    def test_question_content_version_bumped(
+        self,
+        api_client,
+        staff_user_data,
+        choice_data,
+        django_capture_on_commit_callbacks,
+    ):
+        """관리자 문제 수정 : 버전 갱신으로 캐시된 내용 / 정답 교체"""
+
+        # given : 관리자 토큰 세팅, 문제1 내용 캐시
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        choice1, choice2 = choice_data["choice1"], choice_data["choice2"]
+        question = choice1.question
+        get_question_contents([question.id])
+
+        # when : 정답을 선택지2 로 변경, 선택지3 삭제
+        url = reverse("questions-detail", kwargs={"pk": question.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.patch(
+                url,
+                data={
+                    "text": "수정된 문제1",
+                    "choice": [
+                        {"id": choice1.id, "is_correct": False},
+                        {"id": choice2.id, "is_correct": True},
+                    ],
+                },
+                format="json",
+            )
+
+        # then : 다음 조회 시 변경된 내용 / 정답
+        assert response.status_code == status.HTTP_200_OK
+        content = get_question_content(question.id)
+        assert content["text"] == "수정된 문제1"
+        assert [c["id"] for c in content["choices"]] == [choice1.id, choice2.id]
+        assert get_answer_keys([question.id]) == {question.id: choice2.id}
+
+    def test_question_content_load_keeps_newer_version(self, choice_data):
+        """조회 중 로드 : 공유 캐시의 (관리자 수정으로 갱신된) 버전을 덮어쓰지 않음"""
+
+        # given : 로드 전에 공유 캐시 버전이 먼저 갱신된 문제
+        question = choice_data["choice1"].question
+        newer_version = _version_stamp(question.updated_at) + 1
+        cache.set(_version_key(question.id), newer_version)
+
+        # when : 캐시에 없는 문제 내용 로드 (이전 버전)
+        get_question_contents([question.id])
+
+        # then : 공유 캐시 버전 유지
+        assert cache.get(_version_key(question.id)) == newer_version
+
+    def test_question_content_deleted(self, api_client, staff_user_data, choice_data):
+        """관리자 문제 삭제 : 캐시된 내용 제거"""
+
+        # given : 관리자 토큰 세팅, 문제1 내용 캐시
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        question_id = choice_data["choice1"].question_id
+        get_question_contents([question_id])
+
+        # when : 문제 삭제
+        api_client.delete(reverse("questions-detail", kwargs={"pk": question_id}))
+
+        # then : 조회 결과 없음
+        assert get_question_content(question_id) is None
@@ -4,8 +4,12 @@ from urllib.parse import urlparse
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from quiz.models import Quiz
+from quiz.models import Quiz, QuizQuestion
+
+from .factories import QuizFactory, QuestionFactory
 
 
 @pytest.mark.django_db
@@ -155,6 +159,55 @@ class TestReadQuiz:
         assert next_page == "page=4"
         assert previous_page == "page=2"
 
+    def test_quiz_list_cursor_pagination(
+        self, api_client, staff_user_data, quiz_pagination_data
+    ):
+        """퀴즈 목록 cursor 페이지네이션 테스트"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # when : cursor 모드로 퀴즈 목록 전체 페이지 순회
+        url = reverse("quiz-list")
+        response = api_client.get(url, data={"pagination": "cursor", "page_size": 50})
+        quiz_ids = [quiz["id"] for quiz in response.json()["results"]]
+        while response.json()["next"]:
+            response = api_client.get(response.json()["next"])
+            quiz_ids += [quiz["id"] for quiz in response.json()["results"]]
+
+        # then : 생성일 역순으로 중복/누락 없이 조회 (COUNT 없음)
+        expected_ids = list(
+            Quiz.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.json()
+        assert quiz_ids == expected_ids
+
+    def test_quiz_list_without_count(
+        self, api_client, staff_user_data, quiz_pagination_data
+    ):
+        """퀴즈 목록 전체 개수 생략 테스트"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # when : count=none 으로 퀴즈 목록 API 호출
+        url = reverse("quiz-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, data={"page": 3, "count": "none"})
+
+        # then : COUNT 쿼리 없이 이전/다음 페이지 확인
+        next_page = urlparse(response.json()["next"]).query
+        previous_page = urlparse(response.json()["previous"]).query
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] is None
+        assert len(response.json()["results"]) == 10
+        assert "page=4" in next_page
+        assert "page=2" in previous_page
+        assert len(queries) == 1
+
     def test_quiz_list_by_staff(
         self, api_client, staff_user_data, quiz_pagination_data
     ):
@@ -190,6 +243,106 @@ class TestReadQuiz:
         assert response.status_code == status.HTTP_200_OK
         assert "has_attempted" in response_data[0]
 
+    def test_quiz_list_attempt_status_by_user(
+        self, api_client, user_data, quiz_data, quiz_attempt_data
+    ):
+        """일반 사용자 : 퀴즈 목록의 응시 현황을 한 번의 쿼리로 조회"""
+
+        # given : 퀴즈 50개 추가 생성
+        QuizFactory.create_batch(50)
+
+        # given : 일반 사용자 토큰 세팅 및 제출 완료된 응시
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+        attempt = quiz_attempt_data["attempt1"]
+        attempt.correct_count = 2
+        attempt.submitted_at = timezone.now()
+        attempt.save()
+
+        # when : 퀴즈 목록 API 호출 (최대 페이지 크기, 카탈로그 캐시 X / O)
+        url = reverse("quiz-list")
+        with CaptureQueriesContext(connection) as cold_queries:
+            api_client.get(url, data={"page_size": 100})
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, data={"page_size": 100})
+
+        # then : 응시한 퀴즈의 응시 현황 확인
+        results = {quiz["id"]: quiz for quiz in response.json()["results"]}
+        attempted_quiz = results[quiz_data["quiz3"].id]
+        not_attempted_quiz = results[quiz_data["quiz1"].id]
+        assert response.status_code == status.HTTP_200_OK
+        assert attempted_quiz["has_attempted"] is True
+        assert attempted_quiz["attempt_correct_count"] == 2
+        assert attempted_quiz["attempt_submitted_at"] is not None
+        assert not_attempted_quiz["has_attempted"] is False
+        assert not_attempted_quiz["attempt_correct_count"] is None
+
+        # then : 페이지 크기와 관계없이 count + 목록 + 응시 현황 쿼리만 실행,
+        #        캐시된 페이지는 응시 현황 쿼리만 실행
+        assert len(cold_queries) == 3
+        assert len(queries) == 1
+
+    def test_quiz_list_cached_by_catalog_version(
+        self, api_client, staff_user_data, quiz_data, django_capture_on_commit_callbacks
+    ):
+        """퀴즈 목록 : 캐시된 페이지 사용, 관리자 퀴즈 생성/수정/삭제 시 갱신"""
+
+        # given : 관리자 토큰 세팅, 목록 캐시
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        url = reverse("quiz-list")
+        api_client.get(url)
+
+        # when : 목록 재조회
+        with CaptureQueriesContext(connection) as queries:
+            cached_response = api_client.get(url)
+
+        # when : 퀴즈 생성 / 제목 수정 / 삭제 후 목록 조회
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(reverse("quiz-staff-list"), data={"title": "새 퀴즈"})
+            api_client.patch(
+                reverse("quiz-staff-detail", args=[quiz_data["quiz2"].id]),
+                data={"title": "수정된 퀴즈2"},
+            )
+            api_client.delete(
+                reverse("quiz-staff-detail", args=[quiz_data["quiz1"].id])
+            )
+        response = api_client.get(url)
+
+        # then : 캐시된 페이지는 DB 조회 X, 변경 후에는 변경 내용 반영
+        assert len(queries) == 0
+        assert cached_response.json()["count"] == 3
+        titles = [quiz["title"] for quiz in response.json()["results"]]
+        assert response.json()["count"] == 3
+        assert "새 퀴즈" in titles
+        assert "수정된 퀴즈2" in titles
+        assert "퀴즈1" not in titles
+
+    def test_quiz_list_cache_key_ignores_host_and_unknown_params(
+        self, api_client, staff_user_data, quiz_data, settings
+    ):
+        """퀴즈 목록 캐시 : 호스트 / 페이지와 무관한 파라미터가 달라도 같은 캐시 항목"""
+
+        # given : 관리자 토큰 세팅, 다른 호스트 허용, 2개씩 첫 페이지 캐시
+        settings.ALLOWED_HOSTS = ["testserver", "other.example.com"]
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        url = reverse("quiz-list")
+        api_client.get(url, {"page_size": 2})
+
+        # when : 다른 호스트 + 임의 파라미터로 같은 페이지 조회
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(
+                url,
+                {"page_size": 2, "utm_source": "mail"},
+                HTTP_HOST="other.example.com",
+            )
+
+        # then : 캐시된 페이지 사용, 다음 링크는 요청 호스트 + 카탈로그 파라미터만
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 0
+        assert response.json()["next"] == (
+            f"http://other.example.com{url}?page=2&page_size=2"
+        )
+
     def test_quiz_detail_by_staff(self, api_client, staff_user_data, quiz_data):
         """관리자 : 퀴즈 상세 조회 테스트"""
 
@@ -225,6 +378,49 @@ class TestReadQuiz:
         assert response.status_code == status.HTTP_200_OK
         assert response_data["has_attempted"] is True
 
+    def test_quiz_detail_cached(
+        self, api_client, staff_user_data, user_data, quiz_data
+    ):
+        """퀴즈 상세 : 캐시된 퀴즈 설정 사용"""
+
+        # given : 퀴즈 상세 캐시
+        url = reverse("quiz-detail", args=[quiz_data["quiz3"].id])
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        api_client.get(url)
+
+        # when : 관리자 / 일반 사용자 재조회
+        with CaptureQueriesContext(connection) as staff_queries:
+            staff_response = api_client.get(url)
+        api_client.force_authenticate(user=user_data["user1"])
+        with CaptureQueriesContext(connection) as user_queries:
+            user_response = api_client.get(url)
+
+        # then : 퀴즈 조회 X (일반 사용자는 응시 현황만 조회)
+        assert staff_response.json()["question_count"] == 3
+        assert len(staff_queries) == 0
+        assert user_response.json()["has_attempted"] is False
+        assert "is_deleted" not in user_response.json()
+        assert len(user_queries) == 1
+
+    def test_quiz_detail_deleted(
+        self, api_client, staff_user_data, quiz_data, django_capture_on_commit_callbacks
+    ):
+        """퀴즈 상세 : 관리자 삭제 시 캐시된 퀴즈 설정 갱신 (404)"""
+
+        # given : 퀴즈 상세 캐시
+        quiz = quiz_data["quiz3"]
+        url = reverse("quiz-detail", args=[quiz.id])
+        api_client.force_authenticate(user=staff_user_data["staff1"])
+        api_client.get(url)
+
+        # when : 관리자 퀴즈 삭제 후 조회
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.delete(reverse("quiz-staff-detail", args=[quiz.id]))
+        response = api_client.get(url)
+
+        # then : 404
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_exclude_deleted_quiz_from_list(
         self, api_client, staff_user_data, quiz_data
     ):
@@ -310,9 +506,10 @@ class TestQuizQuestionLink:
         url = reverse("quiz-question-link", kwargs={"quiz_id": quiz_id})
         response = api_client.post(url, data=request_data)
 
-        # then : 퀴즈-문제 연결 실패
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert response.json()[0] == "이미 퀴즈와 연결된 문제입니다."
+        # then : 이미 연결된 문제로 분류, 새로 연결된 문제 없음
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["linked_questions"] == []
+        assert response.json()["already_linked_questions"] == [question_id]
 
     def test_link_to_quiz_with_not_existed_question(
         self, api_client, quiz_data, question_data
@@ -332,13 +529,91 @@ class TestQuizQuestionLink:
         url = reverse("quiz-question-link", kwargs={"quiz_id": quiz_id})
         response = api_client.post(url, data=request_data)
 
-        # then : 문제 오류 에러 발생
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert (
-            response.json()["question_ids"][0]
-            == "존재하지 않는 문제 ID가 포함되어 있습니다."
+        # then : 존재하지 않는 문제로 분류
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["linked_questions"] == []
+        assert response.json()["missing_questions"] == [question_id]
+
+    def test_bulk_link_to_quiz_question(
+        self, api_client, quiz_data, question_data, quiz_question_data
+    ):
+        """퀴즈-문제 일괄 연결 테스트 : 신규/기존/없는 문제 혼합"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # given : 새 문제 100개 + 이미 연결된 문제 + 없는 문제
+        quiz_id = quiz_data["quiz1"].id
+        new_ids = [question.id for question in QuestionFactory.create_batch(100)]
+        linked_id = question_data["question1"].id
+        missing_id = max(new_ids) + 100
+        request_data = {"question_ids": new_ids + [linked_id, missing_id]}
+
+        # when : 퀴즈-문제 연결 API 호출
+        url = reverse("quiz-question-link", kwargs={"quiz_id": quiz_id})
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(url, data=request_data)
+
+        # then : 분류 결과 및 연결 확인
+        response_data = response.json()
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response_data["linked_questions"] == sorted(new_ids)
+        assert response_data["already_linked_questions"] == [linked_id]
+        assert response_data["missing_questions"] == [missing_id]
+        assert QuizQuestion.objects.filter(quiz_id=quiz_id).count() == 102
+
+        # then : 문제 수와 관계없이 일정한 쿼리 수
+        assert len(queries) <= 6
+
+    def test_unlink_quiz_question(self, api_client, quiz_data, quiz_question_data):
+        """퀴즈-문제 연결 해제 테스트"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # given : 문제 2개 연결된 퀴즈의 출제 문제 수 1개
+        quiz_id = quiz_data["quiz1"].id
+        Quiz.objects.filter(id=quiz_id).update(question_count=1)
+
+        # when : 퀴즈-문제 연결 해제 API 호출
+        question_id = quiz_question_data["quiz1_question1"].question.id
+        not_linked_id = quiz_question_data["quiz3_question3"].question.id
+        url = reverse("quiz-question-link", kwargs={"quiz_id": quiz_id})
+        response = api_client.delete(
+            url, data={"question_ids": [question_id, not_linked_id]}, format="json"
         )
 
+        # then : 연결 해제 확인
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["unlinked_questions"] == [question_id]
+        assert response.json()["not_linked_questions"] == [not_linked_id]
+        assert not QuizQuestion.objects.filter(
+            quiz_id=quiz_id, question_id=question_id
+        ).exists()
+
+    def test_fail_unlink_below_question_count(
+        self, api_client, quiz_data, quiz_question_data
+    ):
+        """퀴즈-문제 연결 해제 불가 : 퀴즈 문제 수보다 적어지는 경우"""
+
+        # given : 관리자 토큰 세팅
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+
+        # when : 문제 수 3개인 퀴즈의 문제 연결 해제
+        quiz_id = quiz_data["quiz3"].id
+        question_id = quiz_question_data["quiz3_question1"].question.id
+        url = reverse("quiz-question-link", kwargs={"quiz_id": quiz_id})
+        response = api_client.delete(
+            url, data={"question_ids": [question_id]}, format="json"
+        )
+
+        # then : 연결 해제 실패
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert QuizQuestion.objects.filter(quiz_id=quiz_id).count() == 3
+
 
 @pytest.mark.django_db
 class TestQuizQuestionList:
@@ -366,6 +641,72 @@ class TestQuizQuestionList:
         assert response.json()["count"] == quiz_with_questions_batch_data.question_count
         assert previous_page == "page=2"
 
+    def test_quiz_question_list_same_draw_across_pages(
+        self, api_client, user_data, quiz_with_questions_batch_data
+    ):
+        """퀴즈 문제 랜덤 출제 : 페이지가 달라도 같은 추출 결과"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user1")
+        api_client.force_authenticate(user=user)
+
+        # when : 전체 페이지 조회를 두 번 반복
+        quiz = quiz_with_questions_batch_data
+        url = reverse("quiz-question", kwargs={"quiz_id": quiz.id})
+        draws = []
+        for _ in range(2):
+            question_ids = []
+            for page in (1, 2, 3):
+                response = api_client.get(url, data={"page": page})
+                question_ids += [item["id"] for item in response.json()["results"]]
+            draws.append(question_ids)
+
+        # then : 중복 없이 출제 문제 수만큼 동일하게 추출
+        assert len(set(draws[0])) == quiz.question_count
+        assert draws[0] == draws[1]
+
+        # when : 캐시된 문제 풀로 페이지 조회
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get(url, data={"page": 2})
+
+        # then : 응시 여부, 해당 페이지 문제만 조회 (퀴즈 설정은 캐시)
+        assert len(queries) == 2
+
+    def test_quiz_question_pool_invalidated_on_link(
+        self,
+        api_client,
+        staff_user_data,
+        user_data,
+        quiz_data,
+        question_data,
+        django_capture_on_commit_callbacks,
+    ):
+        """퀴즈-문제 연결 시 캐시된 문제 풀 갱신"""
+
+        # given : 문제 1개 출제하는 퀴즈 조회로 빈 문제 풀 캐시
+        quiz = quiz_data["quiz2"]
+        Quiz.objects.filter(id=quiz.id).update(question_count=1)
+        user = User.objects.get(username="user1")
+        api_client.force_authenticate(user=user)
+        url = reverse("quiz-question", kwargs={"quiz_id": quiz.id})
+        assert api_client.get(url).json()["count"] == 0
+
+        # when : 관리자가 문제 연결
+        staff = User.objects.get(username="staff1")
+        api_client.force_authenticate(user=staff)
+        link_url = reverse("quiz-question-link", kwargs={"quiz_id": quiz.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                link_url, data={"question_ids": [question_data["question1"].id]}
+            )
+
+        # then : 연결한 문제 출제
+        api_client.force_authenticate(user=user)
+        response = api_client.get(url)
+        assert [item["id"] for item in response.json()["results"]] == [
+            question_data["question1"].id
+        ]
+
     def test_quiz_attempt_question_list(
         self,
         api_client,
@@ -1,10 +1,35 @@
+import importlib
 import pytest
+from io import StringIO
 
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from django.urls import reverse
+from django.apps import apps
 from django.contrib.auth.models import User
-from question.models import Choice
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from question.content import bump_question_version, get_question_contents
+from question.models import Choice, Question
+from quiz.models import Quiz
+from quiz_attempt.codes import AttemptCodeAllocator, encode_attempt_code
+from quiz_attempt.grading import regrade_attempts
 from quiz_attempt.models import QuizAttempt, QuizAttemptChoice, QuizAttemptQuestion
+from quiz_attempt import snapshots
+from quiz_attempt.serializers import QuizSubmissionSerializer
+
+from .factories import (
+    ChoiceFactory,
+    QuestionFactory,
+    QuizQuestionFactory,
+    QuizAttemptQuestionFactory,
+    QuizAttemptChoiceFactory,
+)
 
 
 @pytest.mark.django_db
@@ -18,57 +43,91 @@ class TestAttemptQuiz:
         user = User.objects.get(username="user1")
         api_client.force_authenticate(user=user)
 
-        # given : request.data 세팅 (퀴즈 및 문제 데이터)
+        # given : 응시 전 퀴즈 문제 목록 조회
         quiz_id = quiz_data["quiz3"].id
+        list_url = reverse("quiz-question", kwargs={"quiz_id": quiz_id})
         question_ids = [
-            question_data["question2"].id,
-            question_data["question3"].id,
-            question_data["question1"].id,
+            item["id"] for item in api_client.get(list_url).json()["results"]
         ]
-        request_data = {
-            "quiz_id": quiz_id,
-            "question_ids": question_ids,
-        }
 
         # when : 퀴즈 응시 API 호출
         url = reverse("quiz-attempt")
-        response = api_client.post(url, data=request_data)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(url, data={"quiz_id": quiz_id})
 
         # then : 퀴즈 응시 내역 확인 (quiz_attempt)
         response_data = response.json()
         assert response.status_code == status.HTTP_201_CREATED
         assert response_data["attempt_question_count"] == len(question_ids)
 
-        # then : 퀴즈 출제 문제 순서 저장 확인 (quiz_attempt_question)
+        # then : 조회한 문제 목록 순서대로 출제 문제 저장 (quiz_attempt_question)
         attempt = QuizAttempt.objects.get(user=user, quiz_id=quiz_id)
         saved_questions = attempt.questions.all().order_by("order_index")
-        sorted_saved_questions = sorted(saved_questions, key=lambda x: x.order_index)
-        assert sorted_saved_questions[2].question_id == question_ids[1]
+        assert [aq.question_id for aq in saved_questions] == question_ids
+
+        # then : 퀴즈 조회 + 응시 저장 + 출제 문제 일괄 저장
+        insert_queries = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(insert_queries) == 2
+
+    def test_quiz_attempt_with_stale_question_pool(
+        self, api_client, user_data, quiz_data, question_data, quiz_question_data
+    ):
+        """캐시된 문제 풀에 삭제된 문제가 남아 있어도 연결된 문제로 응시"""
+
+        # given : 문제 4개 연결된 퀴즈3 (3문제 출제), 문제 풀 캐시
+        quiz = quiz_data["quiz3"]
+        QuizQuestionFactory.create(quiz=quiz, question=QuestionFactory.create())
+        user = User.objects.get(username="user1")
+        api_client.force_authenticate(user=user)
+        list_url = reverse("quiz-question", kwargs={"quiz_id": quiz.id})
+        drawn_ids = [item["id"] for item in api_client.get(list_url).json()["results"]]
+
+        # given : 출제될 문제 1개 삭제 (문제 풀 무효화 없이)
+        Question.objects.filter(id=drawn_ids[0]).delete()
+
+        # when : 퀴즈 응시 API 호출
+        response = api_client.post(reverse("quiz-attempt"), data={"quiz_id": quiz.id})
+
+        # then : 남은 연결 문제로 응시 생성
+        assert response.status_code == status.HTTP_201_CREATED
+        attempt = QuizAttempt.objects.get(user=user, quiz=quiz)
+        saved_ids = list(attempt.questions.values_list("question_id", flat=True))
+        assert len(saved_ids) == 3
+        assert drawn_ids[0] not in saved_ids
 
     def test_already_attempted_quiz(
-        self, api_client, user_data, quiz_data, question_data, quiz_attempt_data
+        self, api_client, user_data, quiz_data, quiz_question_data, quiz_attempt_data
     ):
-        """응시 이력 있는 퀴즈 재응시 테스트"""
+        """제출 전 응시 이력 있는 퀴즈 재응시 테스트"""
 
         # given : 일반 유저 토큰 세팅
         user = User.objects.get(username="user2")
         api_client.force_authenticate(user=user)
 
-        # given : request.data 세팅 (퀴즈 및 문제 데이터)
-        quiz_id = quiz_data["quiz3"].id
-        question_ids = [
-            question_data["question2"].id,
-            question_data["question3"].id,
-            question_data["question1"].id,
-        ]
-        request_data = {
-            "quiz_id": quiz_id,
-            "question_ids": question_ids,
-        }
+        # when : 퀴즈 응시 API 호출
+        url = reverse("quiz-attempt")
+        response = api_client.post(url, data={"quiz_id": quiz_data["quiz3"].id})
+
+        # then : 기존 응시 반환
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == quiz_attempt_data["attempt1"].id
+        assert QuizAttempt.objects.filter(user=user).count() == 1
+
+    def test_already_submitted_quiz(
+        self, api_client, user_data, quiz_data, quiz_question_data, quiz_attempt_data
+    ):
+        """제출 완료한 퀴즈 재응시 테스트"""
+
+        # given : 일반 유저 토큰 세팅 및 제출 완료된 응시
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+        attempt = quiz_attempt_data["attempt1"]
+        attempt.submitted_at = timezone.now()
+        attempt.save()
 
         # when : 퀴즈 응시 API 호출
         url = reverse("quiz-attempt")
-        response = api_client.post(url, data=request_data)
+        response = api_client.post(url, data={"quiz_id": quiz_data["quiz3"].id})
 
         # then : 재응시 불가
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -155,6 +214,215 @@ class TestAttemptQuestionWithChoice:
         assert response_data["is_ordered"] is True
         assert actual_order == expected_order
 
+    def test_attempt_question_detail_from_snapshot_cache(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """응시 문제 상세 조회 : 스냅샷 캐시 사용 및 선택지 순서 저장 시 무효화"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 응시 문제 상세 조회로 스냅샷 캐시 생성
+        quiz_id = quiz_data["quiz3"].id
+        question_id = quiz_attempt_question_data["attempt1_question3"].question.id
+        url = reverse("quiz-attempt-question", kwargs={"question_id": question_id})
+        api_client.get(url, {"quiz_id": quiz_id})
+
+        # when : 같은 응시의 다른 문제 상세 조회
+        other_question_id = quiz_attempt_question_data["attempt1_question2"].question.id
+        other_url = reverse(
+            "quiz-attempt-question", kwargs={"question_id": other_question_id}
+        )
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(other_url, {"quiz_id": quiz_id})
+
+        # then : DB 조회 없이 응답
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries) == 0
+
+        # when : 선택지 순서 저장 후 다시 조회
+        choice_ids = [
+            choice_data["choice7"].id,
+            choice_data["choice9"].id,
+            choice_data["choice6"].id,
+            choice_data["choice8"].id,
+        ]
+        api_client.post(
+            reverse("attempt-choice"),
+            data={
+                "quiz_id": quiz_id,
+                "question_id": question_id,
+                "choice_ids": choice_ids,
+            },
+        )
+        response = api_client.get(url, {"quiz_id": quiz_id})
+
+        # then : 저장된 선택지 순서로 응답
+        response_data = response.json()
+        assert response_data["is_ordered"] is True
+        assert [choice["id"] for choice in response_data["choices"]] == choice_ids
+
+    def test_attempt_question_detail_not_attempted(
+        self, api_client, user_data, quiz_data, question_data, quiz_question_data
+    ):
+        """응시하지 않은 퀴즈의 문제 상세 조회"""
+
+        # given : 응시 이력 없는 유저 토큰 세팅
+        user = User.objects.get(username="user1")
+        api_client.force_authenticate(user=user)
+
+        # when : 응시 문제 상세 조회 API 호출
+        question_id = question_data["question1"].id
+        url = reverse("quiz-attempt-question", kwargs={"question_id": question_id})
+        response = api_client.get(url, {"quiz_id": quiz_data["quiz3"].id})
+
+        # then : 조회 불가
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestAttemptSheet:
+    def test_attempt_sheet(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """응시 전체 조회 : 문제 순서, 선택지 순서, 선택한 선택지"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # when : 응시 전체 조회 API 호출
+        url = reverse("quiz-attempt-sheet")
+        response = api_client.get(url, {"quiz_id": quiz_data["quiz3"].id})
+
+        # then : 저장된 문제 순서로 조회
+        response_data = response.json()
+        questions = response_data["questions"]
+        assert response.status_code == status.HTTP_200_OK
+        assert [q["order_index"] for q in questions] == [1, 2, 3]
+
+        # then : 저장된 선택지 순서 및 선택한 선택지
+        assert [c["id"] for c in questions[0]["choices"]] == [
+            choice_data["choice5"].id,
+            choice_data["choice4"].id,
+        ]
+        assert questions[0]["selected_choice_id"] == choice_data["choice5"].id
+        assert questions[1]["selected_choice_id"] is None
+
+        # then : 선택지 순서 없던 문제는 조회 시점 순서로 저장
+        stored_order = list(
+            QuizAttemptChoice.objects.filter(
+                attempt_question=quiz_attempt_question_data["attempt1_question3"]
+            )
+            .order_by("order_index")
+            .values_list("choice_id", flat=True)
+        )
+        assert stored_order == [c["id"] for c in questions[2]["choices"]]
+
+    def test_attempt_sheet_keeps_concurrently_saved_order(
+        self,
+        monkeypatch,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """응시 전체 조회 동시 요청 : 먼저 저장된 선택지 순서를 덮어쓰지 않고 따름"""
+
+        # given : 선택지 순서 저장 전 응시 문제 목록 (늦은 요청이 읽은 상태)
+        attempt = quiz_attempt_data["attempt1"]
+        attempt.is_random_choice = True
+        stale_questions = list(snapshots.attempt_questions_with_choices(attempt))
+
+        # given : 먼저 끝난 요청이 선택지 순서 저장 (섞지 않은 순서)
+        monkeypatch.setattr(snapshots.random, "shuffle", lambda choices: None)
+        first = snapshots.build_attempt_sheet(attempt)
+
+        # when : 늦은 요청이 다른 순서(역순)로 저장 시도
+        monkeypatch.setattr(
+            snapshots, "attempt_questions_with_choices", lambda _: stale_questions
+        )
+        monkeypatch.setattr(
+            snapshots.random, "shuffle", lambda choices: choices.reverse()
+        )
+        second = snapshots.build_attempt_sheet(attempt)
+
+        # then : 두 응답과 저장된 순서 모두 먼저 저장된 순서
+        attempt_question = quiz_attempt_question_data["attempt1_question3"]
+        stored_order = list(
+            QuizAttemptChoice.objects.filter(attempt_question=attempt_question)
+            .order_by("order_index")
+            .values_list("choice_id", flat=True)
+        )
+        first_order = [c["id"] for c in first["questions"][2]["choices"]]
+        second_order = [c["id"] for c in second["questions"][2]["choices"]]
+        assert len(stored_order) > 1
+        assert first_order == second_order == stored_order
+
+    @pytest.mark.parametrize("quiz_id", ["abc", "²", "①"])
+    def test_attempt_sheet_invalid_quiz_id(self, api_client, user_data, quiz_id):
+        """응시 전체 조회 : 숫자가 아닌 quiz_id (유니코드 숫자 포함) 는 400"""
+
+        # given : 일반 유저 토큰 세팅
+        api_client.force_authenticate(user=user_data["user1"])
+
+        # when : 숫자가 아닌 quiz_id 로 조회
+        response = api_client.get(reverse("quiz-attempt-sheet"), {"quiz_id": quiz_id})
+
+        # then : 400
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_attempt_sheet_query_count(
+        self, api_client, user_data, quiz_data, quiz_attempt_data
+    ):
+        """응시 전체 조회 : 문제 수와 관계없이 일정한 쿼리 수"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 선택지 4개씩 있는 문제 20개 출제
+        for idx in range(20):
+            attempt_question = QuizAttemptQuestionFactory.create(
+                attempt=quiz_attempt_data["attempt1"], order_index=idx + 1
+            )
+            ChoiceFactory.create_batch(4, question=attempt_question.question)
+
+        # when : 응시 전체 조회 API 호출 (문제 내용 캐시 X / O)
+        url = reverse("quiz-attempt-sheet")
+        with CaptureQueriesContext(connection) as cold_queries:
+            response = api_client.get(url, {"quiz_id": quiz_data["quiz3"].id})
+        with CaptureQueriesContext(connection) as warm_queries:
+            api_client.get(url, {"quiz_id": quiz_data["quiz3"].id})
+
+        # then : 전체 문제 조회 및 쿼리 수 확인 (캐시 적재 후 문제 / 선택지 조회 X)
+        #   - 첫 조회 : 선택지 순서 저장 (응시 행 잠금, 저장된 순서 재조회, INSERT)
+        cold_statements = [
+            query["sql"]
+            for query in cold_queries.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+        ]
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["questions"]) == 20
+        assert len(cold_statements) <= 8
+        assert len(warm_queries) <= 3
+        assert not any(
+            'FROM "question' in query["sql"] for query in warm_queries.captured_queries
+        )
+
 
 @pytest.mark.django_db
 class TestAttemptChoice:
@@ -291,6 +559,236 @@ class TestAttemptChoice:
         assert previous_selected_choice.is_selected is True
         assert new_selected_choice.is_selected is False
 
+    def test_selected_choice_query_count(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """고른 선택지 변경 : 응시 행 잠금 후 UPDATE 만 실행"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 기존 선택(choice5) -> choice4 로 변경
+        request_data = {
+            "quiz_id": quiz_data["quiz3"].id,
+            "question_id": quiz_attempt_question_data["attempt1_question2"].question.id,
+            "selected_choice_id": choice_data["choice4"].id,
+        }
+
+        # when : 고른 선택지 저장 API 호출
+        url = reverse("attempt-choice")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.put(url, data=request_data)
+
+        # then : 응시 행 잠금 1번 후 응시 문제/선택지 행 UPDATE 각 1번, 선택한 선택지 1개
+        attempt_question = quiz_attempt_question_data["attempt1_question2"]
+        attempt_question.refresh_from_db()
+        selected = QuizAttemptChoice.objects.filter(
+            attempt_question=attempt_question, is_selected=True
+        )
+        statements = [
+            q["sql"]
+            for q in queries
+            if not q["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+        ]
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 3
+        assert 'FROM "quiz_attempt"' in statements[0]
+        assert "FOR UPDATE" in statements[0]
+        assert all(sql.startswith("UPDATE") for sql in statements[1:])
+        assert attempt_question.selected_choice_id == choice_data["choice4"].id
+        assert [c.choice_id for c in selected] == [choice_data["choice4"].id]
+
+    def test_selected_choice_after_submission(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """제출된 퀴즈는 고른 선택지 변경 불가"""
+
+        # given : 일반 유저 토큰 세팅 및 퀴즈 제출
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+        QuizAttempt.objects.filter(id=quiz_attempt_data["attempt1"].id).update(
+            submitted_at=timezone.now()
+        )
+
+        # when : 고른 선택지 저장 API 호출
+        request_data = {
+            "quiz_id": quiz_data["quiz3"].id,
+            "question_id": quiz_attempt_question_data["attempt1_question2"].question.id,
+            "selected_choice_id": choice_data["choice4"].id,
+        }
+        response = api_client.put(reverse("attempt-choice"), data=request_data)
+
+        # then : 400 에러, 기존 선택 유지
+        stored_choice = QuizAttemptChoice.objects.get(
+            attempt_question=quiz_attempt_question_data["attempt1_question2"],
+            choice=choice_data["choice5"],
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert stored_choice.is_selected is True
+
+    def test_selected_choice_not_in_question(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """다른 문제의 선택지는 선택 불가 : 기존 선택 유지"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # when : 문제2 에 문제1 의 선택지로 저장 요청
+        request_data = {
+            "quiz_id": quiz_data["quiz3"].id,
+            "question_id": quiz_attempt_question_data["attempt1_question2"].question.id,
+            "selected_choice_id": choice_data["choice2"].id,
+        }
+        response = api_client.put(reverse("attempt-choice"), data=request_data)
+
+        # then : 400 에러, 기존 선택 유지
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert QuizAttemptChoice.objects.get(
+            attempt_question=quiz_attempt_question_data["attempt1_question2"],
+            choice=choice_data["choice5"],
+        ).is_selected
+
+    def test_single_selected_choice_constraint(
+        self, quiz_attempt_question_data, quiz_attempt_choice_data
+    ):
+        """응시 문제당 선택한 선택지는 최대 1개"""
+
+        # given : 선택한 선택지가 있는 응시 문제
+        attempt_question = quiz_attempt_question_data["attempt1_question2"]
+
+        # when & then : 다른 선택지를 추가로 선택하면 제약 위반
+        with pytest.raises(IntegrityError), transaction.atomic():
+            attempt_question.choices.filter(is_selected=False).update(is_selected=True)
+
+    def test_save_answers(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """고른 선택지 일괄 저장 : 바뀐 선택지만 저장 후 응시 전체 반환"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 문제1 새로 선택, 문제2 선택 변경(choice5 -> choice4)
+        question1_id = quiz_attempt_question_data["attempt1_question1"].question_id
+        question2_id = quiz_attempt_question_data["attempt1_question2"].question_id
+        request_data = {
+            "quiz_id": quiz_data["quiz3"].id,
+            "answers": {
+                question1_id: choice_data["choice2"].id,
+                question2_id: choice_data["choice4"].id,
+            },
+        }
+
+        # when : 고른 선택지 일괄 저장 API 호출
+        url = reverse("attempt-answers")
+        response = api_client.put(url, data=request_data, format="json")
+
+        # then : 응시 전체 조회 결과에 선택한 선택지 반영
+        selected = {
+            question["id"]: question["selected_choice_id"]
+            for question in response.json()["questions"]
+        }
+        assert response.status_code == status.HTTP_200_OK
+        assert selected[question1_id] == choice_data["choice2"].id
+        assert selected[question2_id] == choice_data["choice4"].id
+        assert not QuizAttemptChoice.objects.get(
+            attempt_question=quiz_attempt_question_data["attempt1_question2"],
+            choice=choice_data["choice5"],
+        ).is_selected
+
+    def test_save_answers_with_invalid_choice(
+        self,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """다른 문제의 선택지가 포함되면 전체 저장 취소"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 문제1 정상 선택, 문제2 에 문제1 선택지 지정
+        question1_id = quiz_attempt_question_data["attempt1_question1"].question_id
+        question2_id = quiz_attempt_question_data["attempt1_question2"].question_id
+        request_data = {
+            "quiz_id": quiz_data["quiz3"].id,
+            "answers": {
+                question1_id: choice_data["choice2"].id,
+                question2_id: choice_data["choice1"].id,
+            },
+        }
+
+        # when : 고른 선택지 일괄 저장 API 호출
+        url = reverse("attempt-answers")
+        response = api_client.put(url, data=request_data, format="json")
+
+        # then : 400 에러, 잘못된 문제 표시, 저장된 선택 없음
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.json()["answers"]) == [str(question2_id)]
+        assert not QuizAttemptChoice.objects.filter(
+            attempt_question=quiz_attempt_question_data["attempt1_question1"],
+            is_selected=True,
+        ).exists()
+
+    def test_save_answers_with_non_ascii_question_id(
+        self, api_client, user_data, quiz_data, choice_data
+    ):
+        """문제 id 가 ASCII 숫자가 아니면 400"""
+
+        # given : 일반 유저 토큰 세팅
+        api_client.force_authenticate(user=user_data["user2"])
+
+        # when : 유니코드 숫자('²') 문제 id 로 저장
+        response = api_client.put(
+            reverse("attempt-answers"),
+            data={
+                "quiz_id": quiz_data["quiz3"].id,
+                "answers": {"²": choice_data["choice1"].id},
+            },
+            format="json",
+        )
+
+        # then : 400 에러
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "answers" in response.json()
+
     def test_quiz_submission(
         self,
         api_client,
@@ -326,3 +824,450 @@ class TestAttemptChoice:
             attempt=quiz_attempt_data["attempt1"], question=question_data["question2"]
         )
         assert corrected_question.is_correct is True
+
+
+@pytest.mark.django_db
+class TestSeededOrder:
+    @pytest.fixture
+    def seeded_attempt(
+        self,
+        settings,
+        api_client,
+        user_data,
+        quiz_data,
+        choice_data,
+        quiz_question_data,
+    ):
+        """seed 기반 선택지 순서 모드로 퀴즈3 응시"""
+        settings.ATTEMPT_SEEDED_ORDER = True
+        user = User.objects.get(username="user1")
+        api_client.force_authenticate(user=user)
+
+        api_client.post(
+            reverse("quiz-attempt"), data={"quiz_id": quiz_data["quiz3"].id}
+        )
+        return QuizAttempt.objects.get(user=user, quiz=quiz_data["quiz3"])
+
+    def test_seeded_choice_order_without_writes(
+        self, api_client, quiz_data, question_data, seeded_attempt
+    ):
+        """선택지 순서 : 조회할 때마다 같은 순서, 선택지 행 저장 X"""
+
+        # given : seed 기반 응시
+        assert seeded_attempt.is_seeded_order is True
+
+        # when : 같은 문제 두 번 조회 (캐시 삭제 후 재조회)
+        question_id = question_data["question3"].id
+        url = reverse("quiz-attempt-question", kwargs={"question_id": question_id})
+        first = api_client.get(f"{url}?quiz_id={quiz_data['quiz3'].id}").json()
+        caches["attempt_snapshot"].clear()
+        second = api_client.get(f"{url}?quiz_id={quiz_data['quiz3'].id}").json()
+
+        # when : 응시 전체 조회
+        sheet_url = reverse("quiz-attempt-sheet")
+        sheet = api_client.get(f"{sheet_url}?quiz_id={quiz_data['quiz3'].id}").json()
+
+        # then : 순서 확정, 같은 순서, 선택지 행 저장 X
+        sheet_question = next(q for q in sheet["questions"] if q["id"] == question_id)
+        assert first["is_ordered"] is True
+        assert first["choices"] == second["choices"] == sheet_question["choices"]
+        assert not QuizAttemptChoice.objects.filter(
+            attempt_question__attempt=seeded_attempt
+        ).exists()
+
+    def test_seeded_order_after_quiz_and_choice_changes(
+        self, api_client, quiz_data, question_data, seeded_attempt
+    ):
+        """seed 기반 응시 : 응시 후 퀴즈 설정 / 선택지 변경에도 기존 선택지 순서 유지"""
+
+        # given : 응시 시점 선택지 랜덤 배치 여부 저장, 문제3 선택지 순서 조회
+        assert seeded_attempt.is_random_choice is True
+        question = question_data["question3"]
+        url = reverse("quiz-attempt-question", kwargs={"question_id": question.id})
+        first = api_client.get(f"{url}?quiz_id={quiz_data['quiz3'].id}").json()
+
+        # when : 퀴즈 선택지 랜덤 배치 해제, 문제3 에 선택지 추가 후 재조회
+        Quiz.objects.filter(id=quiz_data["quiz3"].id).update(is_random_choice=False)
+        new_choice = ChoiceFactory.create(question=question)
+        question.save()
+        bump_question_version(question)
+        second = api_client.get(f"{url}?quiz_id={quiz_data['quiz3'].id}").json()
+
+        # then : 새 선택지 포함, 기존 선택지끼리의 순서는 그대로
+        first_ids = [choice["id"] for choice in first["choices"]]
+        second_ids = [choice["id"] for choice in second["choices"]]
+        assert new_choice.id in second_ids
+        assert [cid for cid in second_ids if cid != new_choice.id] == first_ids
+
+    def test_seeded_selection_and_grading(
+        self, api_client, quiz_data, question_data, choice_data, seeded_attempt
+    ):
+        """seed 기반 응시 : 선택한 선택지만 저장, 채점"""
+
+        # when : 문제1 오답 선택 후 정답으로 변경, 문제2 일괄 저장으로 정답 선택
+        quiz_id = quiz_data["quiz3"].id
+        for choice in ("choice2", "choice1"):
+            response = api_client.put(
+                reverse("attempt-choice"),
+                data={
+                    "quiz_id": quiz_id,
+                    "question_id": question_data["question1"].id,
+                    "selected_choice_id": choice_data[choice].id,
+                },
+            )
+            assert response.status_code == status.HTTP_200_OK
+        response = api_client.put(
+            reverse("attempt-answers"),
+            data={
+                "quiz_id": quiz_id,
+                "answers": {question_data["question2"].id: choice_data["choice5"].id},
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        # when : 퀴즈 제출
+        url = reverse("quiz-submission")
+        response = api_client.put(f"{url}?quiz_id={quiz_id}")
+
+        # then : 응시 문제에 선택한 선택지만 저장 (선택지 행 X), 2문제 정답
+        selected = dict(
+            seeded_attempt.questions.values_list("question_id", "selected_choice_id")
+        )
+        assert selected == {
+            question_data["question1"].id: choice_data["choice1"].id,
+            question_data["question2"].id: choice_data["choice5"].id,
+            question_data["question3"].id: None,
+        }
+        assert not QuizAttemptChoice.objects.filter(
+            attempt_question__attempt=seeded_attempt
+        ).exists()
+        assert response.json()["correct_count"] == 2
+
+
+@pytest.mark.django_db
+class TestAsyncAttemptFlow:
+    def test_async_attempt_flow(
+        self,
+        settings,
+        client,
+        user_data,
+        quiz_data,
+        question_data,
+        choice_data,
+        quiz_question_data,
+    ):
+        """async view : 응시 시작 -> 문제 조회 -> 선택지 저장 -> 제출"""
+
+        # given : JWT 토큰 헤더, seed 기반 선택지 순서
+        settings.ATTEMPT_SEEDED_ORDER = True
+        user = User.objects.get(username="user1")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+        quiz_id = quiz_data["quiz3"].id
+        question_id = question_data["question2"].id
+
+        # when : 응시 시작
+        response = client.post(
+            reverse("async-quiz-attempt"),
+            data={"quiz_id": quiz_id},
+            content_type="application/json",
+            **headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # when : 문제 조회
+        url = reverse(
+            "async-quiz-attempt-question", kwargs={"question_id": question_id}
+        )
+        response = client.get(f"{url}?quiz_id={quiz_id}", **headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_ordered"] is True
+
+        # when : 정답 선택
+        response = client.put(
+            reverse("async-attempt-choice"),
+            data={
+                "quiz_id": quiz_id,
+                "question_id": question_id,
+                "selected_choice_id": choice_data["choice5"].id,
+            },
+            content_type="application/json",
+            **headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        # when : 제출
+        url = reverse("async-quiz-submission")
+        response = client.put(f"{url}?quiz_id={quiz_id}", **headers)
+
+        # then : 1문제 정답, 재제출 불가
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["correct_count"] == 1
+        response = client.put(f"{url}?quiz_id={quiz_id}", **headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_async_view_requires_authentication(self, client, quiz_data):
+        """async view : 토큰 없으면 401"""
+
+        # when : 토큰 없이 응시 시작
+        response = client.post(
+            reverse("async-quiz-attempt"),
+            data={"quiz_id": quiz_data["quiz3"].id},
+            content_type="application/json",
+        )
+
+        # then : 401 에러
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize("url_name", ["quiz-submission", "async-quiz-submission"])
+    def test_submission_rejects_unicode_digit_quiz_id(
+        self, client, user_data, url_name
+    ):
+        """제출 : 유니코드 숫자('①') quiz_id 는 500 이 아닌 400"""
+
+        # given : JWT 토큰 헤더
+        user = User.objects.get(username="user1")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+        # when : 제출
+        response = client.put(f"{reverse(url_name)}?quiz_id=①", **headers)
+
+        # then : 400 에러
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_async_view_rejects_revoked_token(
+        self, monkeypatch, client, user_data, quiz_data
+    ):
+        """async view : 비밀번호 변경으로 폐기된 토큰은 DRF view 와 같이 401"""
+
+        # given : 토큰 폐기 확인 설정, 토큰 발급 후 비밀번호 변경
+        monkeypatch.setattr(jwt_settings, "CHECK_REVOKE_TOKEN", True)
+        user = User.objects.get(username="user1")
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+        user.set_password("changed-password")
+        user.save()
+
+        # when : 이전 토큰으로 응시 시작
+        response = client.post(
+            reverse("async-quiz-attempt"),
+            data={"quiz_id": quiz_data["quiz3"].id},
+            content_type="application/json",
+            **headers,
+        )
+
+        # then : 401 에러
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["code"] == "password_changed"
+
+
+@pytest.mark.django_db
+class TestGrading:
+    def test_quiz_submission_query_count(
+        self, api_client, user_data, quiz_data, quiz_attempt_data
+    ):
+        """퀴즈 제출 : 문제 수와 관계없이 일정한 쿼리 수로 채점"""
+
+        # given : 일반 유저 토큰 세팅
+        user = User.objects.get(username="user2")
+        api_client.force_authenticate(user=user)
+
+        # given : 20문제 모두 정답 선택
+        attempt = quiz_attempt_data["attempt1"]
+        for idx in range(20):
+            attempt_question = QuizAttemptQuestionFactory.create(
+                attempt=attempt, order_index=idx + 1
+            )
+            choice = ChoiceFactory.create(
+                question=attempt_question.question, is_correct=True
+            )
+            attempt_question.selected_choice = choice
+            attempt_question.save()
+            QuizAttemptChoiceFactory.create(
+                attempt_question=attempt_question,
+                choice=choice,
+                order_index=1,
+                is_selected=True,
+            )
+
+        # given : 풀이 중 조회한 문제 내용 캐시 (정답 포함)
+        get_question_contents(attempt.questions.values_list("question_id", flat=True))
+
+        # when : 퀴즈 제출 API 호출
+        url = reverse("quiz-submission")
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.put(f"{url}?quiz_id={quiz_data['quiz3'].id}")
+
+        # then : 채점 결과 및 쿼리 수 확인 (응시 행 잠금 포함, 정답 조회 X)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["correct_count"] == 20
+        assert len(queries) <= 7
+        assert not any(
+            'FROM "question_choice"' in query["sql"]
+            for query in queries.captured_queries
+        )
+
+    def test_submission_checks_submitted_at_under_lock(
+        self, quiz_data, quiz_attempt_data, quiz_attempt_question_data
+    ):
+        """제출 : 응시 행을 잠근 뒤 제출 여부 확인 (조회 후 다른 요청이 먼저 제출한 경우)"""
+
+        # given : 제출 전 조회한 응시, 이후 다른 요청이 먼저 제출
+        attempt = QuizAttempt.objects.get(id=quiz_attempt_data["attempt1"].id)
+        QuizAttempt.objects.filter(id=attempt.id).update(
+            correct_count=1, submitted_at=timezone.now()
+        )
+
+        # when : 조회해 둔 응시로 제출 처리
+        serializer = QuizSubmissionSerializer(attempt, data={})
+        serializer.is_valid(raise_exception=True)
+        with pytest.raises(ValidationError):
+            serializer.save()
+
+        # then : 다시 채점하지 않음
+        attempt.refresh_from_db()
+        assert attempt.correct_count == 1
+
+    def test_submission_locks_attempt_before_grading(
+        self, quiz_data, quiz_attempt_data, quiz_attempt_question_data
+    ):
+        """제출 : 채점 전에 응시 행 잠금 (답안 일괄 저장과 같은 잠금)"""
+
+        # given : 제출 전 응시
+        attempt = quiz_attempt_data["attempt1"]
+
+        # when : 제출 처리
+        serializer = QuizSubmissionSerializer(attempt, data={})
+        serializer.is_valid(raise_exception=True)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+
+        # then : (SAVEPOINT 제외) 첫 쿼리가 응시 행 잠금
+        first_sql = next(
+            query["sql"]
+            for query in queries.captured_queries
+            if not query["sql"].startswith("SAVEPOINT")
+        )
+        assert 'FROM "quiz_attempt"' in first_sql
+        assert "FOR UPDATE" in first_sql
+
+    def test_regrade_attempts(
+        self,
+        quiz_data,
+        choice_data,
+        quiz_attempt_data,
+        quiz_attempt_question_data,
+        quiz_attempt_choice_data,
+    ):
+        """정답 변경 후 제출된 응시 재채점"""
+
+        # given : 제출된 응시 (1문제 정답)
+        attempt = quiz_attempt_data["attempt1"]
+        attempt.correct_count = 1
+        attempt.submitted_at = timezone.now()
+        attempt.save()
+
+        # given : 문제2 정답을 다른 선택지로 변경
+        Choice.objects.filter(id=choice_data["choice5"].id).update(is_correct=False)
+        Choice.objects.filter(id=choice_data["choice4"].id).update(is_correct=True)
+
+        # when : 재채점
+        regraded_count = regrade_attempts(QuizAttempt.objects.all())
+
+        # then : 맞은 문제 개수 및 문제별 정답 여부 갱신
+        attempt.refresh_from_db()
+        attempt_question = quiz_attempt_question_data["attempt1_question2"]
+        attempt_question.refresh_from_db()
+        assert regraded_count == 1
+        assert attempt.correct_count == 0
+        assert attempt_question.is_correct is False
+
+    def test_backfill_selected_choice(
+        self, choice_data, quiz_attempt_question_data, quiz_attempt_choice_data
+    ):
+        """선택지 행 기준으로 응시 문제의 선택한 선택지 채우기"""
+
+        # given : 선택한 선택지가 비어 있는 기존 응시 문제
+        QuizAttemptQuestion.objects.update(selected_choice=None)
+
+        # when : backfill 명령 실행
+        call_command("backfill_selected_choice", batch_size=1, stdout=StringIO())
+
+        # then : 선택한 선택지가 있는 문제만 채움
+        selected = {
+            aq.id: aq.selected_choice_id for aq in QuizAttemptQuestion.objects.all()
+        }
+        assert selected[quiz_attempt_question_data["attempt1_question2"].id] == (
+            choice_data["choice5"].id
+        )
+        assert selected[quiz_attempt_question_data["attempt1_question1"].id] is None
+
+    def test_backfill_selected_choice_migration(
+        self, choice_data, quiz_attempt_question_data, quiz_attempt_choice_data
+    ):
+        """0009 마이그레이션 : 배포 시 기존 응시의 선택한 선택지 채움 (채점 기준 컬럼)"""
+
+        # given : 선택한 선택지가 비어 있는 기존 응시 문제 (선택지 행만 is_selected)
+        QuizAttemptQuestion.objects.update(selected_choice=None)
+        migration = importlib.import_module(
+            "quiz_attempt.migrations.0009_backfill_selected_choice"
+        )
+
+        # when : 마이그레이션 데이터 변경 실행
+        migration.backfill_selected_choice(apps, None)
+
+        # then : 선택지 행 기준으로 채움
+        attempt_question = quiz_attempt_question_data["attempt1_question2"]
+        attempt_question.refresh_from_db()
+        assert attempt_question.selected_choice_id == choice_data["choice5"].id
+
+
+@pytest.mark.django_db
+class TestAttemptCode:
+    def test_encode_attempt_code_is_unique(self):
+        """순번이 다르면 응시 코드도 다름 (7자리)"""
+
+        # when : 연속된 순번 인코딩
+        codes = [encode_attempt_code(number) for number in range(1, 100_001)]
+
+        # then : 중복 없음, 모두 7자리
+        assert len(set(codes)) == len(codes)
+        assert {len(code) for code in codes} == {7}
+
+    def test_allocator_claims_sequence_in_blocks(self):
+        """block_size 개의 코드마다 시퀀스 조회 1번"""
+
+        # given : 블록 크기 10
+        allocator = AttemptCodeAllocator(block_size=10)
+
+        # when : 코드 25개 발급
+        with CaptureQueriesContext(connection) as queries:
+            codes = [allocator.next_code() for _ in range(25)]
+
+        # then : 중복 없음, 시퀀스 조회 3번
+        assert len(set(codes)) == 25
+        assert len(queries) == 3
+
+    def test_attempt_code_default(self, quiz_data, user_data):
+        """응시 코드 미지정 시 시퀀스 기반 코드 자동 발급"""
+
+        # when : 응시 코드 없이 퀴즈 응시 생성
+        user = user_data["user2"]
+        attempts = [
+            QuizAttempt.objects.create(quiz=quiz_data["quiz1"], user=user),
+            QuizAttempt.objects.create(quiz=quiz_data["quiz2"], user=user),
+        ]
+
+        # then : 서로 다른 7자리 코드
+        assert attempts[0].attempt_code != attempts[1].attempt_code
+        assert len(attempts[0].attempt_code) == 7
+
+    def test_attempt_code_not_issued_on_construction(self):
+        """bulk_update 용 객체 생성 시 응시 코드 발급(시퀀스 조회) X"""
+
+        # when : 저장하지 않는 응시 객체 생성
+        with CaptureQueriesContext(connection) as queries:
+            attempts = [QuizAttempt(id=i, correct_count=0) for i in range(1, 251)]
+
+        # then : 쿼리 없음, 응시 코드 비어 있음
+        assert len(queries) == 0
+        assert {attempt.attempt_code for attempt in attempts} == {""}